@@ -0,0 +1,164 @@
+import time
+
+# margem (ms) para o tique cair logo depois da virada do segundo, e não um pouco antes
+MARGEM_MS = 2
+
+
+def ms_ate_proximo_segundo(agora=None):
+    """Milissegundos até a próxima virada de segundo do relógio de parede."""
+    agora = time.time() if agora is None else agora
+    return int(1000 - (agora % 1) * 1000) + MARGEM_MS
+
+
+class Tique:
+    """Agendamento repetido criado por AgendadorTk.a_cada_segundo; use cancelar() para parar."""
+
+    def __init__(self, agendador, callback):
+        self.agendador = agendador
+        self.callback = callback
+        self.ativo = True
+        self._id_after = None
+        self._previsto = None
+
+    def cancelar(self):
+        self.ativo = False
+        self.agendador._cancelar_after(self._id_after)
+        self.agendador._tiques.discard(self)
+
+
+class AgendadorTk:
+    """
+    Agendador único, na thread principal, baseado no event loop do Tk.
+
+    Os tiques caem nas viradas de segundo do relógio de parede: cada espera é
+    recalculada a partir da hora atual, então atrasos não se acumulam (sem deriva)
+    e nenhum segundo é pulado ou repetido. Corrotinas asyncio também podem rodar
+    aqui, sem thread extra: um event loop asyncio é avançado pelo próprio Tk apenas
+    quando uma espera do agendador termina, então não há acordadas periódicas à toa.
+    Por isso as corrotinas devem esperar com dormir() e proximo_segundo() do
+    agendador, e não com asyncio.sleep().
+    """
+
+    def __init__(self, root, registro=None):
+        """
+        Args:
+            root (tk.Misc): Qualquer widget Tk; usado para os `after`.
+            registro (RegistroTiques | None): Registra o atraso e a duração de cada tique.
+        """
+        self.root = root
+        self.registro = registro
+        self._tiques = set()
+        self._afters = set()
+        self._tarefas = set()
+        self._loop_asyncio = None
+
+    @property
+    def _loop(self):
+        # criado (e o asyncio importado) só quando uma corrotina usa o agendador; quem
+        # só usa a_cada_segundo ou ms_ate_proximo_segundo não paga a importação
+        if self._loop_asyncio is None:
+            import asyncio
+
+            self._loop_asyncio = asyncio.new_event_loop()
+        return self._loop_asyncio
+
+    # agendamento com after
+
+    def _after(self, atraso_ms, funcao):
+        def executar():
+            self._afters.discard(id_after)
+            funcao()
+
+        id_after = self.root.after(max(0, atraso_ms), executar)
+        self._afters.add(id_after)
+        return id_after
+
+    def _cancelar_after(self, id_after):
+        if id_after in self._afters:
+            self._afters.discard(id_after)
+            self.root.after_cancel(id_after)
+
+    def a_cada_segundo(self, callback):
+        """
+        Chama `callback()` em cada virada de segundo.
+
+        Returns:
+            Tique: Use tique.cancelar() para parar.
+        """
+        tique = Tique(self, callback)
+        self._tiques.add(tique)
+
+        def disparar():
+            if not tique.ativo:
+                return
+            atraso_ms = ms_ate_proximo_segundo()
+            tique._id_after = self._after(atraso_ms, disparar)
+            previsto, tique._previsto = tique._previsto, time.perf_counter() + atraso_ms / 1000
+            if self.registro is not None and previsto is not None:
+                self.registro.medir(previsto, callback)
+            else:
+                callback()
+
+        disparar()
+        return tique
+
+    # integração com asyncio
+
+    def _avancar_loop(self):
+        # executa os callbacks prontos do loop asyncio (uma volta) e devolve o controle ao Tk
+        if not self._loop.is_closed():
+            self._loop.call_soon(self._loop.stop)
+            self._loop.run_forever()
+
+    def _futuro_em(self, atraso_ms):
+        futuro = self._loop.create_future()
+        previsto = time.perf_counter() + atraso_ms / 1000
+
+        def resolver():
+            if not futuro.done():
+                futuro.set_result(None)
+                # a duração registrada é a da corrotina até a próxima espera (o desenho)
+                if self.registro is not None:
+                    self.registro.medir(previsto, self._avancar_loop)
+                else:
+                    self._avancar_loop()
+
+        id_after = self._after(atraso_ms, resolver)
+        futuro.add_done_callback(lambda f: f.cancelled() and self._cancelar_after(id_after))
+        return futuro
+
+    def dormir(self, segundos):
+        """Aguardável que termina depois de `segundos`, contados pelo Tk."""
+        return self._futuro_em(int(segundos * 1000))
+
+    def proximo_segundo(self):
+        """Aguardável que termina na próxima virada de segundo."""
+        return self._futuro_em(ms_ate_proximo_segundo())
+
+    def executar(self, corrotina):
+        """
+        Executa a corrotina na thread principal, junto com o Tk.
+
+        Returns:
+            asyncio.Task: A tarefa; cancelada por parar().
+        """
+        tarefa = self._loop.create_task(corrotina)
+        self._tarefas.add(tarefa)
+        tarefa.add_done_callback(self._tarefas.discard)
+        self._avancar_loop()
+        return tarefa
+
+    def parar(self):
+        """Cancela todos os tiques, esperas e corrotinas deste agendador."""
+        for tique in list(self._tiques):
+            tique.cancelar()
+        for id_after in list(self._afters):
+            self._cancelar_after(id_after)
+        if self._loop_asyncio is None or self._loop.is_closed():
+            return
+        for tarefa in list(self._tarefas):
+            tarefa.cancel()
+        # deixa as corrotinas tratarem o cancelamento antes de fechar o loop
+        while self._tarefas:
+            self._avancar_loop()
+        self._loop.close()
@@ -0,0 +1,79 @@
+import argparse
+import json
+import time
+
+import metricas
+from busca import buscar_vagas
+from servidor_fixture import LATENCIA, POR_PAGINA, ServidorFixture
+from sessao import abrir_sessao
+
+TAMANHOS = (25, 100, 500, 1000, 5000)
+
+
+class _SaidaCronometrada:
+    """Saída que só anota quando chegaram as primeiras vagas e quantas chegaram."""
+
+    def __init__(self):
+        self.primeiro = None
+        self.linhas = 0
+
+    def escrever_lote(self, vagas):
+        if vagas and self.primeiro is None:
+            self.primeiro = time.perf_counter()
+        self.linhas += len(vagas)
+
+
+def medir(browser, servidor, tamanho, medidor):
+    """Executa uma busca de `tamanho` vagas no servidor local e retorna as medidas."""
+    servidor.total = tamanho
+    saida = _SaidaCronometrada()
+    comandos_antes = medidor.total_comandos
+    inicio = time.perf_counter()
+    buscar_vagas(browser, "benchmark", servidor.url_base, limite=0, saida=saida)
+    duracao = time.perf_counter() - inicio
+    return {
+        "vagas": saida.linhas,
+        "primeiro_resultado_s": round((saida.primeiro or inicio) - inicio, 3),
+        "tempo_total_s": round(duracao, 3),
+        "comandos_webdriver": medidor.total_comandos - comandos_antes,
+        "vagas_por_segundo": round(saida.linhas / duracao, 1) if duracao else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o desempenho da busca contra o servidor local.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS)
+    parser.add_argument("--por-pagina", type=int, default=POR_PAGINA)
+    parser.add_argument("--latencia", type=float, default=LATENCIA, help="atraso por resposta em segundos")
+    parser.add_argument("--janela", action="store_true", help="mostra o navegador em vez de usar headless")
+    parser.add_argument("--enxuto", action="store_true", help="usa o modo enxuto do navegador")
+    parser.add_argument("--json", help="grava os resultados neste arquivo")
+    args = parser.parse_args()
+
+    resultados = []
+    with ServidorFixture(por_pagina=args.por_pagina, latencia=args.latencia) as servidor:
+        browser = abrir_sessao(servidor.url_base, headless=not args.janela, sem_login=True,
+                               enxuto=args.enxuto)
+        medidor = metricas.ativar(metricas.Medidor("benchmark"))
+        medidor.instrumentar(browser)
+        try:
+            print(f"{'vagas':>6} {'1º result.':>10} {'total':>8} {'comandos':>9} {'vagas/s':>8}")
+            for tamanho in args.tamanhos:
+                medida = medir(browser, servidor, tamanho, medidor)
+                medida["tamanho"] = tamanho
+                resultados.append(medida)
+                print(f"{medida['vagas']:>6} {medida['primeiro_resultado_s']:>9.2f}s "
+                      f"{medida['tempo_total_s']:>7.2f}s {medida['comandos_webdriver']:>9} "
+                      f"{medida['vagas_por_segundo']:>8}")
+        finally:
+            browser.quit()
+    resumo = medidor.finalizar()
+    print("tempo por fase:", {fase: total["total_s"] for fase, total in resumo["fases"].items()})
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=2)
+
+
+if __name__ == "__main__":
+    main()
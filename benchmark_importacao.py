@@ -0,0 +1,109 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# módulo importado por cada ferramenta do lançador (ferramentas.py), mais o próprio lançador
+MODULOS = [
+    "ferramentas", "busca", "trabalhador", "servidor_fixture", "lista", "simple_flex_layout", "relogio",
+    "relogio_tkinter", "relogio_simples", "painel_relogios", "renderizador", "fontes_tabela",
+]
+# pacotes de terceiros e interfaces gráficas: o "próprio" tempo de uma ferramenta é o total sem eles
+FRAMEWORKS = {"selenium", "flet", "flet_core", "flet_runtime", "tkinter", "_tkinter", "turtle", "numpy",
+              "PIL", "openpyxl", "pyarrow"}
+LINHA = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def analisar(saida, modulo):
+    """
+    Lê a saída de `python -X importtime -c "import modulo"` (stderr).
+
+    Returns:
+        tuple[float, float, list]: Total e parte dos frameworks, em ms, e os
+            (ms acumulados, nome) das importações diretas do módulo, da mais cara à mais barata.
+    """
+    entradas = []
+    for linha in saida.splitlines():
+        casamento = LINHA.match(linha)
+        if casamento:
+            _, acumulado, recuo, nome = casamento.groups()
+            entradas.append((len(recuo) // 2, int(acumulado), nome))
+
+    # o importtime lista cada módulo depois dos que ele importou, com um nível de
+    # recuo a menos; as entradas do módulo vão da anterior de nível 0 até a dele
+    fim = max(i for i, (nivel, _, nome) in enumerate(entradas) if nivel == 0 and nome == modulo)
+    inicio = fim
+    while inicio > 0 and entradas[inicio - 1][0] > 0:
+        inicio -= 1
+
+    # percorrendo de trás para frente, a pilha guarda os ancestrais de cada entrada
+    frameworks = 0
+    diretos = []
+    pilha = []  # (nível, dentro de um framework)
+    for nivel, acumulado, nome in reversed(entradas[inicio:fim + 1]):
+        while pilha and pilha[-1][0] >= nivel:
+            pilha.pop()
+        dentro = bool(pilha) and pilha[-1][1]
+        eh_framework = nome.split(".")[0] in FRAMEWORKS
+        if eh_framework and not dentro:
+            frameworks += acumulado
+        if nivel == 1:
+            diretos.append((acumulado / 1000, nome))
+        pilha.append((nivel, dentro or eh_framework))
+    return entradas[fim][1] / 1000, frameworks / 1000, sorted(diretos, reverse=True)
+
+
+def medir(modulo, repeticoes=5):
+    """Importa `modulo` num interpretador novo `repeticoes` vezes e fica com a medida de menor total."""
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    melhor = None
+    for _ in range(repeticoes):
+        processo = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                                  cwd=pasta, capture_output=True, text=True)
+        if processo.returncode != 0:
+            erro = processo.stderr.strip().splitlines()[-1]
+            return {"modulo": modulo, "erro": erro}
+        total, frameworks, diretos = analisar(processo.stderr, modulo)
+        if melhor is None or total < melhor["total_ms"]:
+            melhor = {"modulo": modulo, "total_ms": total, "frameworks_ms": frameworks,
+                      "proprio_ms": total - frameworks, "diretos": diretos}
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de importação de cada ferramenta (python -X importtime).")
+    parser.add_argument("--modulos", nargs="+", default=MODULOS)
+    parser.add_argument("--repeticoes", type=int, default=5, help="interpretadores novos por módulo (fica o menor)")
+    parser.add_argument("--detalhes", type=int, default=0, metavar="N",
+                        help="mostra as N importações diretas mais caras de cada módulo")
+    parser.add_argument("--limite-ms", type=float,
+                        help="termina com erro se o tempo próprio (sem frameworks) de algum módulo passar disso")
+    args = parser.parse_args()
+
+    # importa uma vez antes, para que os .pyc já existam e não entrem na medida
+    for modulo in args.modulos:
+        subprocess.run([sys.executable, "-c", f"import {modulo}"], capture_output=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    acima = []
+    print(f"{'módulo':<20} {'total':>10} {'frameworks':>11} {'próprio':>10}")
+    for modulo in args.modulos:
+        medida = medir(modulo, args.repeticoes)
+        if "erro" in medida:
+            print(f"{modulo:<20} não importou: {medida['erro']}")
+            continue
+        print(f"{modulo:<20} {medida['total_ms']:>8.1f}ms {medida['frameworks_ms']:>9.1f}ms "
+              f"{medida['proprio_ms']:>8.1f}ms")
+        for ms, nome in medida["diretos"][:args.detalhes]:
+            print(f"{'':<22}{ms:>8.1f}ms  {nome}")
+        if args.limite_ms is not None and medida["proprio_ms"] > args.limite_ms:
+            acima.append(modulo)
+
+    if acima:
+        print(f"acima de {args.limite_ms:g}ms sem frameworks: {', '.join(acima)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
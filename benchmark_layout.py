@@ -0,0 +1,81 @@
+import argparse
+import random
+import time
+
+from flet import Column, NavigationRailDestination, Text, icons
+
+from simple_flex_layout import DesktopAppLayout
+
+
+class PaginaGravadora:
+    """Substitui a flet.Page: guarda as atualizações pedidas em vez de enviá-las a um cliente."""
+
+    def __init__(self, largura=1280, altura=720):
+        self.width = largura
+        self.height = altura
+        self.atualizacoes = []
+
+    def update(self, *controles):
+        self.atualizacoes.append(controles)
+
+
+def criar_layout(destinos):
+    paginas = [
+        (NavigationRailDestination(icon=icons.CIRCLE_OUTLINED, label=f"Página {i}"),
+         Column([Text(f"Página {i}"), Text("conteúdo " * 20)]))
+        for i in range(destinos)
+    ]
+    pagina = PaginaGravadora()
+    layout = DesktopAppLayout("Benchmark", pagina, paginas)
+    # visita todas as páginas uma vez, para que todas estejam na árvore de controles
+    for i in range(destinos):
+        layout.select_page(i)
+    pagina.atualizacoes.clear()
+    return layout, pagina
+
+
+def medir(destinos, trocas):
+    layout, pagina = criar_layout(destinos)
+    sorteio = random.Random(destinos)
+    sequencia = [sorteio.randrange(destinos) for _ in range(trocas)]
+
+    duracoes = []
+    for numero in sequencia:
+        inicio = time.perf_counter()
+        layout.navigation_rail.selected_index = numero
+        layout._navigation_change(None)
+        duracoes.append(time.perf_counter() - inicio)
+
+    # referência: percorrer todas as páginas reescrevendo `visible`, como antes
+    inicio = time.perf_counter()
+    for numero in sequencia:
+        for i, pagina_conteudo in enumerate(layout.content_area.controls):
+            pagina_conteudo.visible = numero == i
+    percorrer = (time.perf_counter() - inicio) / trocas
+
+    duracoes.sort()
+    controles = sum(len(atualizacao) for atualizacao in pagina.atualizacoes)
+    return {
+        "destinos": destinos,
+        "media_us": sum(duracoes) / trocas * 1e6,
+        "p99_us": duracoes[int(trocas * 0.99) - 1] * 1e6,
+        "percorrer_us": percorrer * 1e6,
+        "controles_por_troca": controles / max(len(pagina.atualizacoes), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latência da troca de página no DesktopAppLayout.")
+    parser.add_argument("--destinos", type=int, nargs="+", default=[3, 10, 50, 100, 500])
+    parser.add_argument("--trocas", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'destinos':>9} {'troca':>10} {'p99':>10} {'percorrer todas':>16} {'controles/atualização':>22}")
+    for destinos in args.destinos:
+        medida = medir(destinos, args.trocas)
+        print(f"{medida['destinos']:>9} {medida['media_us']:>8.1f}us {medida['p99_us']:>8.1f}us "
+              f"{medida['percorrer_us']:>14.1f}us {medida['controles_por_troca']:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
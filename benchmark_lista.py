@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import threading
+import time
+from collections import deque
+
+from lista_pipeline import INTERVALO_LOTE, TAMANHO_FILA, TAMANHO_LOTE, alimentar
+
+
+async def gerar_linhas(quantidade):
+    """Fonte o mais rápida possível; cede o loop a cada 1000 linhas, como uma fonte real de rede."""
+    for numero in range(quantidade):
+        if numero % 1000 == 0:
+            await asyncio.sleep(0)
+        yield f"linha {numero}"
+
+
+async def sessao(quantidade, max_linhas, tamanho_fila, tamanho_lote, intervalo):
+    """Uma sessão sem interface: os lotes vão para um buffer circular, como na ListaStreaming."""
+    linhas = deque(maxlen=max_linhas)
+    lotes = 0
+
+    def ao_lote(lote):
+        nonlocal lotes
+        linhas.extend(lote)
+        lotes += 1
+
+    await alimentar(gerar_linhas(quantidade), ao_lote, tamanho_fila, tamanho_lote, intervalo)
+    return lotes
+
+
+async def medir(sessoes, quantidade, max_linhas, tamanho_fila, tamanho_lote, intervalo):
+    inicio = time.perf_counter()
+    lotes = await asyncio.gather(*(
+        sessao(quantidade, max_linhas, tamanho_fila, tamanho_lote, intervalo) for _ in range(sessoes)
+    ))
+    duracao = time.perf_counter() - inicio
+    total = sessoes * quantidade
+    return {
+        "sessoes": sessoes,
+        "linhas": total,
+        "tempo_s": round(duracao, 3),
+        "linhas_por_segundo": round(total / duracao),
+        "lotes": sum(lotes),
+        "threads": threading.active_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão do pipeline assíncrono da lista, sem interface.")
+    parser.add_argument("--sessoes", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--linhas", type=int, default=200000, help="linhas por sessão")
+    parser.add_argument("--max-linhas", type=int, default=1000)
+    parser.add_argument("--tamanho-fila", type=int, default=TAMANHO_FILA)
+    parser.add_argument("--tamanho-lote", type=int, default=TAMANHO_LOTE)
+    parser.add_argument("--intervalo", type=float, default=INTERVALO_LOTE)
+    args = parser.parse_args()
+
+    print(f"{'sessões':>8} {'linhas':>10} {'tempo':>8} {'linhas/s':>11} {'lotes':>7} {'threads':>8}")
+    for sessoes in args.sessoes:
+        medida = asyncio.run(medir(sessoes, args.linhas, args.max_linhas, args.tamanho_fila,
+                                   args.tamanho_lote, args.intervalo))
+        print(f"{medida['sessoes']:>8} {medida['linhas']:>10} {medida['tempo_s']:>7.2f}s "
+              f"{medida['linhas_por_segundo']:>11} {medida['lotes']:>7} {medida['threads']:>8}")
+
+
+if __name__ == "__main__":
+    main()
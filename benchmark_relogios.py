@@ -0,0 +1,80 @@
+import argparse
+import time
+import tkinter as tk
+
+from geometria_relogio import carregar_numpy
+from painel_relogios import FUSOS_EXEMPLO, PainelRelogios
+
+
+class CanvasNulo:
+    """Canvas que só conta os comandos recebidos; mede o custo do tique sem o Tk."""
+
+    def __init__(self, tamanho=None):
+        self.comandos = 0
+        self._itens = 0
+
+    def _criar(self, *args, **kwargs):
+        self.comandos += 1
+        self._itens += 1
+        return self._itens
+
+    create_line = create_oval = create_text = create_image = _criar
+
+    def coords(self, item, *coordenadas):
+        self.comandos += 1
+
+    def _ignorar(self, *args, **kwargs):
+        pass
+
+    bind = delete = tag_raise = _ignorar
+
+
+def medir(quantidade, tiques, usar_tk):
+    fusos = [FUSOS_EXEMPLO[i % len(FUSOS_EXEMPLO)] for i in range(quantidade)]
+    root = None
+    if usar_tk:
+        root = tk.Tk()
+        root.withdraw()
+        painel = PainelRelogios(root, fusos, tamanho=60, colunas=40)
+    else:
+        painel = PainelRelogios(None, fusos, criar_canvas=CanvasNulo)
+    # um tique inicial para posicionar tudo; depois, um tique por segundo simulado
+    instante = time.time() // 60 * 60
+    painel.atualizar(instante)
+    duracoes = []
+    atualizados = 0
+    for passo in range(1, tiques + 1):
+        inicio = time.perf_counter()
+        atualizados += painel.atualizar(instante + passo)
+        if root is not None:
+            root.update_idletasks()
+        duracoes.append(time.perf_counter() - inicio)
+    if root is not None:
+        root.destroy()
+    duracoes.sort()
+    return {
+        "relogios": quantidade,
+        "media_ms": sum(duracoes) / len(duracoes) * 1000,
+        "p95_ms": duracoes[int(len(duracoes) * 0.95) - 1] * 1000,
+        "por_relogio_us": sum(duracoes) / len(duracoes) / quantidade * 1e6,
+        "atualizados": atualizados / tiques,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo por tique do painel de relógios.")
+    parser.add_argument("--relogios", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--tiques", type=int, default=120)
+    parser.add_argument("--tk", action="store_true", help="desenha num Tk de verdade (janela oculta)")
+    args = parser.parse_args()
+
+    print(f"cálculo: {'numpy' if carregar_numpy() is not None else 'python puro'}; canvas: {'tk' if args.tk else 'nulo'}")
+    print(f"{'relógios':>9} {'média':>10} {'p95':>10} {'por relógio':>12} {'atualizados':>12}")
+    for quantidade in args.relogios:
+        medida = medir(quantidade, args.tiques, args.tk)
+        print(f"{medida['relogios']:>9} {medida['media_ms']:>8.3f}ms {medida['p95_ms']:>8.3f}ms "
+              f"{medida['por_relogio_us']:>10.2f}us {medida['atualizados']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
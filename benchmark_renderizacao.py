@@ -0,0 +1,49 @@
+import argparse
+import time
+
+from geometria_relogio import angulos_lote, exigir_numpy
+from renderizador import Renderizador, png
+
+
+def medir(tamanho, quadros, nivel):
+    np = exigir_numpy()
+    instantes = time.time() + np.arange(quadros) * 60.0
+
+    inicio = time.perf_counter()
+    angulos_lote(instantes, suave=True)
+    geometria = time.perf_counter() - inicio
+
+    renderizador = Renderizador(tamanho)
+    inicio = time.perf_counter()
+    imagens = list(renderizador.quadros(instantes, suave=True))
+    desenho = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    tamanho_png = sum(len(png(imagem, nivel)) for imagem in imagens)
+    codificacao = time.perf_counter() - inicio
+    return {
+        "tamanho": tamanho,
+        "geometria_us": geometria / quadros * 1e6,
+        "quadros_por_segundo": quadros / desenho,
+        "png_por_segundo": quadros / codificacao,
+        "png_kb": tamanho_png / quadros / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo da renderização off-screen do relógio, sem display.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[100, 200, 400, 800])
+    parser.add_argument("--quadros", type=int, default=200)
+    parser.add_argument("--nivel-png", type=int, default=6)
+    args = parser.parse_args()
+    exigir_numpy()
+
+    print(f"{'tamanho':>8} {'geometria':>12} {'quadros/s':>10} {'png/s':>8} {'png':>9}")
+    for tamanho in args.tamanhos:
+        medida = medir(tamanho, args.quadros, args.nivel_png)
+        print(f"{medida['tamanho']:>8} {medida['geometria_us']:>8.3f}us/q {medida['quadros_por_segundo']:>10.1f} "
+              f"{medida['png_por_segundo']:>8.1f} {medida['png_kb']:>6.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
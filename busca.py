@@ -1,76 +1,261 @@
-from selenium import webdriver
+import argparse
+import threading
+
 from selenium.webdriver.common.by import By
-from time import sleep
 from selenium.webdriver.common.keys import Keys
-from openpyxl import Workbook
 
+from esperas import esperar_elemento, esperar_elemento_clicavel, esperar_pagina_carregada
+from extracao import extrair_vagas
+from indice import CAMINHO_INDICE, IndiceVagas
+import metricas
+from rolagem import proxima_pagina, rolar_pagina
+from saidas import COLUNAS, FORMATOS, TAMANHO_LOTE, abrir_saida
+from sessao import ARQUIVO_COOKIES, URL_BASE, abrir_sessao
+
+# quantidade de vagas coletadas por busca
+LIMITE_VAGAS = 25
+
+
+def buscar_vagas(browser, search, url_base=URL_BASE, limite=LIMITE_VAGAS, saida=None,
+                 indice=None, somente_novas=False, detalhes=None):
+    """
+    Pesquisa a palavra chave na página de vagas e coleta os resultados.
+
+    Args:
+        browser (WebDriver): Navegador já logado no site.
+        search (str): Palavra chave da busca.
+        url_base (str): Endereço do site.
+        limite (int): Quantidade de vagas desejada; 0 ou None coleta todos os resultados,
+            passando por todas as páginas.
+        saida (Saida | None): Se informada, recebe as vagas assim que são extraídas.
+        indice (IndiceVagas | None): Índice das vagas já vistas. Quando informado, a rolagem para
+            ao chegar a um trecho da lista só com vagas conhecidas, e as vagas são registradas nele.
+        somente_novas (bool): Retorna (e grava) só as vagas novas ou alteradas segundo o índice.
+        detalhes (ClienteDetalhes | None): Se informado, completa cada página de vagas com os
+            campos da página de detalhe (ver detalhes.COLUNAS_DETALHES).
+
+    Returns:
+        list[dict]: Vagas encontradas (ver extracao.COLUNAS).
+    """
+    # gerar a lista de vagas no site conforme a palavra chave
+    with metricas.fase("navegacao", busca=search):
+        browser.get(url_base + "/jobs/")
+        # o campo de busca é esperado logo abaixo, então basta o DOM estar pronto
+        esperar_pagina_carregada(browser, basta_dom=True)
+        input_jobs_search = esperar_elemento_clicavel(browser, "//header//input")
+        input_jobs_search.send_keys(search)
+        input_jobs_search.send_keys(Keys.ENTER)
+
+    vagas = []
+    coletadas = 0
+    pagina = 1
+    # as páginas cheias têm todas o mesmo tamanho; sabendo-o, não é preciso esperar o fim da lista
+    tamanho_pagina = None
+    while True:
+        #pega a lista de resultados
+        with metricas.fase("espera", busca=search, pagina=pagina):
+            ul_element = esperar_elemento(browser, "main div.jobs-search-results-list", por=By.CSS_SELECTOR)
+        restante = limite - coletadas if limite else None
+        alvo = min(filter(None, (restante, tamanho_pagina)), default=None)
+        so_conhecidas = False
+
+        def verificar_recentes(anterior, total):
+            # para cedo quando o trecho recém carregado só tem vagas já conhecidas
+            nonlocal so_conhecidas
+            so_conhecidas = indice.todas_conhecidas(extrair_vagas(browser, ul_element, anterior))
+            return so_conhecidas
+
+        with metricas.fase("rolagem", busca=search, pagina=pagina):
+            total = rolar_pagina(browser, ul_element, alvo,
+                                 verificar_recentes if indice is not None else None)
+        print(f'[{search}] página {pagina}: {total} vagas')
+
+        # lê título, link, empresa, local e id de todas as vagas da página numa única chamada
+        with metricas.fase("extracao", busca=search, pagina=pagina):
+            da_pagina = extrair_vagas(browser, ul_element)[:restante]
+        coletadas += len(da_pagina)
+        metricas.contar("vagas", len(da_pagina))
+        if indice is not None:
+            with metricas.fase("indice", busca=search, pagina=pagina):
+                if somente_novas:
+                    da_pagina = indice.filtrar_novas(da_pagina)
+                else:
+                    indice.registrar(da_pagina)
+        if detalhes is not None:
+            with metricas.fase("detalhes", busca=search, pagina=pagina):
+                detalhes.completar(da_pagina)
+        # cada página vai para a saída assim que é lida
+        if saida is not None:
+            with metricas.fase("gravacao", busca=search, pagina=pagina):
+                saida.escrever_lote(da_pagina)
+        vagas.extend(da_pagina)
+
+        if so_conhecidas:
+            print(f'[{search}] só vagas já conhecidas a partir daqui, parando a busca')
+            break
+        if limite and coletadas >= limite:
+            break
+        with metricas.fase("paginacao", busca=search, pagina=pagina):
+            if not proxima_pagina(browser, ul_element):
+                break
+        tamanho_pagina = tamanho_pagina or total
+        pagina += 1
+
+    print(f'[{search}] chegamos a {coletadas} vagas')
+    return vagas
+
+
+def colunas_saida(detalhes=False):
+    """Colunas do arquivo de saída, com as de detalhe quando a etapa estiver ligada."""
+    if not detalhes:
+        return COLUNAS
+    from detalhes import COLUNAS_DETALHES
+
+    return COLUNAS + COLUNAS_DETALHES
+
+
+def buscar_e_gravar(browser, search, url_base=URL_BASE, limite=LIMITE_VAGAS, formato="xlsx",
+                    lote_escrita=TAMANHO_LOTE, indice=None, somente_novas=False, detalhes=None):
+    """
+    Busca a palavra chave e grava as vagas num arquivo com o nome dela.
 
+    Returns:
+        Saida: A saída já fechada (caminho e linhas gravadas).
+    """
+    # o arquivo é gravado mesmo se a busca falhar no meio
+    colunas = colunas_saida(detalhes is not None)
+    with abrir_saida("vagas_links-" + search, formato, lote_escrita, colunas) as saida:
+        buscar_vagas(browser, search, url_base, limite, saida, indice, somente_novas, detalhes)
+    print(f"arquivo {saida.caminho} criado com {saida.linhas_gravadas} vagas")
+    return saida
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Busca vagas no LinkedIn e grava numa planilha.")
+    parser.add_argument("palavras", nargs="*", help="palavras chave; mais de uma ativa o modo em lote")
+    parser.add_argument("--arquivo", help="arquivo com uma palavra chave por linha")
+    parser.add_argument("--sessoes", type=int, default=3, help="navegadores simultâneos no modo em lote")
+    parser.add_argument("--tentativas", type=int, default=2, help="tentativas por palavra chave")
+    parser.add_argument("--buscas-por-minuto", type=float, default=20,
+                        help="limite global de buscas iniciadas por minuto")
+    parser.add_argument("--url-base", default=URL_BASE, help="endereço do site (ex.: servidor local)")
+    parser.add_argument("--sem-login", action="store_true", help="não pede login manual")
+    parser.add_argument("--headless", action="store_true", help="roda o navegador sem janela")
+    parser.add_argument("--enxuto", action="store_true",
+                        help="não carrega imagens, mídia, fontes nem rastreadores")
+    parser.add_argument("--perfil", help="pasta de um perfil persistente do Firefox")
+    parser.add_argument("--cookies", nargs="?", const=ARQUIVO_COOKIES,
+                        help=f"reaproveita os cookies do login (padrão: {ARQUIVO_COOKIES})")
+    parser.add_argument("--limite", type=int, default=LIMITE_VAGAS,
+                        help="vagas coletadas por busca (0 = todas, em todas as páginas)")
+    parser.add_argument("--formato", choices=FORMATOS, default="xlsx", help="formato do arquivo de saída")
+    parser.add_argument("--lote-escrita", type=int, default=TAMANHO_LOTE,
+                        help="linhas acumuladas antes de cada gravação")
+    parser.add_argument("--indice", nargs="?", const=CAMINHO_INDICE,
+                        help=f"usa o índice de vagas já vistas (padrão: {CAMINHO_INDICE})")
+    parser.add_argument("--somente-novas", action="store_true",
+                        help="grava só as vagas novas ou alteradas desde a última execução")
+    parser.add_argument("--detalhes", action="store_true",
+                        help="baixa a página de cada vaga e grava descrição, senioridade etc.")
+    parser.add_argument("--concorrencia-detalhes", type=int, default=8,
+                        help="páginas de detalhe baixadas ao mesmo tempo")
+    parser.add_argument("--relatorio", help="acrescenta as métricas da execução a este arquivo NDJSON")
+    parser.add_argument("--perfil-cpu", help="grava as estatísticas do cProfile neste arquivo")
+    args = parser.parse_args()
+    if args.somente_novas and not args.indice:
+        args.indice = CAMINHO_INDICE
 
-# inicia o navegador
-browser = webdriver.Firefox()
-#browser = webdriver.Chrome()
-browser.get("https://www.linkedin.com/")
+    palavras = list(args.palavras)
+    if args.arquivo:
+        with open(args.arquivo, encoding="utf-8") as arquivo:
+            palavras += [linha.strip() for linha in arquivo if linha.strip()]
 
-# logar-se no site e digitar a palavra chave
-print("vamos começar a buscar suas vagas")
-search = input("digite sua busca: ")
-input("Faça login e volte aqui para pressionar ENTER")
+    print("vamos começar a buscar suas vagas")
+    if not palavras:
+        palavras = [input("digite sua busca: ")]
 
-# gerar a lista de vagas no site conforme a palavra chave
-browser.get("https://www.linkedin.com/jobs/")
-sleep(5)
-input_jobs_search = browser.find_element(By.XPATH, "//header//input")
-sleep(5)
-input_jobs_search.send_keys(search)
-sleep(5)
-input_jobs_search.send_keys(Keys.ENTER)
-sleep(5)
+    medidor = metricas.ativar(metricas.Medidor("busca", palavras=palavras))
 
-#pega a lista de resultados
-ul_element = browser.find_element(By.CSS_SELECTOR, "main div.jobs-search-results-list")
-sleep(5)
+    def nova_sessao():
+        # inicia o navegador e faz o login (ou reaproveita o perfil/cookies)
+        with metricas.fase("sessao"):
+            browser = abrir_sessao(args.url_base, args.headless, args.perfil, args.cookies,
+                                   args.sem_login, args.enxuto)
+        return medidor.instrumentar(browser)
 
+    indice = IndiceVagas(args.indice) if args.indice else None
+    try:
+        with metricas.perfilar(args.perfil_cpu):
+            _executar(args, palavras, nova_sessao, indice)
+    finally:
+        if indice is not None:
+            indice.fechar()
+        resumo = medidor.finalizar(args.relatorio)
+        print(f"{resumo['duracao_s']:.1f}s, {resumo['comandos_total']} comandos ao WebDriver")
 
-def scroll_list(pixels):
-    browser.execute_script(f"arguments[0].scrollTop += {pixels};", ul_element)
-    sleep(2)
 
-links = []
-for _ in range(25):
-    scroll_list(200)
-    links = browser.find_elements(By.XPATH, "//main//div/div//ul//li//a[@data-control-id]")
-    print(len(links))
-    if len(links) >= 25:
-        print(f'chegamos ao numero esperado de {len(links)}')
-        break
+def _executar(args, palavras, nova_sessao, indice):
+    clientes = []
 
+    def obter_detalhes(browser):
+        # um único cliente de detalhes, criado com os cookies da primeira sessão
+        if not args.detalhes:
+            return None
+        if not clientes:
+            from detalhes import ClienteDetalhes
 
-# prepara a lista para ser gravada numa planilha
-spreadsheet = Workbook()
+            clientes.append(ClienteDetalhes.do_navegador(browser, concorrencia=args.concorrencia_detalhes))
+        return clientes[0]
 
-sheet = spreadsheet.active
+    try:
+        _buscar(args, palavras, nova_sessao, indice, obter_detalhes)
+    finally:
+        for cliente in clientes:
+            cliente.fechar()
 
-sheet['A1'] = "NOME DA VAGA"
-sheet['B1'] = "LINK DA VAGA"
-next_line = sheet.max_row + 1
 
-for link in links:
-    text = link.text
-    url_link = link.get_attribute("href")
+def _buscar(args, palavras, nova_sessao, indice, obter_detalhes):
+    if len(palavras) == 1:
+        search = palavras[0]
+        browser = nova_sessao()
+        # salva a lista com o nome da palavra chave
+        try:
+            buscar_e_gravar(browser, search, args.url_base, args.limite, args.formato,
+                            args.lote_escrita, indice, args.somente_novas, obter_detalhes(browser))
+        finally:
+            print("Encerrando busca")
+            #fecha o browse
+            browser.quit()
+        return
 
-    sheet[f'A{next_line}'] = text
-    sheet[f'B{next_line}'] = url_link
+    from busca_lote import buscar_em_lote
 
-    next_line += 1
+    lock_detalhes = threading.Lock()
 
-# salva a lista numa planilha com o nome da palavra chave
-spreadsheet.save("vagas_links-"+search+".xlsx")
-print("planilha criada")
+    def buscar(browser, search):
+        with lock_detalhes:
+            detalhes = obter_detalhes(browser)
+        return buscar_vagas(browser, search, args.url_base, args.limite, indice=indice,
+                            somente_novas=args.somente_novas, detalhes=detalhes)
 
-print("Encerrando busca")
+    # as vagas são juntadas por juntar_resultados (sem repetições, com todas as palavras
+    # chave que as encontraram em "busca") e gravadas depois que todas as buscas terminam
+    resultado = buscar_em_lote(
+        palavras,
+        nova_sessao,
+        buscar,
+        tamanho_pool=args.sessoes,
+        tentativas=args.tentativas,
+        buscas_por_minuto=args.buscas_por_minuto,
+    )
+    colunas = colunas_saida(args.detalhes)
+    with abrir_saida("vagas_links-lote", args.formato, args.lote_escrita, colunas) as saida:
+        saida.escrever_lote(resultado.vagas)
+    for search, erro in resultado.falhas.items():
+        print(f"[{search}] falhou: {erro}")
+    print(f"arquivo {saida.caminho} criado com {saida.linhas_gravadas} vagas")
+    print("Encerrando busca")
 
-#fecha o browse
-browser.quit()
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+
+class LimiteTaxa:
+    """Limite global de eventos por minuto, compartilhado entre threads."""
+
+    def __init__(self, por_minuto=None):
+        """
+        Args:
+            por_minuto (float | None): Eventos permitidos por minuto. None ou 0 desativa o limite.
+        """
+        self.intervalo = 60 / por_minuto if por_minuto else 0
+        self._proximo = 0.0
+        self._lock = threading.Lock()
+
+    def aguardar(self):
+        """Bloqueia até que o próximo evento possa começar."""
+        if not self.intervalo:
+            return
+        with self._lock:
+            agora = time.monotonic()
+            inicio = max(agora, self._proximo)
+            self._proximo = inicio + self.intervalo
+        if inicio > agora:
+            time.sleep(inicio - agora)
+
+
+class PoolNavegadores:
+    """Conjunto limitado de sessões de navegador reaproveitadas entre buscas."""
+
+    def __init__(self, fabrica, tamanho=3):
+        """
+        Args:
+            fabrica (callable): Função sem argumentos que cria uma sessão pronta (navegador logado).
+            tamanho (int): Quantidade máxima de sessões abertas ao mesmo tempo.
+        """
+        self.fabrica = fabrica
+        self.tamanho = tamanho
+        self._livres = queue.Queue()
+        self._criadas = 0
+        self._todas = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def sessao(self):
+        """
+        Empresta uma sessão do pool.
+
+        Se a busca falhar, a sessão é fechada e descartada, e a próxima tentativa
+        recebe uma sessão nova.
+        """
+        browser = self._obter()
+        try:
+            yield browser
+        except Exception:
+            self._descartar(browser)
+            raise
+        else:
+            self._livres.put(browser)
+
+    def _obter(self):
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            pass
+        # a criação é serializada para que os pedidos de login manual não se misturem
+        with self._lock:
+            if self._criadas < self.tamanho:
+                browser = self.fabrica()
+                self._criadas += 1
+                self._todas.append(browser)
+                return browser
+        return self._livres.get()
+
+    def _descartar(self, browser):
+        with self._lock:
+            self._criadas -= 1
+            self._todas.remove(browser)
+        try:
+            browser.quit()
+        except Exception:
+            pass
+
+    def fechar(self):
+        """Fecha todas as sessões abertas."""
+        with self._lock:
+            sessoes, self._todas = self._todas, []
+            self._criadas = 0
+        for browser in sessoes:
+            try:
+                browser.quit()
+            except Exception:
+                pass
+
+
+class ResultadoLote:
+    """Resultado de uma busca em lote."""
+
+    def __init__(self, vagas, por_busca, falhas, contagens):
+        """
+        Args:
+            vagas (list[dict]): Vagas de todas as buscas, sem repetições, com a chave "busca".
+            por_busca (dict): Vagas encontradas por palavra chave.
+            falhas (dict): Última exceção das palavras chave que esgotaram as tentativas.
+            contagens (dict): Quantidade de vagas encontradas por palavra chave.
+        """
+        self.vagas = vagas
+        self.por_busca = por_busca
+        self.falhas = falhas
+        self.contagens = contagens
+
+
+def juntar_resultados(por_busca):
+    """
+    Junta as vagas de várias buscas, removendo as repetidas pelo id (ou link).
+
+    Vagas encontradas por mais de uma palavra chave listam todas elas na chave "busca".
+    Vagas sem id nem link não têm como ser comparadas e são todas mantidas.
+    """
+    vagas = {}
+    for search, encontradas in por_busca.items():
+        for vaga in encontradas:
+            # sem id nem link, uma chave única por vaga evita juntá-las numa só
+            chave = vaga.get("id_vaga") or vaga.get("link") or object()
+            if chave in vagas:
+                vagas[chave]["busca"] += ", " + search
+            else:
+                vagas[chave] = dict(vaga, busca=search)
+    return list(vagas.values())
+
+
+def buscar_em_lote(palavras, fabrica, buscar, tamanho_pool=3, tentativas=2, buscas_por_minuto=None,
+                   ao_concluir=None):
+    """
+    Executa várias buscas em paralelo sobre um pool de sessões de navegador.
+
+    Args:
+        palavras (list[str]): Palavras chave a buscar.
+        fabrica (callable): Cria uma sessão de navegador pronta para buscar.
+        buscar (callable): Função (browser, palavra) que retorna a lista de vagas.
+        tamanho_pool (int): Quantidade de sessões (e de buscas simultâneas).
+        tentativas (int): Tentativas por palavra chave, cada uma com uma sessão nova após falha.
+        buscas_por_minuto (float | None): Limite global de buscas iniciadas por minuto.
+        ao_concluir (callable | None): Função (palavra, vagas) chamada, uma de cada vez, assim que
+            cada busca termina. Quando informada, as vagas não são guardadas na memória e o
+            resultado traz apenas contagens e falhas.
+
+    Returns:
+        ResultadoLote: Vagas juntadas, vagas por busca, falhas e contagens.
+    """
+    pool = PoolNavegadores(fabrica, tamanho_pool)
+    limite = LimiteTaxa(buscas_por_minuto)
+    lock_conclusao = threading.Lock()
+    por_busca = {}
+    contagens = {}
+    falhas = {}
+
+    def _concluir(search, vagas):
+        contagens[search] = len(vagas)
+        if ao_concluir is None:
+            por_busca[search] = vagas
+        else:
+            with lock_conclusao:
+                ao_concluir(search, vagas)
+
+    def _executar(search):
+        for tentativa in range(1, tentativas + 1):
+            limite.aguardar()
+            try:
+                with pool.sessao() as browser:
+                    vagas = buscar(browser, search)
+            except Exception as erro:
+                print(f"[{search}] tentativa {tentativa} de {tentativas} falhou: {erro!r}")
+                falhas[search] = erro
+            else:
+                falhas.pop(search, None)
+                _concluir(search, vagas)
+                return
+
+    try:
+        with ThreadPoolExecutor(max_workers=tamanho_pool) as executor:
+            list(executor.map(_executar, dict.fromkeys(palavras)))
+    finally:
+        pool.fechar()
+
+    por_busca = {search: por_busca[search] for search in palavras if search in por_busca}
+    return ResultadoLote(juntar_resultados(por_busca), por_busca, falhas, contagens)
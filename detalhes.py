@@ -0,0 +1,200 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+import urllib3
+from urllib3.util.retry import Retry
+
+from busca_lote import LimiteTaxa
+
+# colunas extras gravadas quando a etapa de detalhes está ligada
+COLUNAS_DETALHES = [
+    ("SENIORIDADE", "senioridade"),
+    ("TIPO DE EMPREGO", "tipo_emprego"),
+    ("FUNÇÃO", "funcao"),
+    ("SETORES", "setores"),
+    ("DESCRIÇÃO", "descricao"),
+]
+# requisições simultâneas e requisições por minuto para cada host
+CONCORRENCIA = 8
+REQUISICOES_POR_MINUTO = 120
+
+_CLASSES_DESCRICAO = {"show-more-less-html__markup", "jobs-description__content", "description__text"}
+_CRITERIOS = {
+    "seniority level": "senioridade",
+    "nível de experiência": "senioridade",
+    "employment type": "tipo_emprego",
+    "tipo de emprego": "tipo_emprego",
+    "job function": "funcao",
+    "função": "funcao",
+    "industries": "setores",
+    "setores": "setores",
+}
+_TAGS_VAZIAS = {"area", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+_TAGS_BLOCO = {"p", "li", "div", "ul", "ol", "h1", "h2", "h3", "h4"}
+
+
+class _LeitorDetalhes(HTMLParser):
+    """Lê a descrição e os critérios (senioridade, tipo de emprego...) da página da vaga."""
+
+    def __init__(self):
+        super().__init__()
+        self.campos = {}
+        self._descricao = []
+        self._profundidade = 0  # > 0 enquanto estiver dentro da descrição
+        self._captura = None  # "titulo" ou "valor" de um critério
+        self._texto = []
+        self._criterio = None
+
+    def handle_starttag(self, tag, attrs):
+        classes = set((dict(attrs).get("class") or "").split())
+        if self._profundidade:
+            if tag not in _TAGS_VAZIAS:
+                self._profundidade += 1
+            if tag in _TAGS_BLOCO or tag == "br":
+                self._descricao.append("\n")
+        elif classes & _CLASSES_DESCRICAO and not self._descricao:
+            self._profundidade = 1
+        elif "description__job-criteria-subheader" in classes:
+            self._captura, self._texto = "titulo", []
+        elif "description__job-criteria-text" in classes:
+            self._captura, self._texto = "valor", []
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/>, <img/>...: não abrem nível, então também não podem fechar um (o padrão
+        # do HTMLParser chamaria handle_endtag e encerraria a descrição antes da hora)
+        if self._profundidade:
+            if tag in _TAGS_BLOCO or tag == "br":
+                self._descricao.append("\n")
+        else:
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if self._profundidade:
+            if tag not in _TAGS_VAZIAS:
+                self._profundidade -= 1
+        elif self._captura:
+            texto = " ".join("".join(self._texto).split())
+            if self._captura == "titulo":
+                self._criterio = _CRITERIOS.get(texto.lower())
+            elif self._criterio:
+                self.campos[self._criterio] = texto
+                self._criterio = None
+            self._captura = None
+
+    def handle_data(self, data):
+        if self._profundidade:
+            self._descricao.append(data)
+        elif self._captura:
+            self._texto.append(data)
+
+    def resultado(self):
+        linhas = (" ".join(linha.split()) for linha in "".join(self._descricao).splitlines())
+        self.campos["descricao"] = "\n".join(linha for linha in linhas if linha)
+        return self.campos
+
+
+def ler_detalhes(html):
+    """
+    Extrai os campos de COLUNAS_DETALHES do HTML da página de uma vaga.
+
+    Tags vazias escritas com barra (<br/>, <img/>) não encerram a descrição:
+
+    >>> ler_detalhes('<div class="show-more-less-html__markup"><p>Linha um<br/>linha dois</p>'
+    ...              '<p>Segundo parágrafo</p></div>')["descricao"]
+    'Linha um\\nlinha dois\\nSegundo parágrafo'
+    """
+    leitor = _LeitorDetalhes()
+    leitor.feed(html)
+    leitor.close()
+    return leitor.resultado()
+
+
+class ClienteDetalhes:
+    """
+    Busca as páginas de detalhe das vagas em paralelo, fora do navegador.
+
+    Usa um pool de conexões HTTP reaproveitadas, concorrência limitada, limite de
+    requisições por host e novas tentativas com espera crescente.
+    """
+
+    def __init__(self, cookies=None, user_agent=None, concorrencia=CONCORRENCIA,
+                 por_minuto=REQUISICOES_POR_MINUTO, tentativas=3, tempo_limite=15):
+        """
+        Args:
+            cookies (str | None): Cabeçalho Cookie da sessão logada.
+            user_agent (str | None): User-Agent enviado nas requisições.
+            concorrencia (int): Requisições simultâneas (e conexões por host no pool).
+            por_minuto (float | None): Requisições por minuto para cada host.
+            tentativas (int): Novas tentativas em falhas de conexão e respostas 429/5xx.
+            tempo_limite (float): Tempo máximo de cada requisição em segundos.
+        """
+        cabecalhos = {"Accept": "text/html", "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8"}
+        if cookies:
+            cabecalhos["Cookie"] = cookies
+        if user_agent:
+            cabecalhos["User-Agent"] = user_agent
+        self._http = urllib3.PoolManager(
+            maxsize=concorrencia,
+            block=True,
+            headers=cabecalhos,
+            timeout=urllib3.Timeout(total=tempo_limite),
+            retries=Retry(
+                total=tentativas,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                respect_retry_after_header=True,
+            ),
+        )
+        self._executor = ThreadPoolExecutor(max_workers=concorrencia)
+        self._por_minuto = por_minuto
+        self._limites = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def do_navegador(cls, browser, **kwargs):
+        """Cria o cliente com os cookies e o User-Agent da sessão logada no navegador."""
+        cookies = "; ".join(f"{c['name']}={c['value']}" for c in browser.get_cookies())
+        user_agent = browser.execute_script("return navigator.userAgent")
+        return cls(cookies, user_agent, **kwargs)
+
+    def _limite(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._limites:
+                self._limites[host] = LimiteTaxa(self._por_minuto)
+            return self._limites[host]
+
+    def buscar(self, url):
+        """Baixa a página da vaga e retorna os campos lidos dela."""
+        self._limite(url).aguardar()
+        resposta = self._http.request("GET", url)
+        if resposta.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"HTTP {resposta.status} em {url}")
+        return ler_detalhes(resposta.data.decode("utf-8", errors="replace"))
+
+    def completar(self, vagas):
+        """
+        Acrescenta os campos de detalhe a cada vaga (no próprio dicionário).
+
+        Vagas cuja página não pôde ser lida ficam com os campos vazios.
+        """
+        futuros = [(vaga, self._executor.submit(self.buscar, vaga["link"]))
+                   for vaga in vagas if vaga.get("link")]
+        for vaga, futuro in futuros:
+            try:
+                vaga.update(futuro.result())
+            except Exception as erro:
+                print(f"detalhes de {vaga['link']} falharam: {erro!r}")
+        return vagas
+
+    def fechar(self):
+        self._executor.shutdown(wait=True)
+        self._http.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,49 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# tempos padrão (em segundos) para as esperas por condição
+TEMPO_LIMITE = 20
+INTERVALO = 0.25
+
+
+def esperar(browser, condicao, tempo_limite=TEMPO_LIMITE, intervalo=INTERVALO, mensagem=""):
+    """
+    Consulta a condição até que ela retorne um valor verdadeiro ou o tempo acabe.
+
+    Args:
+        browser (WebDriver): Navegador controlado pelo Selenium.
+        condicao (callable): Função que recebe o navegador e retorna um valor verdadeiro quando pronta.
+        tempo_limite (float): Tempo máximo de espera em segundos.
+        intervalo (float): Intervalo entre as consultas em segundos.
+        mensagem (str): Mensagem usada na TimeoutException.
+
+    Returns:
+        O primeiro valor verdadeiro retornado pela condição.
+    """
+    return WebDriverWait(browser, tempo_limite, poll_frequency=intervalo).until(condicao, mensagem)
+
+
+def esperar_elemento(browser, seletor, por=By.XPATH, **kwargs):
+    """Espera o elemento estar presente no DOM e o retorna."""
+    return esperar(browser, EC.presence_of_element_located((por, seletor)),
+                   mensagem=f"elemento não encontrado: {seletor}", **kwargs)
+
+
+def esperar_elemento_clicavel(browser, seletor, por=By.XPATH, **kwargs):
+    """Espera o elemento estar visível e habilitado e o retorna."""
+    return esperar(browser, EC.element_to_be_clickable((por, seletor)),
+                   mensagem=f"elemento não ficou clicável: {seletor}", **kwargs)
+
+
+def esperar_pagina_carregada(browser, basta_dom=False, **kwargs):
+    """
+    Espera o document.readyState chegar a 'complete'.
+
+    Com basta_dom=True, 'interactive' (DOM pronto, recursos ainda carregando) já basta.
+    """
+    estados = ("interactive", "complete") if basta_dom else ("complete",)
+    return esperar(browser,
+                   lambda b: b.execute_script("return document.readyState") in estados,
+                   mensagem="a página não terminou de carregar", **kwargs)
+
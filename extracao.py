@@ -0,0 +1,79 @@
+import json
+import re
+
+from selenium.common.exceptions import JavascriptException, WebDriverException
+from selenium.webdriver.common.by import By
+
+SELETOR_LINKS = "//main//div/div//ul//li//a[@data-control-id]"
+COLUNAS = ("titulo", "link", "empresa", "local", "id_vaga")
+
+_ID_NO_LINK = re.compile(r"/jobs/view/(\d+)")
+
+# percorre todos os itens da lista dentro do navegador e devolve um array JSON,
+# assim a extração custa uma única chamada ao WebDriver, não importa quantas vagas existam
+_SCRIPT_EXTRACAO = """
+const raiz = arguments[0] || document;
+const inicio = arguments[1] || 0;
+const texto = (el) => (el ? el.innerText.trim() : "");
+const vagas = [];
+for (const a of Array.from(raiz.querySelectorAll("li a[data-control-id]")).slice(inicio)) {
+    const li = a.closest("li");
+    const id = (li && (li.dataset.occludableJobId || li.dataset.jobId))
+        || (a.href.match(/\\/jobs\\/view\\/(\\d+)/) || [])[1] || "";
+    vagas.push({
+        titulo: texto(a),
+        link: a.href,
+        empresa: texto(li && li.querySelector(
+            ".artdeco-entity-lockup__subtitle, .job-card-container__primary-description, .job-card-container__company-name")),
+        local: texto(li && li.querySelector(
+            ".artdeco-entity-lockup__caption, .job-card-container__metadata-item")),
+        id_vaga: id,
+    });
+}
+return JSON.stringify(vagas);
+"""
+
+
+def extrair_vagas_js(browser, container=None, inicio=0):
+    """
+    Extrai todas as vagas da lista com uma única chamada execute_script.
+
+    Args:
+        browser (WebDriver): Navegador controlado pelo Selenium.
+        container (WebElement | None): Elemento da lista de resultados. Se None, usa o documento inteiro.
+        inicio (int): Posição do primeiro item extraído; permite ler só os itens recém carregados.
+
+    Returns:
+        list[dict]: Uma vaga por item, com as chaves de COLUNAS.
+    """
+    return json.loads(browser.execute_script(_SCRIPT_EXTRACAO, container, inicio))
+
+
+def extrair_vagas_elementos(links):
+    """
+    Extrai as vagas elemento por elemento (uma chamada ao WebDriver por atributo).
+
+    Caminho mais lento, mantido como alternativa caso o script não possa ser executado.
+    Empresa e local não são lidos aqui para não multiplicar as chamadas.
+    """
+    vagas = []
+    for link in links:
+        url_link = link.get_attribute("href") or ""
+        id_vaga = _ID_NO_LINK.search(url_link)
+        vagas.append({
+            "titulo": link.text,
+            "link": url_link,
+            "empresa": "",
+            "local": "",
+            "id_vaga": id_vaga.group(1) if id_vaga else "",
+        })
+    return vagas
+
+
+def extrair_vagas(browser, container=None, inicio=0):
+    """Extrai as vagas em lote e recorre ao caminho por elemento se o script falhar."""
+    try:
+        return extrair_vagas_js(browser, container, inicio)
+    except (JavascriptException, WebDriverException, ValueError) as erro:
+        print(f"extração em lote falhou ({erro.__class__.__name__}), lendo elemento por elemento")
+        return extrair_vagas_elementos(browser.find_elements(By.XPATH, SELETOR_LINKS)[inicio:])
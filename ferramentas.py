@@ -0,0 +1,49 @@
+import argparse
+import importlib
+import sys
+
+# subcomando: (módulo, função de entrada, descrição). Os módulos só são importados
+# quando o subcomando é chamado, então selenium, flet, tkinter e numpy só carregam
+# para a ferramenta que precisa deles.
+FERRAMENTAS = {
+    "busca": ("busca", "main", "busca vagas no site (selenium)"),
+    "trabalhador": ("trabalhador", "main", "mantém o navegador aberto e atende buscas (selenium)"),
+    "servidor": ("servidor_fixture", "main", "servidor local com páginas de vagas de teste"),
+    "lista": ("lista", "main", "mostra um fluxo de linhas numa ListView (flet)"),
+    "layout": ("simple_flex_layout", "run", "layout desktop com menu lateral e página de dados (flet)"),
+    "relogio": ("relogio", "main", "relógio analógico e digital (tkinter)"),
+    "relogio-tk": ("relogio_tkinter", "main", "relógio analógico num canvas (tkinter)"),
+    "relogio-turtle": ("relogio_simples", "main", "relógio analógico com turtle"),
+    "painel": ("painel_relogios", "main", "painel de relógios em vários fusos (tkinter)"),
+    "renderizar": ("renderizador", "main", "time-lapse do relógio sem display (numpy)"),
+    "benchmark-importacao": ("benchmark_importacao", "main", "tempo de importação de cada ferramenta"),
+}
+
+
+def executar(nome, argumentos=()):
+    """
+    Importa a ferramenta e chama sua função de entrada com `argumentos` na linha de comando.
+
+    As ferramentas leem sys.argv com argparse; o nome do programa passa a ser
+    "ferramentas.py <nome>", para que a ajuda de cada uma mostre o comando certo.
+    """
+    modulo, funcao, _ = FERRAMENTAS[nome]
+    sys.argv = [f"{sys.argv[0]} {nome}", *argumentos]
+    return getattr(importlib.import_module(modulo), funcao)()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ferramentas do projeto. Use `<ferramenta> --help` para as opções de cada uma.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="ferramentas:\n" + "\n".join(
+            f"  {nome:<22}{descricao}" for nome, (_, _, descricao) in FERRAMENTAS.items()),
+    )
+    parser.add_argument("ferramenta", choices=FERRAMENTAS, metavar="ferramenta", help="uma das ferramentas abaixo")
+    parser.add_argument("argumentos", nargs=argparse.REMAINDER, help="repassados à ferramenta")
+    args = parser.parse_args()
+    executar(args.ferramenta, args.argumentos)
+
+
+if __name__ == "__main__":
+    main()
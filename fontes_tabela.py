@@ -0,0 +1,350 @@
+import csv
+import os
+import sqlite3
+import tempfile
+import weakref
+from array import array
+
+# linhas por inserção ao importar uma planilha xlsx para o SQLite temporário
+TAMANHO_LOTE_IMPORTACAO = 1000
+# limite de parâmetros por consulta do SQLite (versões antigas aceitam 999)
+MAXIMO_PARAMETROS = 900
+
+
+def chave_ordenacao(valor):
+    """Chave que ordena números como números, textos sem diferenciar maiúsculas e vazios por último."""
+    if valor is None or valor == "":
+        return (2, "")
+    if isinstance(valor, (int, float)):
+        return (0, valor)
+    texto = str(valor)
+    try:
+        return (0, float(texto.replace(",", ".")))
+    except ValueError:
+        return (1, texto.casefold())
+
+
+def celula(linha, indice):
+    """Valor da coluna `indice` de uma linha; linhas curtas (CSV irregular, linha em branco) dão None."""
+    return linha[indice] if indice < len(linha) else None
+
+
+class Fonte:
+    """
+    Tabela lida sob demanda: as linhas são buscadas pelo id quando vão aparecer na tela.
+
+    Cada fonte define o que é um id de linha (número do registro num CSV, rowid no
+    SQLite). Filtrar e ordenar devolvem só arrays de ids, o índice em memória da
+    visão atual; nenhuma linha completa fica carregada além das pedidas em linhas().
+
+    Os recursos abertos (arquivo, conexão, cópia temporária) são liberados por
+    fechar() ou, se ninguém chamar, quando a fonte é coletada ou o programa termina.
+    """
+
+    colunas = []
+    _finalizar = None  # weakref.finalize que libera os recursos da fonte
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def ids(self):
+        """Ids de todas as linhas, na ordem do arquivo."""
+        return array("q", range(len(self)))
+
+    def linhas(self, ids):
+        """Linhas (tuplas, na ordem de `colunas`) dos ids pedidos, na mesma ordem."""
+        raise NotImplementedError
+
+    def percorrer(self):
+        """Percorre o arquivo inteiro em sequência, entregando (id, linha)."""
+        raise NotImplementedError
+
+    def filtrar(self, texto):
+        """
+        Ids das linhas em que algum valor contém `texto`, sem diferenciar maiúsculas.
+
+        Returns:
+            array: Ids na ordem do arquivo; texto vazio devolve todos.
+        """
+        texto = texto.strip().casefold()
+        if not texto:
+            return self.ids()
+        colunas = range(len(self.colunas))
+        return array("q", (
+            id_linha for id_linha, linha in self.percorrer()
+            if any(texto in str(valor).casefold()
+                   for valor in (celula(linha, i) for i in colunas) if valor is not None)
+        ))
+
+    def ordenar(self, ids, coluna, decrescente=False):
+        """
+        Reordena `ids` pelos valores de uma coluna.
+
+        Só os valores dessa coluna, e só das linhas em `ids`, são lidos para a memória.
+        """
+        indice = self.colunas.index(coluna)
+        selecionados = set(ids)
+        chaves = {
+            id_linha: chave_ordenacao(celula(linha, indice))
+            for id_linha, linha in self.percorrer() if id_linha in selecionados
+        }
+        ordenados = sorted(ids, key=chaves.__getitem__, reverse=decrescente)
+        if decrescente:
+            # o sentido inverso traria os vazios para o começo; eles ficam no fim nos dois sentidos
+            vazios = sum(1 for id_linha in ordenados if chaves[id_linha][0] == 2)
+            ordenados = ordenados[vazios:] + ordenados[:vazios]
+        return array("q", ordenados)
+
+    def fechar(self):
+        """Libera os recursos da fonte; chamadas repetidas não fazem nada."""
+        if self._finalizar is not None:
+            self._finalizar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class FonteCsv(Fonte):
+    """
+    CSV lido por posição: ao abrir, uma passada guarda só o deslocamento (em bytes)
+    de cada registro; depois cada linha é lida com um seek.
+
+    Linhas em branco e linhas com menos valores que o cabeçalho contam como vazias
+    nas colunas que faltam:
+
+    >>> import os, tempfile
+    >>> with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as arquivo:
+    ...     _ = arquivo.write("nome,valor\\nb,2\\n\\na\\nc,1\\n")
+    >>> with FonteCsv(arquivo.name) as fonte:
+    ...     fonte.linhas(fonte.ordenar(fonte.ids(), "valor", decrescente=True)), list(fonte.filtrar("a"))
+    ([('b', '2'), ('c', '1'), (), ('a',)], [2])
+    >>> os.remove(arquivo.name)
+    """
+
+    def __init__(self, caminho, encoding="utf-8-sig", **formato):
+        """
+        Args:
+            caminho (str): Arquivo CSV com cabeçalho na primeira linha.
+            encoding (str): Codificação do arquivo.
+            **formato: Repassados ao csv.reader (delimiter, quotechar...).
+        """
+        self.caminho = caminho
+        self.encoding = encoding
+        self.formato = formato
+        self._arquivo = open(caminho, "rb")
+        self._finalizar = weakref.finalize(self, self._arquivo.close)
+        self._inicios = array("q")
+        self._indexar()
+
+    def _leitor(self, arquivo, posicao, fim=None):
+        # csv.reader a partir de `posicao`; `fim`, se dado, recebe o deslocamento após cada linha lida
+        def linhas():
+            arquivo.seek(posicao)
+            for linha in arquivo:
+                if fim is not None:
+                    fim[0] += len(linha)
+                yield linha.decode(self.encoding)
+
+        return csv.reader(linhas(), **self.formato)
+
+    def _indexar(self):
+        fim = [0]
+        leitor = self._leitor(self._arquivo, 0, fim)
+        self.colunas = next(leitor, [])
+        # um registro pode ocupar várias linhas (campos entre aspas); o leitor só
+        # pede a próxima linha quando precisa, então `fim` marca o início do próximo
+        inicio = fim[0]
+        for _ in leitor:
+            self._inicios.append(inicio)
+            inicio = fim[0]
+
+    def __len__(self):
+        return len(self._inicios)
+
+    def linhas(self, ids):
+        return [tuple(next(self._leitor(self._arquivo, self._inicios[id_linha]))) for id_linha in ids]
+
+    def percorrer(self):
+        if not self._inicios:
+            return
+        # arquivo próprio, para linhas() poder ser chamado no meio da passada
+        with open(self.caminho, "rb") as arquivo:
+            for id_linha, linha in enumerate(self._leitor(arquivo, self._inicios[0])):
+                yield id_linha, tuple(linha)
+
+
+def _nome_sql(nome):
+    return '"' + str(nome).replace('"', '""') + '"'
+
+
+def _casefold(valor):
+    return None if valor is None else str(valor).casefold()
+
+
+def _grupo_ordenacao(valor):
+    return chave_ordenacao(valor)[0]
+
+
+def _valor_ordenacao(valor):
+    return chave_ordenacao(valor)[1]
+
+
+def _fechar_e_apagar(conexao, caminho):
+    # finalizador da FonteXlsx: fecha a conexão e apaga a cópia temporária da planilha
+    conexao.close()
+    try:
+        os.remove(caminho)
+    except FileNotFoundError:
+        pass
+
+
+class FonteSqlite(Fonte):
+    """Tabela SQLite; os ids são os rowids, e filtro e ordenação rodam no próprio SQLite."""
+
+    def __init__(self, caminho, tabela=None):
+        """
+        Args:
+            caminho (str): Banco SQLite.
+            tabela (str | None): Tabela exibida. Padrão: a primeira do banco.
+        """
+        self.caminho = caminho
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._finalizar = weakref.finalize(self, self._conexao.close)
+        # mesmas regras de Fonte.filtrar e Fonte.ordenar (casefold e chave_ordenacao),
+        # para a grade se comportar igual com qualquer tipo de arquivo
+        self._conexao.create_function("fonte_casefold", 1, _casefold, deterministic=True)
+        self._conexao.create_function("fonte_grupo", 1, _grupo_ordenacao, deterministic=True)
+        self._conexao.create_function("fonte_valor", 1, _valor_ordenacao, deterministic=True)
+        if tabela is None:
+            linha = self._conexao.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY rowid"
+            ).fetchone()
+            if linha is None:
+                raise ValueError(f"{caminho} não tem tabelas")
+            tabela = linha[0]
+        self.tabela = tabela
+        cursor = self._conexao.execute(f"SELECT * FROM {_nome_sql(tabela)} LIMIT 0")
+        self.colunas = [descricao[0] for descricao in cursor.description]
+        self._lista_colunas = ", ".join(_nome_sql(coluna) for coluna in self.colunas)
+
+    def __len__(self):
+        return self._conexao.execute(f"SELECT count(*) FROM {_nome_sql(self.tabela)}").fetchone()[0]
+
+    def ids(self):
+        return array("q", (rowid for rowid, in self._conexao.execute(
+            f"SELECT rowid FROM {_nome_sql(self.tabela)} ORDER BY rowid")))
+
+    def linhas(self, ids):
+        ids = list(ids)
+        encontradas = {}
+        for inicio in range(0, len(ids), MAXIMO_PARAMETROS):
+            parte = ids[inicio:inicio + MAXIMO_PARAMETROS]
+            marcadores = ", ".join("?" * len(parte))
+            for rowid, *valores in self._conexao.execute(
+                f"SELECT rowid, {self._lista_colunas} FROM {_nome_sql(self.tabela)} WHERE rowid IN ({marcadores})",
+                parte,
+            ):
+                encontradas[rowid] = tuple(valores)
+        return [encontradas[rowid] for rowid in ids]
+
+    def percorrer(self):
+        yield from ((rowid, tuple(valores)) for rowid, *valores in self._conexao.execute(
+            f"SELECT rowid, {self._lista_colunas} FROM {_nome_sql(self.tabela)} ORDER BY rowid"))
+
+    def filtrar(self, texto):
+        texto = texto.strip().casefold()
+        if not texto:
+            return self.ids()
+        # o LIKE do SQLite só ignora maiúsculas em ASCII; casefold vale para qualquer letra
+        condicao = " OR ".join(f"instr(fonte_casefold({_nome_sql(coluna)}), ?) > 0" for coluna in self.colunas)
+        return array("q", (rowid for rowid, in self._conexao.execute(
+            f"SELECT rowid FROM {_nome_sql(self.tabela)} WHERE {condicao} ORDER BY rowid",
+            [texto] * len(self.colunas),
+        )))
+
+    def ordenar(self, ids, coluna, decrescente=False):
+        selecionados = set(ids)
+        ordem = "DESC" if decrescente else "ASC"
+        nome = _nome_sql(coluna)
+        # vazios no fim nos dois sentidos; números (mesmo guardados como texto) antes dos textos
+        return array("q", (rowid for rowid, in self._conexao.execute(
+            f"SELECT rowid FROM {_nome_sql(self.tabela)} ORDER BY {nome} IS NULL OR {nome} = '', "
+            f"fonte_grupo({nome}) {ordem}, fonte_valor({nome}) {ordem}, rowid"
+        ) if rowid in selecionados))
+
+
+class FonteXlsx(FonteSqlite):
+    """
+    Planilha xlsx (openpyxl no modo read-only).
+
+    O xlsx não permite ler uma linha no meio sem passar pelas anteriores, então,
+    ao abrir, as linhas são copiadas em lotes para um SQLite temporário, sem
+    ficarem todas na memória; daí em diante funciona como FonteSqlite.
+    """
+
+    def __init__(self, caminho, planilha=None):
+        """
+        Args:
+            caminho (str): Arquivo xlsx com cabeçalho na primeira linha.
+            planilha (str | None): Nome da aba. Padrão: a aba ativa.
+        """
+        try:
+            from openpyxl import load_workbook
+        except ImportError as erro:
+            raise RuntimeError("a leitura de xlsx precisa do pacote openpyxl (pip install openpyxl)") from erro
+
+        descritor, self._temporario = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(descritor)
+        try:
+            self._importar(load_workbook(caminho, read_only=True, data_only=True), planilha)
+            super().__init__(self._temporario, "dados")
+        except BaseException:
+            os.remove(self._temporario)
+            raise
+        self.caminho = caminho
+        # a cópia temporária é apagada junto com a conexão, mesmo sem fechar()
+        self._finalizar.detach()
+        self._finalizar = weakref.finalize(self, _fechar_e_apagar, self._conexao, self._temporario)
+
+    def _importar(self, livro, planilha):
+        try:
+            aba = livro[planilha] if planilha else livro.active
+            linhas = aba.iter_rows(values_only=True)
+            cabecalho = next(linhas, ())
+            colunas = [str(nome) if nome is not None else f"coluna {i + 1}" for i, nome in enumerate(cabecalho)]
+            conexao = sqlite3.connect(self._temporario)
+            try:
+                conexao.execute(f"CREATE TABLE dados ({', '.join(_nome_sql(coluna) for coluna in colunas)})")
+                insercao = f"INSERT INTO dados VALUES ({', '.join('?' * len(colunas))})"
+                lote = []
+                for linha in linhas:
+                    lote.append(tuple(linha[:len(colunas)]) + (None,) * (len(colunas) - len(linha)))
+                    if len(lote) >= TAMANHO_LOTE_IMPORTACAO:
+                        conexao.executemany(insercao, lote)
+                        lote.clear()
+                conexao.executemany(insercao, lote)
+                conexao.commit()
+            finally:
+                conexao.close()
+        finally:
+            livro.close()
+
+
+FONTES = {
+    ".csv": FonteCsv,
+    ".xlsx": FonteXlsx,
+    ".sqlite": FonteSqlite,
+    ".sqlite3": FonteSqlite,
+    ".db": FonteSqlite,
+}
+
+
+def abrir_fonte(caminho, **opcoes):
+    """Abre a fonte adequada à extensão do arquivo (csv, xlsx ou SQLite)."""
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao not in FONTES:
+        raise ValueError(f"formato não suportado: {extensao} (use {', '.join(sorted(FONTES))})")
+    return FONTES[extensao](caminho, **opcoes)
@@ -0,0 +1,182 @@
+# Geometria dos relógios analógicos, sem interface gráfica. Ângulos em sentido
+# horário a partir das 12 horas, com o eixo y para baixo (como no canvas do Tk).
+# As funções escalares servem a quem desenha um instante por vez; as de lote
+# recebem arrays NumPy de instantes (painel, renderização off-screen); o numpy só
+# é importado quando uma delas é usada ou quando alguém importa `np` deste módulo.
+import math
+from datetime import datetime
+from functools import lru_cache
+
+# comprimento de cada ponteiro, em fração do raio do mostrador
+PROPORCAO_HORA = 0.5
+PROPORCAO_MINUTO = 0.7
+PROPORCAO_SEGUNDO = 0.9
+# marcações das horas: do raio menos este valor até o raio
+RECUO_MARCACAO = 20
+
+# posições numa volta: a hora anda a cada minuto, o minuto a cada segundo e o
+# segundo a cada segundo, ou 60 vezes por segundo na varredura suave
+POSICOES_HORA = 720
+POSICOES_MINUTO = 3600
+POSICOES_SEGUNDO = 60
+POSICOES_SEGUNDO_SUAVE = 3600
+
+
+@lru_cache(maxsize=None)
+def carregar_numpy():
+    """O módulo numpy, importado na primeira chamada, ou None se não estiver instalado."""
+    try:
+        import numpy
+    except ImportError:  # as funções escalares não precisam do numpy
+        return None
+    return numpy
+
+
+def __getattr__(nome):
+    # `from geometria_relogio import np` continua funcionando, carregando o numpy só então
+    if nome == "np":
+        return carregar_numpy()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def exigir_numpy():
+    np = carregar_numpy()
+    if np is None:
+        raise RuntimeError("os cálculos em lote precisam do pacote numpy (pip install numpy)")
+    return np
+
+
+def segundos_do_dia(instante, fuso=None):
+    """Segundos (com fração) desde a meia-noite local de `instante` (time.time()) no fuso dado."""
+    agora = datetime.fromtimestamp(instante, fuso)
+    return agora.hour * 3600 + agora.minute * 60 + agora.second + agora.microsecond / 1_000_000
+
+
+def indices_ponteiros(segundos, suave=False):
+    """
+    Posição de cada ponteiro nas tabelas (ver tabela_ponteiro).
+
+    Args:
+        segundos (float): Segundos desde a meia-noite local (segundos_do_dia).
+        suave (bool): Segundo com 60 posições por segundo (POSICOES_SEGUNDO_SUAVE).
+
+    Returns:
+        tuple[int, int, int]: Índices da hora (720), do minuto (3600) e do segundo (60 ou 3600).
+    """
+    inteiro = int(segundos)
+    segundo = int(segundos * 60) % POSICOES_SEGUNDO_SUAVE if suave else inteiro % POSICOES_SEGUNDO
+    return (inteiro // 60) % POSICOES_HORA, inteiro % POSICOES_MINUTO, segundo
+
+
+def angulos_ponteiros(segundos, suave=False):
+    """
+    Ângulo de cada ponteiro em graus, em sentido horário a partir das 12 horas.
+
+    A hora anda a cada minuto e o minuto a cada segundo; o segundo anda a cada
+    segundo ou, com `suave`, continuamente.
+    """
+    hora, minuto, segundo = indices_ponteiros(segundos)
+    if suave:
+        segundo = segundos % 60
+    return hora * 360 / POSICOES_HORA, minuto * 360 / POSICOES_MINUTO, segundo * 6
+
+
+@lru_cache(maxsize=32)
+def tabela_ponteiro(posicoes, comprimento, centro):
+    """
+    Pré-calcula as coordenadas de um ponteiro para cada posição discreta.
+
+    Args:
+        posicoes (int): Posições numa volta completa (60 para segundos, 720 para horas...).
+        comprimento (float): Comprimento do ponteiro.
+        centro (float): Coordenada x e y do centro do mostrador.
+
+    Returns:
+        tuple[tuple]: (x0, y0, x1, y1) de cada posição, começando às 12 horas.
+            A tabela é compartilhada entre os relógios do mesmo tamanho.
+    """
+    tabela = []
+    for i in range(posicoes):
+        angulo = 2 * math.pi * i / posicoes - math.pi / 2
+        tabela.append((centro, centro, centro + comprimento * math.cos(angulo),
+                       centro + comprimento * math.sin(angulo)))
+    return tuple(tabela)
+
+
+def marcacoes(raio, centro, recuo=RECUO_MARCACAO, quantidade=12):
+    """(x1, y1, x2, y2) de cada marcação das horas, de `raio - recuo` até `raio`."""
+    linhas = []
+    for i in range(quantidade):
+        angulo = 2 * math.pi * i / quantidade
+        linhas.append((centro + (raio - recuo) * math.cos(angulo),
+                       centro + (raio - recuo) * math.sin(angulo),
+                       centro + raio * math.cos(angulo), centro + raio * math.sin(angulo)))
+    return linhas
+
+
+def calcular_posicoes(instante, deslocamentos):
+    """
+    Calcula, num único lote, as posições dos ponteiros de vários relógios.
+
+    Vetorizado com numpy, quando instalado; senão, em Python puro.
+
+    Args:
+        instante (float): Hora UTC em segundos (time.time()), lida uma vez por tique.
+        deslocamentos: Deslocamento de cada relógio em relação ao UTC, em segundos.
+
+    Returns:
+        tuple: (indices_hora, indices_minuto, segundos), como em indices_ponteiros.
+    """
+    if carregar_numpy() is not None:
+        return indices_lote(instante, deslocamentos)
+    local = [math.floor(instante + deslocamento) for deslocamento in deslocamentos]
+    return ([(segundos // 60) % POSICOES_HORA for segundos in local],
+            [segundos % POSICOES_MINUTO for segundos in local],
+            [segundos % POSICOES_SEGUNDO for segundos in local])
+
+
+def indices_lote(instantes, deslocamentos=0, suave=False):
+    """
+    indices_ponteiros para arrays de instantes UTC (time.time()) e deslocamentos do UTC.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Índices da hora, do minuto e do segundo.
+    """
+    np = exigir_numpy()
+    local = np.asarray(instantes, dtype=np.float64) + np.asarray(deslocamentos, dtype=np.float64)
+    inteiro = np.floor(local).astype(np.int64)
+    if suave:
+        segundo = np.floor(local * 60).astype(np.int64) % POSICOES_SEGUNDO_SUAVE
+    else:
+        segundo = inteiro % POSICOES_SEGUNDO
+    return (inteiro // 60) % POSICOES_HORA, inteiro % POSICOES_MINUTO, segundo
+
+
+def angulos_lote(instantes, deslocamentos=0, suave=False):
+    """
+    Ângulos dos ponteiros em radianos (sentido horário a partir das 12 horas) para arrays de instantes.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Ângulos da hora, do minuto e do segundo.
+    """
+    np = exigir_numpy()
+    hora, minuto, segundo = indices_lote(instantes, deslocamentos)
+    if suave:
+        local = np.asarray(instantes, dtype=np.float64) + np.asarray(deslocamentos, dtype=np.float64)
+        segundo = np.mod(local, 60) / 60
+    else:
+        segundo = segundo / POSICOES_SEGUNDO
+    volta = 2 * np.pi
+    return hora * (volta / POSICOES_HORA), minuto * (volta / POSICOES_MINUTO), segundo * volta
+
+
+def pontas_lote(angulos, comprimento, centro):
+    """
+    Coordenadas (x, y) da ponta de um ponteiro para um array de ângulos (angulos_lote).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: x e y da ponta, com o eixo y para baixo.
+    """
+    np = exigir_numpy()
+    angulos = np.asarray(angulos, dtype=np.float64) - np.pi / 2
+    return centro + comprimento * np.cos(angulos), centro + comprimento * np.sin(angulos)
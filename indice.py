@@ -0,0 +1,134 @@
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+# caminho padrão do índice de vagas já vistas
+CAMINHO_INDICE = "vagas_vistas.sqlite3"
+
+NOVA = "nova"
+ALTERADA = "alterada"
+CONHECIDA = "conhecida"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS vagas (
+    chave TEXT PRIMARY KEY,
+    id_vaga TEXT,
+    link TEXT,
+    titulo TEXT,
+    empresa TEXT,
+    local TEXT,
+    assinatura TEXT NOT NULL,
+    primeira_vez TEXT NOT NULL,
+    ultima_vez TEXT NOT NULL
+)
+"""
+
+
+def chave_vaga(vaga):
+    """
+    Identifica a vaga pelo id ou, na falta dele, pelo link sem parâmetros.
+
+    Vagas sem id nem link têm chave vazia: não há como reconhecê-las depois, então
+    não entram no índice e são sempre tratadas como novas.
+    """
+    return vaga.get("id_vaga") or (vaga.get("link") or "").split("?")[0]
+
+
+def assinatura_vaga(vaga):
+    """Resumo dos campos visíveis; muda quando a vaga é alterada no site."""
+    texto = "\x1f".join(str(vaga.get(campo, "")) for campo in ("titulo", "empresa", "local"))
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+def _agora():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class IndiceVagas:
+    """
+    Índice em disco (SQLite) das vagas já coletadas, com data da primeira e da última vez vistas.
+
+    Pode ser compartilhado entre as threads do modo em lote.
+    """
+
+    def __init__(self, caminho=CAMINHO_INDICE):
+        """
+        Args:
+            caminho (str): Arquivo do banco SQLite; é criado se não existir.
+        """
+        self.caminho = caminho
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute(_ESQUEMA)
+        self._conexao.commit()
+        self._lock = threading.Lock()
+
+    def conhecidas(self, vagas):
+        """Retorna o conjunto de chaves das vagas que já estão no índice."""
+        chaves = [chave for chave in map(chave_vaga, vagas) if chave]
+        if not chaves:
+            return set()
+        marcadores = ",".join("?" * len(chaves))
+        with self._lock:
+            linhas = self._conexao.execute(
+                f"SELECT chave FROM vagas WHERE chave IN ({marcadores})", chaves
+            ).fetchall()
+        return {chave for (chave,) in linhas}
+
+    def todas_conhecidas(self, vagas):
+        """Indica se todas as vagas (e ao menos uma) já estão no índice; vagas sem chave nunca estão."""
+        return bool(vagas) and len(self.conhecidas(vagas)) == len({chave_vaga(v) for v in vagas})
+
+    def registrar(self, vagas):
+        """
+        Grava as vagas no índice, atualizando a data da última vez vistas.
+
+        Args:
+            vagas (list[dict]): Vagas extraídas da busca.
+
+        Returns:
+            list[str]: Situação de cada vaga, na mesma ordem: NOVA, ALTERADA ou CONHECIDA.
+        """
+        agora = _agora()
+        situacoes = []
+        with self._lock, self._conexao:
+            for vaga in vagas:
+                chave = chave_vaga(vaga)
+                if not chave:
+                    # sem chave, vagas diferentes se sobrescreveriam no índice
+                    situacoes.append(NOVA)
+                    continue
+                assinatura = assinatura_vaga(vaga)
+                linha = self._conexao.execute(
+                    "SELECT assinatura FROM vagas WHERE chave = ?", (chave,)
+                ).fetchone()
+                if linha is None:
+                    situacoes.append(NOVA)
+                    self._conexao.execute(
+                        "INSERT INTO vagas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (chave, vaga.get("id_vaga"), vaga.get("link"), vaga.get("titulo"),
+                         vaga.get("empresa"), vaga.get("local"), assinatura, agora, agora),
+                    )
+                else:
+                    situacoes.append(ALTERADA if linha[0] != assinatura else CONHECIDA)
+                    self._conexao.execute(
+                        "UPDATE vagas SET link = ?, titulo = ?, empresa = ?, local = ?,"
+                        " assinatura = ?, ultima_vez = ? WHERE chave = ?",
+                        (vaga.get("link"), vaga.get("titulo"), vaga.get("empresa"),
+                         vaga.get("local"), assinatura, agora, chave),
+                    )
+        return situacoes
+
+    def filtrar_novas(self, vagas):
+        """Registra as vagas e retorna só as novas ou alteradas."""
+        return [vaga for vaga, situacao in zip(vagas, self.registrar(vagas)) if situacao != CONHECIDA]
+
+    def fechar(self):
+        self._conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
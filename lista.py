@@ -1,24 +1,52 @@
-from time import sleep
+import argparse
+import asyncio
 import flet as ft
 
-def main(page: ft.Page):
-    page.title = "Auto-scrolling ListView"
+from lista_pipeline import alimentar, de_socket, saida_de_processo, seguir_arquivo
+from lista_streaming import ListaStreaming
 
-    
-    lv = ft.ListView(expand=1, spacing=10, padding=20, auto_scroll=True)
 
-    count = 1
+async def contar_linhas(inicio, quantidade, intervalo):
+    """Fonte de exemplo: uma linha numerada a cada `intervalo` segundos, sem bloquear a sessão."""
+    for count in range(inicio, inicio + quantidade):
+        await asyncio.sleep(intervalo)
+        yield f"Line {count}"
 
-    for i in range(0, 60):
-        lv.controls.append(ft.Text(f"Line {count}"))
-        count += 1
 
-    page.add(lv)
+def criar_fonte(args):
+    if args.arquivo:
+        return seguir_arquivo(args.arquivo, desde_inicio=True)
+    if args.comando:
+        return saida_de_processo(*args.comando)
+    if args.porta:
+        return de_socket(porta=args.porta)
+    return contar_linhas(61, 60, 1)
 
-    for i in range(0, 60):
-        sleep(1)
-        lv.controls.append(ft.Text(f"Line {count}"))
-        count += 1
-        page.update()
 
-ft.app(main)
\ No newline at end of file
+def criar_main(args):
+    async def main(page: ft.Page):
+        page.title = "Auto-scrolling ListView"
+
+        # só as últimas linhas ficam na lista
+        lv = ListaStreaming(max_linhas=args.max_linhas, expand=1, spacing=10, padding=20, auto_scroll=True)
+        lv.aplicar_lote([f"Line {count}" for count in range(1, 61)])
+        page.add(lv)
+
+        # a fonte alimenta a lista em lotes, no máximo uma atualização por quadro
+        await alimentar(criar_fonte(args), lv.aplicar_lote)
+
+    return main
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mostra um fluxo de linhas numa ListView.")
+    fonte = parser.add_mutually_exclusive_group()
+    fonte.add_argument("--arquivo", help="acompanha as linhas acrescentadas a um arquivo")
+    fonte.add_argument("--comando", nargs=argparse.REMAINDER, help="mostra a saída de um comando")
+    fonte.add_argument("--porta", type=int, help="recebe linhas por TCP em 127.0.0.1:PORTA")
+    parser.add_argument("--max-linhas", type=int, default=1000)
+    ft.app(criar_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import asyncio
+import inspect
+import os
+
+# tamanho da fila entre a fonte e a lista; cheia, ela segura a fonte (backpressure)
+TAMANHO_FILA = 10000
+# linhas entregues por lote e intervalo mínimo entre lotes (segundos)
+TAMANHO_LOTE = 1000
+INTERVALO_LOTE = 1 / 30
+
+_FIM = object()
+
+
+async def seguir_arquivo(caminho, desde_inicio=False, intervalo=0.25):
+    """
+    Lê as linhas acrescentadas a um arquivo, como `tail -f`.
+
+    Args:
+        caminho (str): Arquivo a acompanhar.
+        desde_inicio (bool): Entrega também as linhas que já existem.
+        intervalo (float): Espera entre verificações quando não há linhas novas.
+    """
+    with open(caminho, encoding="utf-8", errors="replace") as arquivo:
+        if not desde_inicio:
+            arquivo.seek(0, os.SEEK_END)
+        resto = ""
+        while True:
+            trecho = arquivo.readline()
+            if not trecho:
+                await asyncio.sleep(intervalo)
+                continue
+            resto += trecho
+            if resto.endswith("\n"):
+                yield resto.rstrip("\n")
+                resto = ""
+
+
+async def saida_de_processo(*comando):
+    """Executa o comando e entrega cada linha da saída padrão dele."""
+    processo = await asyncio.create_subprocess_exec(
+        *comando, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+    )
+    try:
+        async for linha in processo.stdout:
+            yield linha.decode("utf-8", errors="replace").rstrip("\n")
+    finally:
+        if processo.returncode is None:
+            processo.kill()
+        await processo.wait()
+
+
+async def de_socket(host="127.0.0.1", porta=9020, tamanho_fila=TAMANHO_FILA):
+    """
+    Abre um servidor TCP local e entrega as linhas recebidas de todas as conexões.
+
+    Ex.: `some_command | nc 127.0.0.1 9020`.
+    """
+    fila = asyncio.Queue(tamanho_fila)
+
+    async def atender(leitor, escritor):
+        try:
+            async for linha in leitor:
+                await fila.put(linha.decode("utf-8", errors="replace").rstrip("\n"))
+        finally:
+            escritor.close()
+
+    servidor = await asyncio.start_server(atender, host, porta)
+    try:
+        while True:
+            yield await fila.get()
+    finally:
+        servidor.close()
+        await servidor.wait_closed()
+
+
+async def alimentar(fonte, ao_lote, tamanho_fila=TAMANHO_FILA, tamanho_lote=TAMANHO_LOTE,
+                    intervalo=INTERVALO_LOTE):
+    """
+    Leva as linhas de uma fonte assíncrona até a lista em lotes.
+
+    A fonte escreve numa fila limitada; quando a fila enche, a fonte espera
+    (backpressure). O consumidor junta as linhas em lotes de até `tamanho_lote` e
+    entrega no máximo um lote por `intervalo`, então a lista recebe uma única
+    atualização por quadro. Tudo roda no event loop, sem uma thread por sessão.
+
+    Args:
+        fonte: Iterável assíncrono de linhas (gerador assíncrono, seguir_arquivo,
+            saida_de_processo, de_socket...).
+        ao_lote (callable): Recebe cada lote (list[str]); pode ser uma corrotina.
+        tamanho_fila (int): Capacidade da fila entre a fonte e o consumidor.
+        tamanho_lote (int): Máximo de linhas por lote.
+        intervalo (float): Intervalo mínimo entre lotes, em segundos.
+
+    Returns:
+        int: Quantidade de linhas entregues.
+    """
+    fila = asyncio.Queue(tamanho_fila)
+    loop = asyncio.get_running_loop()
+
+    async def produzir():
+        try:
+            async for linha in fonte:
+                await fila.put(linha)
+        except Exception:
+            # avisa o consumidor; a exceção da fonte sobe para quem chamou alimentar()
+            await fila.put(_FIM)
+            raise
+        await fila.put(_FIM)
+
+    produtor = asyncio.create_task(produzir())
+    entregues = 0
+    proximo = 0.0
+    terminou = False
+    try:
+        while not terminou:
+            linha = await fila.get()
+            if linha is _FIM:
+                break
+            espera = proximo - loop.time()
+            if espera > 0:
+                # as linhas que chegarem durante a espera entram no mesmo lote
+                await asyncio.sleep(espera)
+            lote = [linha]
+            while len(lote) < tamanho_lote and not fila.empty():
+                linha = fila.get_nowait()
+                if linha is _FIM:
+                    terminou = True
+                    break
+                lote.append(linha)
+            resultado = ao_lote(lote)
+            if inspect.isawaitable(resultado):
+                await resultado
+            entregues += len(lote)
+            proximo = loop.time() + intervalo
+    finally:
+        produtor.cancel()
+        try:
+            await produtor
+        except asyncio.CancelledError:
+            pass
+    return entregues
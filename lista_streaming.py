@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import deque
+
+import flet as ft
+
+# quantidade máxima de linhas mantidas na lista
+MAX_LINHAS = 1000
+# intervalo mínimo entre duas atualizações enviadas ao cliente (segundos)
+INTERVALO_QUADRO = 1 / 30
+
+
+class ListaStreaming(ft.ListView):
+    """
+    ListView para fluxos longos de linhas (ex.: log ao vivo).
+
+    As linhas adicionadas são acumuladas e enviadas ao cliente em no máximo uma
+    atualização por intervalo de quadro, e só as `max_linhas` mais recentes ficam
+    na lista: as mais antigas são descartadas, como num buffer circular. Assim a
+    memória e o custo de cada atualização não crescem com a duração do fluxo.
+    """
+
+    def __init__(self, max_linhas=MAX_LINHAS, intervalo=INTERVALO_QUADRO, criar_controle=None, **kwargs):
+        """
+        Args:
+            max_linhas (int): Linhas mantidas na lista; as mais antigas são removidas.
+            intervalo (float): Intervalo mínimo entre atualizações, em segundos.
+            criar_controle (callable | None): Converte uma linha em controle. Padrão: ft.Text.
+            **kwargs: Repassados ao ft.ListView (expand, spacing, padding, auto_scroll...).
+        """
+        super().__init__(**kwargs)
+        self.max_linhas = max_linhas
+        self.intervalo = intervalo
+        self.criar_controle = criar_controle or ft.Text
+        self.linhas_recebidas = 0
+        self.atualizacoes = 0
+        # linhas que chegaram depois da última atualização; além de max_linhas seriam descartadas de qualquer jeito
+        self._pendentes = deque(maxlen=max_linhas)
+        self._condicao = threading.Condition()
+        self._trabalhador = None
+        self._parado = False
+
+    def adicionar(self, linha):
+        """Enfileira uma linha para a próxima atualização. Pode ser chamado de qualquer thread."""
+        self.adicionar_varias((linha,))
+
+    def adicionar_varias(self, linhas):
+        """Enfileira várias linhas para a próxima atualização."""
+        linhas = list(linhas)
+        with self._condicao:
+            self._pendentes.extend(linhas)
+            self.linhas_recebidas += len(linhas)
+            if self._trabalhador is None:
+                self._trabalhador = threading.Thread(target=self._trabalhar, daemon=True)
+                self._trabalhador.start()
+            self._condicao.notify()
+
+    def _trabalhar(self):
+        proxima = 0.0
+        while True:
+            with self._condicao:
+                while not self._pendentes and not self._parado:
+                    self._condicao.wait()
+                if self._parado:
+                    return
+            # espera o intervalo do quadro, juntando as linhas que chegarem nesse tempo
+            espera = proxima - time.monotonic()
+            if espera > 0:
+                time.sleep(espera)
+            self.descarregar()
+            proxima = time.monotonic() + self.intervalo
+
+    def aplicar_lote(self, linhas):
+        """
+        Acrescenta as linhas e atualiza a lista na hora, sem a thread de atualização.
+
+        Para quem já junta as linhas em lotes por quadro, como lista_pipeline.alimentar.
+        """
+        with self._condicao:
+            self._pendentes.extend(linhas)
+            self.linhas_recebidas += len(linhas)
+        self.descarregar()
+
+    def descarregar(self):
+        """
+        Aplica as linhas pendentes à lista e envia uma única atualização ao cliente.
+
+        A thread de atualização, aplicar_lote e parar podem chamar ao mesmo tempo; o
+        lock do buffer também protege `controls`, para que as linhas entrem em ordem.
+        """
+        with self._condicao:
+            if not self._pendentes:
+                return
+            linhas = list(self._pendentes)
+            self._pendentes.clear()
+            self.controls.extend(self.criar_controle(linha) for linha in linhas)
+            excesso = len(self.controls) - self.max_linhas
+            if excesso > 0:
+                del self.controls[:excesso]
+            self.atualizacoes += 1
+            if self.page is not None:
+                self.update()
+
+    def parar(self):
+        """Encerra a thread de atualização depois de enviar as linhas pendentes."""
+        with self._condicao:
+            self._parado = True
+            self._condicao.notify()
+        self.descarregar()
@@ -0,0 +1,177 @@
+import cProfile
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+# funções chamadas com cada evento (fase concluída e resumo final) de qualquer medidor
+GANCHOS = []
+
+_ativo = None
+
+
+def registrar_gancho(funcao):
+    """
+    Registra uma função que recebe cada evento de medição (um dicionário).
+
+    Os eventos têm a chave "tipo": "fase" ao fim de cada fase e "resumo" ao fim da execução.
+    Útil para repassar as métricas a um sistema de monitoramento.
+    """
+    GANCHOS.append(funcao)
+    return funcao
+
+
+class Medidor:
+    """
+    Mede uma execução do scraper: duração de cada fase e comandos enviados ao WebDriver.
+
+    Pode ser usado por várias threads ao mesmo tempo (modo em lote).
+    """
+
+    def __init__(self, nome="busca", **atributos):
+        """
+        Args:
+            nome (str): Nome da execução no relatório.
+            **atributos: Informações extras gravadas no resumo (ex.: palavras chave).
+        """
+        self.nome = nome
+        self.atributos = atributos
+        self.data = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.inicio = time.perf_counter()
+        self.fases = []
+        self.comandos = defaultdict(lambda: [0, 0.0])  # comando -> [vezes, segundos]
+        self.contadores = defaultdict(int)
+        self.ganchos = []
+        self._lock = threading.Lock()
+
+    def _emitir(self, evento):
+        for gancho in self.ganchos + GANCHOS:
+            try:
+                gancho(evento)
+            except Exception as erro:
+                print(f"gancho de métricas falhou: {erro!r}")
+
+    @contextmanager
+    def fase(self, nome, **atributos):
+        """Mede o bloco como uma fase (navegação, espera, rolagem, extração, gravação...)."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            fim = time.perf_counter()
+            evento = {
+                "tipo": "fase",
+                "execucao": self.nome,
+                "fase": nome,
+                "inicio_s": round(inicio - self.inicio, 6),
+                "duracao_s": round(fim - inicio, 6),
+                "thread": threading.current_thread().name,
+                **atributos,
+            }
+            with self._lock:
+                self.fases.append(evento)
+            self._emitir(evento)
+
+    def contar(self, nome, quantidade=1):
+        """Soma `quantidade` ao contador `nome` (ex.: vagas extraídas)."""
+        with self._lock:
+            self.contadores[nome] += quantidade
+
+    def instrumentar(self, browser):
+        """Conta e cronometra cada comando que o navegador envia ao WebDriver."""
+        executar = browser.execute
+
+        def execute(comando, params=None):
+            inicio = time.perf_counter()
+            try:
+                return executar(comando, params)
+            finally:
+                duracao = time.perf_counter() - inicio
+                with self._lock:
+                    contagem = self.comandos[comando]
+                    contagem[0] += 1
+                    contagem[1] += duracao
+
+        browser.execute = execute
+        return browser
+
+    @property
+    def total_comandos(self):
+        with self._lock:
+            return sum(vezes for vezes, _ in self.comandos.values())
+
+    def resumo(self):
+        """Totais por fase e por comando do WebDriver."""
+        with self._lock:
+            fases = {}
+            for evento in self.fases:
+                total = fases.setdefault(evento["fase"], {"vezes": 0, "total_s": 0.0, "max_s": 0.0})
+                total["vezes"] += 1
+                total["total_s"] += evento["duracao_s"]
+                total["max_s"] = max(total["max_s"], evento["duracao_s"])
+            for total in fases.values():
+                total["total_s"] = round(total["total_s"], 6)
+            comandos = {
+                comando: {"vezes": vezes, "total_s": round(segundos, 6)}
+                for comando, (vezes, segundos) in sorted(self.comandos.items())
+            }
+            return {
+                "tipo": "resumo",
+                "execucao": self.nome,
+                "data": self.data,
+                "duracao_s": round(time.perf_counter() - self.inicio, 6),
+                "fases": fases,
+                "comandos": comandos,
+                "comandos_total": sum(c["vezes"] for c in comandos.values()),
+                "contadores": dict(self.contadores),
+                **self.atributos,
+            }
+
+    def finalizar(self, relatorio=None):
+        """
+        Emite o resumo aos ganchos e, se pedido, acrescenta a execução ao relatório NDJSON.
+
+        O relatório recebe uma linha por fase e uma linha de resumo por execução, então
+        execuções sucessivas no mesmo arquivo podem ser comparadas.
+        """
+        resumo = self.resumo()
+        self._emitir(resumo)
+        if relatorio:
+            with open(relatorio, "a", encoding="utf-8") as arquivo:
+                for evento in self.fases + [resumo]:
+                    arquivo.write(json.dumps(evento, ensure_ascii=False) + "\n")
+        return resumo
+
+
+def ativar(medidor):
+    """Define o medidor usado pelas funções fase() e contar() deste módulo."""
+    global _ativo
+    _ativo = medidor
+    return medidor
+
+
+def fase(nome, **atributos):
+    """Mede o bloco no medidor ativo; sem medidor ativo, não faz nada."""
+    return _ativo.fase(nome, **atributos) if _ativo is not None else nullcontext()
+
+
+def contar(nome, quantidade=1):
+    if _ativo is not None:
+        _ativo.contar(nome, quantidade)
+
+
+@contextmanager
+def perfilar(caminho=None):
+    """Roda o bloco sob o cProfile e grava as estatísticas em `caminho` (sem caminho, não faz nada)."""
+    if not caminho:
+        yield
+        return
+    perfil = cProfile.Profile()
+    perfil.enable()
+    try:
+        yield
+    finally:
+        perfil.disable()
+        perfil.dump_stats(caminho)
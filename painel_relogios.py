@@ -0,0 +1,135 @@
+import argparse
+import time
+import tkinter as tk
+from datetime import datetime
+
+from agendador import AgendadorTk
+from geometria_relogio import calcular_posicoes, carregar_numpy
+from relogio_class import RelogioAnalogico, obter_fuso
+
+
+class PainelRelogios:
+    """
+    Parede de relógios analógicos, um por fuso horário, movidos por um único tique.
+
+    A cada tique a hora é lida uma vez, as posições de todos os relógios são
+    calculadas num lote (vetorizado com numpy, quando instalado) e só os relógios
+    com algum ponteiro visível em posição nova recebem comandos do canvas.
+    """
+
+    def __init__(self, root, fusos, tamanho=120, colunas=8, criar_canvas=None):
+        """
+        Args:
+            root (tk.Tk | tk.Frame): Onde os relógios são dispostos em grade.
+            fusos (list): Fuso de cada relógio (nome IANA, tzinfo ou None para o local).
+            tamanho (int): Tamanho de cada mostrador, em pixels.
+            colunas (int): Relógios por linha.
+            criar_canvas (callable | None): Cria o canvas de cada relógio; padrão: tk.Canvas
+                posicionado na grade. Útil para medir sem interface (ver benchmark_relogios.py).
+        """
+        self.root = root
+        self.fusos = [obter_fuso(fuso) for fuso in fusos]
+        self.relogios = []
+        for numero, fuso in enumerate(self.fusos):
+            if criar_canvas is None:
+                canvas = tk.Canvas(root, width=tamanho, height=tamanho, bg="white", highlightthickness=0)
+                canvas.grid(row=numero // colunas, column=numero % colunas)
+            else:
+                canvas = criar_canvas(tamanho)
+            self.relogios.append(RelogioAnalogico(root, tamanho=tamanho, fuso=fuso, canvas=canvas))
+        self._minuto_deslocamentos = None
+        self._deslocamentos = []
+        self._anteriores = None
+        self.relogios_atualizados = 0
+
+    def deslocamentos(self, instante):
+        """
+        Deslocamento de cada relógio em relação ao UTC, em segundos.
+
+        Recalculado só quando o minuto muda (mudanças de horário de verão caem na
+        virada de um minuto) e uma única vez por fuso distinto.
+        """
+        minuto = int(instante // 60)
+        if minuto != self._minuto_deslocamentos:
+            por_fuso = {}
+            for fuso in self.fusos:
+                if fuso not in por_fuso:
+                    if fuso is None:
+                        agora = datetime.fromtimestamp(instante).astimezone()
+                    else:
+                        agora = datetime.fromtimestamp(instante, fuso)
+                    por_fuso[fuso] = agora.utcoffset().total_seconds()
+            self._deslocamentos = [por_fuso[fuso] for fuso in self.fusos]
+            self._minuto_deslocamentos = minuto
+        return self._deslocamentos
+
+    def atualizar(self, instante=None):
+        """
+        Move os ponteiros de todos os relógios para a hora atual (ou `instante`).
+
+        Returns:
+            int: Quantidade de relógios que receberam algum comando do canvas.
+        """
+        instante = time.time() if instante is None else instante
+        horas, minutos, segundos = calcular_posicoes(instante, self.deslocamentos(instante))
+        np = carregar_numpy()
+        if np is not None:
+            atuais = np.stack((horas, minutos, segundos), axis=1)
+            if self._anteriores is None or len(self._anteriores) != len(atuais):
+                mudaram = range(len(atuais))
+            else:
+                mudaram = np.flatnonzero((atuais != self._anteriores).any(axis=1)).tolist()
+            self._anteriores = atuais
+            posicoes = atuais.tolist()
+        else:
+            posicoes = list(zip(horas, minutos, segundos))
+            mudaram = [i for i, (relogio, posicao) in enumerate(zip(self.relogios, posicoes))
+                       if relogio._posicoes != list(posicao)]
+        for i in mudaram:
+            self.relogios[i].posicionar(*posicoes[i])
+        self.relogios_atualizados = len(mudaram)
+        return self.relogios_atualizados
+
+    def iniciar(self, agendador):
+        """
+        Atualiza o painel a cada virada de segundo.
+
+        Args:
+            agendador (AgendadorTk): Agendador compartilhado da janela.
+
+        Returns:
+            Tique: Use tique.cancelar() para parar o painel.
+        """
+        return agendador.a_cada_segundo(self.atualizar)
+
+
+FUSOS_EXEMPLO = [
+    None, "America/Sao_Paulo", "America/New_York", "America/Los_Angeles", "Europe/London",
+    "Europe/Berlin", "Africa/Johannesburg", "Asia/Kolkata", "Asia/Shanghai", "Asia/Tokyo",
+    "Australia/Sydney", "Pacific/Auckland",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Painel de relógios analógicos, um por fuso.")
+    parser.add_argument("fusos", nargs="*", help="fusos IANA (ex.: Europe/Lisbon); padrão: uma volta ao mundo")
+    parser.add_argument("--tamanho", type=int, default=120)
+    parser.add_argument("--colunas", type=int, default=6)
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.title("Relógios do Mundo")
+    painel = PainelRelogios(root, args.fusos or FUSOS_EXEMPLO, tamanho=args.tamanho, colunas=args.colunas)
+    agendador = AgendadorTk(root)
+    painel.iniciar(agendador)
+
+    def fechar():
+        agendador.parar()
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", fechar)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import atexit
+import json
+import time
+from array import array
+from datetime import datetime, timezone
+
+# capacidade padrão do buffer circular (tiques mais recentes mantidos)
+CAPACIDADE = 4096
+# limites (ms) das faixas do histograma; a última faixa vai até o infinito
+FAIXAS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+PERCENTIS = (50, 90, 99, 99.9)
+
+
+def percentil(ordenados, p):
+    """Percentil `p` (0 a 100) de uma lista já ordenada, pelo método do posto mais próximo."""
+    if not ordenados:
+        return None
+    posto = max(1, -(-len(ordenados) * p // 100))
+    return ordenados[int(posto) - 1]
+
+
+def histograma(valores, faixas=FAIXAS_MS):
+    """Contagem de valores por faixa: {"<=0.5": n, ..., ">1000": n}."""
+    contagens = [0] * (len(faixas) + 1)
+    for valor in valores:
+        for i, limite in enumerate(faixas):
+            if valor <= limite:
+                contagens[i] += 1
+                break
+        else:
+            contagens[-1] += 1
+    rotulos = [f"<={limite:g}" for limite in faixas] + [f">{faixas[-1]:g}"]
+    return dict(zip(rotulos, contagens))
+
+
+class RegistroTiques:
+    """
+    Registra, para cada tique de um relógio, quando ele foi agendado, quando o
+    callback realmente rodou e quanto tempo o desenho levou.
+
+    Os dados ficam num buffer circular de tamanho fixo (arrays de floats
+    pré-alocados), então o custo por tique é constante e a memória não cresce
+    com o tempo de execução. Os instantes usam time.perf_counter().
+    """
+
+    def __init__(self, nome="relogio", capacidade=CAPACIDADE):
+        """
+        Args:
+            nome (str): Nome do relógio no resumo.
+            capacidade (int): Quantidade de tiques mantidos; os mais antigos são sobrescritos.
+        """
+        self.nome = nome
+        self.capacidade = capacidade
+        self.total = 0
+        self._previstos = array("d", bytes(8 * capacidade))
+        self._reais = array("d", bytes(8 * capacidade))
+        self._duracoes = array("d", bytes(8 * capacidade))
+
+    def registrar(self, previsto, real, duracao):
+        """
+        Registra um tique.
+
+        Args:
+            previsto (float): Instante para o qual o callback foi agendado.
+            real (float): Instante em que o callback começou a rodar.
+            duracao (float): Duração do desenho, em segundos.
+        """
+        i = self.total % self.capacidade
+        self._previstos[i] = previsto
+        self._reais[i] = real
+        self._duracoes[i] = duracao
+        self.total += 1
+
+    def medir(self, previsto, desenhar, *args):
+        """Chama `desenhar(*args)` e registra o tique agendado para `previsto`."""
+        real = time.perf_counter()
+        try:
+            return desenhar(*args)
+        finally:
+            self.registrar(previsto, real, time.perf_counter() - real)
+
+    def _validos(self):
+        quantidade = min(self.total, self.capacidade)
+        return range(quantidade)
+
+    def atrasos_ms(self):
+        """Atraso de cada tique mantido (real - previsto), em ms; negativo se adiantado."""
+        return [(self._reais[i] - self._previstos[i]) * 1000 for i in self._validos()]
+
+    def duracoes_ms(self):
+        return [self._duracoes[i] * 1000 for i in self._validos()]
+
+    def resumo(self):
+        """Percentis e histogramas do atraso e da duração dos tiques mantidos."""
+        partes = {}
+        for chave, valores in (("atraso_ms", self.atrasos_ms()), ("duracao_ms", self.duracoes_ms())):
+            ordenados = sorted(valores)
+            partes[chave] = {
+                "media": round(sum(ordenados) / len(ordenados), 4) if ordenados else None,
+                "min": round(ordenados[0], 4) if ordenados else None,
+                "max": round(ordenados[-1], 4) if ordenados else None,
+                **{f"p{p:g}": round(percentil(ordenados, p), 4) if ordenados else None for p in PERCENTIS},
+                "histograma": histograma(ordenados),
+            }
+        return {
+            "relogio": self.nome,
+            "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "tiques": self.total,
+            "mantidos": min(self.total, self.capacidade),
+            **partes,
+        }
+
+    def gravar(self, caminho):
+        """Grava o resumo em JSON."""
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(self.resumo(), arquivo, ensure_ascii=False, indent=2)
+
+    def gravar_ao_sair(self, caminho):
+        """Grava o resumo em `caminho` quando o programa terminar."""
+        atexit.register(self.gravar, caminho)
+        return self
@@ -1,16 +1,21 @@
+import argparse
 import tkinter as tk
 from datetime import datetime
-import asyncio
-import threading
+from agendador import AgendadorTk
+from registro_tiques import RegistroTiques
+from varredura import FPS_PADRAO
 from relogio_class import RelogioAnalogico  # Suponha que o código do relógio está em relogio_class.py
 
 class Aplicacao:
-    def __init__(self, root):
+    def __init__(self, root, fps=None, registro=None):
         """
         Inicializa a aplicação com um relógio analógico e a hora digital.
 
         Args:
             root (tk.Tk): Janela principal da aplicação.
+            fps (int | None): Com um valor, o ponteiro de segundos varre suavemente
+                nessa taxa de quadros em vez de andar a cada segundo.
+            registro (RegistroTiques | None): Registra o atraso e a duração de cada tique.
         """
         self.root = root
         self.root.title("Exemplo de Relógio com Tkinter")
@@ -26,25 +31,47 @@ class Aplicacao:
         self.btn_atualizar = tk.Button(root, text="Atualizar Hora Digital", command=self.atualizar_hora_digital)
         self.btn_atualizar.pack(pady=10)
 
-        # Inicia o relógio analógico em um thread separado para evitar bloqueio
-        threading.Thread(target=self.iniciar_relogio_analogico, daemon=True).start()
+        # Um único agendador na thread do Tk: os dois relógios andam na virada de cada segundo
+        self.agendador = AgendadorTk(root, registro=registro)
+        self.root.protocol("WM_DELETE_WINDOW", self.fechar)
+
+        # O relógio analógico roda como corrotina no próprio loop do Tk, sem thread separada
+        if fps:
+            self.relogio.iniciar_suave(fps, registro=registro)
+        else:
+            self.iniciar_relogio_analogico()
 
         # Inicia a atualização da hora digital
-        self.atualizar_hora_digital()
+        self.tique_digital = self.agendador.a_cada_segundo(self.atualizar_hora_digital)
 
     def atualizar_hora_digital(self):
         """Atualiza o rótulo de hora digital com a hora atual."""
         hora_atual = datetime.now().strftime("%H:%M:%S")
         self.hora_digital.config(text=f"Hora Digital: {hora_atual}")
-        # Agenda a próxima atualização em 1 segundo
-        self.root.after(1000, self.atualizar_hora_digital)
 
     def iniciar_relogio_analogico(self):
         """Inicia o relógio analógico no modo assíncrono."""
-        asyncio.run(self.relogio.iniciar_relogio())
+        self.tarefa_relogio = self.agendador.executar(self.relogio.iniciar_relogio(self.agendador))
 
-# Inicializa a aplicação
-if __name__ == "__main__":
+    def fechar(self):
+        """Cancela os tiques e a corrotina do relógio antes de fechar a janela."""
+        self.relogio.parar_suave()
+        self.agendador.parar()
+        self.root.destroy()
+
+def main():
+    parser = argparse.ArgumentParser(description="Relógio analógico e digital com Tkinter.")
+    parser.add_argument("--suave", type=int, nargs="?", const=FPS_PADRAO, default=None, metavar="FPS",
+                        help=f"ponteiro de segundos em varredura suave (padrão: {FPS_PADRAO} quadros por segundo)")
+    parser.add_argument("--medir-tiques", metavar="ARQUIVO",
+                        help="grava ao sair um JSON com o atraso e a duração dos tiques")
+    args = parser.parse_args()
+
+    registro = RegistroTiques("relogio.py").gravar_ao_sair(args.medir_tiques) if args.medir_tiques else None
     root = tk.Tk()
-    app = Aplicacao(root)
+    app = Aplicacao(root, fps=args.suave, registro=registro)
     root.mainloop()
+
+# Inicializa a aplicação
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,163 @@
 import tkinter as tk
-from datetime import datetime
 import math
-import asyncio
+import time
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from agendador import ms_ate_proximo_segundo
+from geometria_relogio import (
+    POSICOES_HORA, POSICOES_MINUTO, POSICOES_SEGUNDO, POSICOES_SEGUNDO_SUAVE, PROPORCAO_HORA,
+    PROPORCAO_MINUTO, PROPORCAO_SEGUNDO, RECUO_MARCACAO, indices_ponteiros, marcacoes,
+    segundos_do_dia, tabela_ponteiro,
+)
+from varredura import FPS_PADRAO, Varredura
+
+# espera (ms) sem novos eventos <Configure> antes de redesenhar no novo tamanho
+ATRASO_REDIMENSIONAR_MS = 120
+# abaixo disso o mostrador não cabe (raio = tamanho // 2 - 20)
+TAMANHO_MINIMO = 60
+# fator de superamostragem do mostrador desenhado com o Pillow (bordas suavizadas)
+SUPERAMOSTRAGEM = 4
+
+
+@lru_cache(maxsize=16)
+def imagem_mostrador(tamanho, janela):
+    """
+    Desenha o mostrador de um tamanho numa imagem, uma única vez.
+
+    O cache é compartilhado por todos os relógios: instâncias do mesmo tamanho
+    reutilizam a mesma imagem, e os tamanhos menos usados recentemente são
+    descartados (quem ainda exibe uma imagem descartada guarda a própria referência).
+
+    Args:
+        tamanho (int): Tamanho do mostrador em pixels.
+        janela (tk.Misc): Janela de nível superior dona da imagem.
+
+    Returns:
+        ImageTk.PhotoImage | None: None sem o Pillow instalado; nesse caso o
+            mostrador é desenhado com itens vetoriais do canvas.
+    """
+    try:
+        from PIL import Image, ImageDraw, ImageTk
+    except ImportError:
+        return None
+
+    escala = SUPERAMOSTRAGEM
+    lado = tamanho * escala
+    raio = (tamanho // 2 - 20) * escala
+    imagem = Image.new("RGB", (lado, lado), "white")
+    desenho = ImageDraw.Draw(imagem)
+    desenho.ellipse((10 * escala, 10 * escala, lado - 10 * escala, lado - 10 * escala),
+                    outline="black", width=4 * escala)
+    for linha in marcacoes(raio, lado / 2, RECUO_MARCACAO * escala):
+        desenho.line(linha, fill="black", width=2 * escala)
+    imagem = imagem.resize((tamanho, tamanho), Image.LANCZOS)
+    return ImageTk.PhotoImage(imagem, master=janela)
+
+
+def obter_fuso(fuso):
+    """Converte o nome de um fuso ("America/Sao_Paulo") em tzinfo; None é o fuso local."""
+    return ZoneInfo(fuso) if isinstance(fuso, str) else fuso
+
 
 class RelogioAnalogico:
-    def __init__(self, root, tamanho=400):
+    def __init__(self, root, tamanho=400, fuso=None, canvas=None):
         """
         Inicializa o relógio analógico dentro de um widget Tkinter.
 
         Args:
             root (tk.Tk | tk.Frame): Janela ou frame principal onde o relógio será exibido.
             tamanho (int): Tamanho do mostrador do relógio em pixels. Padrão é 400.
+            fuso (str | tzinfo | None): Fuso horário exibido. Padrão é o fuso local.
+            canvas (tk.Canvas | None): Canvas já posicionado por quem chama (ex.: PainelRelogios).
+                Sem ele, o relógio cria o próprio canvas, que acompanha o tamanho de `root`.
         """
         self.root = root
         self.tamanho = tamanho
+        self.fuso = obter_fuso(fuso)
         self.raio = tamanho // 2 - 20  # Raio do mostrador para centralizar o relógio
-        self.canvas = tk.Canvas(root, width=tamanho, height=tamanho, bg="white")
-        self.canvas.pack()
+        if canvas is None:
+            canvas = tk.Canvas(root, width=tamanho, height=tamanho, bg="white", highlightthickness=0)
+            canvas.pack(fill="both", expand=True)
+        self.canvas = canvas
+        self._imagem_mostrador = None
+        self._redimensionamento = None
+        self.varredura = None
+
+        # Os ponteiros são criados uma única vez e depois só reposicionados com coords
+        self.ponteiro_hora = self.desenhar_ponteiro(-math.pi / 2, self.raio * PROPORCAO_HORA, "black", 6)
+        self.ponteiro_minuto = self.desenhar_ponteiro(-math.pi / 2, self.raio * PROPORCAO_MINUTO, "blue", 4)
+        self.ponteiro_segundo = self.desenhar_ponteiro(-math.pi / 2, self.raio * PROPORCAO_SEGUNDO, "red", 2)
+        self._posicoes = [None, None, None]
+
+        self.ajustar_tamanho(tamanho)
+        self.canvas.bind("<Configure>", self._ao_configurar)
+
+    def ajustar_tamanho(self, tamanho):
+        """
+        Redesenha o relógio em outro tamanho.
+
+        Args:
+            tamanho (int): Novo tamanho do mostrador em pixels.
+        """
+        self.tamanho = tamanho
+        self.raio = tamanho // 2 - 20
+
+        # Tabelas com as posições possíveis (ver geometria_relogio); o segundo anda
+        # 60 vezes por segundo na varredura suave.
+        # Comprimentos dos ponteiros proporcionais ao tamanho do mostrador
+        centro = self.tamanho / 2
+        posicoes_segundo = POSICOES_SEGUNDO_SUAVE if self.varredura is not None else POSICOES_SEGUNDO
+        self.tabela_hora = tabela_ponteiro(POSICOES_HORA, self.raio * PROPORCAO_HORA, centro)
+        self.tabela_minuto = tabela_ponteiro(POSICOES_MINUTO, self.raio * PROPORCAO_MINUTO, centro)
+        self.tabela_segundo = tabela_ponteiro(posicoes_segundo, self.raio * PROPORCAO_SEGUNDO, centro)
 
-        # Desenhar o mostrador uma única vez
         self.desenhar_mostrador()
 
+        # Reposiciona os ponteiros já exibidos com as novas tabelas
+        posicoes = self._posicoes
+        self._posicoes = [None, None, None]
+        if None not in posicoes:
+            self.posicionar(*posicoes)
+
+    def _ao_configurar(self, evento):
+        # Arrastar a borda da janela gera um evento por pixel: só redesenha quando
+        # os eventos param por ATRASO_REDIMENSIONAR_MS
+        if self._redimensionamento is not None:
+            self.canvas.after_cancel(self._redimensionamento)
+        self._redimensionamento = self.canvas.after(
+            ATRASO_REDIMENSIONAR_MS, self._redimensionar, evento.width, evento.height
+        )
+
+    def _redimensionar(self, largura, altura):
+        self._redimensionamento = None
+        tamanho = max(min(largura, altura), TAMANHO_MINIMO)
+        if tamanho != self.tamanho:
+            self.ajustar_tamanho(tamanho)
+
     def desenhar_mostrador(self):
         """Desenha o mostrador do relógio, incluindo marcações para as horas."""
-        # Desenhar o círculo do mostrador
-        self.canvas.create_oval(10, 10, self.tamanho-10, self.tamanho-10, outline="black", width=4)
-
-        # Desenhar as marcações das horas
-        for i in range(12):
-            angulo = math.radians(i * 30)
-            x1 = self.tamanho / 2 + (self.raio - 20) * math.cos(angulo)
-            y1 = self.tamanho / 2 + (self.raio - 20) * math.sin(angulo)
-            x2 = self.tamanho / 2 + self.raio * math.cos(angulo)
-            y2 = self.tamanho / 2 + self.raio * math.sin(angulo)
-            self.canvas.create_line(x1, y1, x2, y2, fill="black", width=2)
+        self.canvas.delete("mostrador")
+
+        # Mostrador já desenhado numa imagem, compartilhada pelos relógios do mesmo tamanho
+        # (só num canvas Tk de verdade e com o Pillow instalado)
+        imagem = None
+        if hasattr(self.canvas, "winfo_toplevel"):
+            imagem = imagem_mostrador(self.tamanho, self.canvas.winfo_toplevel())
+        self._imagem_mostrador = imagem
+        if imagem is not None:
+            self.canvas.create_image(0, 0, image=imagem, anchor="nw", tags="mostrador")
+        else:
+            # Desenhar o círculo do mostrador
+            self.canvas.create_oval(10, 10, self.tamanho-10, self.tamanho-10, outline="black", width=4,
+                                    tags="mostrador")
+
+            # Desenhar as marcações das horas
+            for linha in marcacoes(self.raio, self.tamanho / 2):
+                self.canvas.create_line(*linha, fill="black", width=2, tags="mostrador")
+
+        # O mostrador é redesenhado por baixo dos ponteiros existentes
+        self.canvas.tag_raise("ponteiro")
 
     def desenhar_ponteiro(self, angulo, comprimento, cor, largura):
         """
@@ -54,33 +178,101 @@ class RelogioAnalogico:
 
     def atualizar_ponteiros(self):
         """Atualiza a posição dos ponteiros de hora, minuto e segundo com base no horário atual."""
-        self.canvas.delete("ponteiro")  # Limpa os ponteiros antigos
+        self.posicionar(*indices_ponteiros(segundos_do_dia(time.time(), self.fuso)))
 
-        agora = datetime.now()
-        hora = agora.hour % 12
-        minuto = agora.minute
-        segundo = agora.second
+    def desenhar_instante(self, instante):
+        """
+        Posiciona os ponteiros em `instante` (time.time()), com o segundo em frações de segundo.
 
-        # Ângulos dos ponteiros em radianos
-        angulo_hora = math.radians((hora + minuto / 60) * 30 - 90)
-        angulo_minuto = math.radians((minuto + segundo / 60) * 6 - 90)
-        angulo_segundo = math.radians(segundo * 6 - 90)
+        Usado pela varredura suave; só os ponteiros que mudaram de posição são movidos.
+        """
+        self.posicionar(*indices_ponteiros(segundos_do_dia(instante, self.fuso), suave=True))
 
-        # Comprimentos dos ponteiros proporcionais ao tamanho do mostrador
-        comprimento_hora = self.raio * 0.5
-        comprimento_minuto = self.raio * 0.7
-        comprimento_segundo = self.raio * 0.9
+    def posicionar(self, indice_hora, indice_minuto, segundo):
+        """
+        Move os ponteiros para as posições dadas (índices nas tabelas).
+
+        Só os ponteiros que mudaram de posição são movidos.
+        """
+        posicoes = self._posicoes
+        if posicoes[0] != indice_hora:
+            posicoes[0] = indice_hora
+            self.canvas.coords(self.ponteiro_hora, *self.tabela_hora[indice_hora])
+        if posicoes[1] != indice_minuto:
+            posicoes[1] = indice_minuto
+            self.canvas.coords(self.ponteiro_minuto, *self.tabela_minuto[indice_minuto])
+        if posicoes[2] != segundo:
+            posicoes[2] = segundo
+            self.canvas.coords(self.ponteiro_segundo, *self.tabela_segundo[segundo])
+
+    def iniciar(self, agendador):
+        """
+        Atualiza os ponteiros a cada virada de segundo, pela thread principal do Tk.
+
+        Args:
+            agendador (AgendadorTk): Agendador compartilhado da janela.
 
-        # Desenha os ponteiros de hora, minuto e segundo
-        self.desenhar_ponteiro(angulo_hora, comprimento_hora, "black", 6)
-        self.desenhar_ponteiro(angulo_minuto, comprimento_minuto, "blue", 4)
-        self.desenhar_ponteiro(angulo_segundo, comprimento_segundo, "red", 2)
+        Returns:
+            Tique: Use tique.cancelar() (ou agendador.parar()) para parar o relógio.
+        """
+        return agendador.a_cada_segundo(self.atualizar_ponteiros)
+
+    def iniciar_suave(self, fps=FPS_PADRAO, registro=None):
+        """
+        Liga a varredura suave do ponteiro de segundos.
+
+        A taxa de quadros cai sozinha quando o desenho estoura o orçamento do quadro
+        ou a janela fica oculta (ver varredura.Varredura).
+
+        Args:
+            fps (int): Quadros por segundo desejados (ex.: 30 ou 60).
+            registro (RegistroTiques | None): Registra o atraso e a duração de cada quadro.
+
+        Returns:
+            Varredura: Use parar_suave() para voltar ao tique de um segundo.
+        """
+        self.parar_suave()
+        self.varredura = Varredura(self.canvas.after, self.desenhar_instante, fps,
+                                   visivel=self.canvas.winfo_viewable, cancelar=self.canvas.after_cancel,
+                                   registro=registro)
+        # troca a tabela do segundo; os ponteiros são posicionados no primeiro quadro
+        self._posicoes[2] = None
+        self.ajustar_tamanho(self.tamanho)
+        return self.varredura.iniciar()
+
+    def parar_suave(self):
+        """Desliga a varredura suave e volta a tabela do segundo para 60 posições."""
+        if self.varredura is None:
+            return
+        self.varredura.parar()
+        self.varredura = None
+        self._posicoes[2] = None
+        self.ajustar_tamanho(self.tamanho)
+
+    async def iniciar_relogio(self, agendador=None, registro=None):
+        """
+        Inicia o relógio analógico com atualização dos ponteiros a cada segundo.
+
+        Com um AgendadorTk a corrotina roda na thread do Tk (agendador.executar) e
+        os tiques são registrados pelo agendador; sem ele, cada espera vai até a
+        próxima virada de segundo, sem acumular atraso, e `registro` (RegistroTiques)
+        recebe o atraso de cada asyncio.sleep e a duração do desenho.
+        """
+        # só esta corrotina usa o asyncio; o painel, que não a usa, não paga a importação
+        import asyncio
 
-    async def iniciar_relogio(self):
-        """Inicia o relógio analógico com atualização dos ponteiros a cada segundo."""
+        previsto = None
         while True:
-            self.atualizar_ponteiros()
-            await asyncio.sleep(1)
+            if registro is not None and previsto is not None:
+                registro.medir(previsto, self.atualizar_ponteiros)
+            else:
+                self.atualizar_ponteiros()
+            if agendador is not None:
+                await agendador.proximo_segundo()
+            else:
+                espera = ms_ate_proximo_segundo() / 1000
+                previsto = time.perf_counter() + espera
+                await asyncio.sleep(espera)
 
 
 '''
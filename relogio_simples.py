@@ -1,36 +1,49 @@
+import argparse
 import turtle
 import time
-from datetime import datetime
-
-# Configuração da tela
-tela = turtle.Screen()
-tela.title("Relógio Analógico")
-tela.setup(width=600, height=600)
-tela.tracer(0)  # Desativa a atualização automática da tela para mais eficiência
-
-# Tartaruga para desenhar o mostrador
-mostrador = turtle.Turtle()
-mostrador.hideturtle()
-mostrador.speed(0)
-
-# Tartarugas para os ponteiros de hora, minuto e segundo
-ponteiro_hora = turtle.Turtle()
-ponteiro_hora.shape("arrow")
-ponteiro_hora.color("black")
-ponteiro_hora.shapesize(stretch_wid=0.4, stretch_len=8)
-ponteiro_hora.speed(0)
-
-ponteiro_minuto = turtle.Turtle()
-ponteiro_minuto.shape("arrow")
-ponteiro_minuto.color("blue")
-ponteiro_minuto.shapesize(stretch_wid=0.3, stretch_len=10)
-ponteiro_minuto.speed(0)
-
-ponteiro_segundo = turtle.Turtle()
-ponteiro_segundo.shape("arrow")
-ponteiro_segundo.color("red")
-ponteiro_segundo.shapesize(stretch_wid=0.2, stretch_len=12)
-ponteiro_segundo.speed(0)
+
+from geometria_relogio import angulos_ponteiros, segundos_do_dia
+from registro_tiques import RegistroTiques
+from varredura import FPS_PADRAO, Varredura
+
+# Tela e tartarugas: criadas em criar_tela(), para que importar o módulo não abra uma janela
+tela = None
+mostrador = None
+ponteiro_hora = ponteiro_minuto = ponteiro_segundo = None
+
+# Função para criar a tela e as tartarugas
+def criar_tela():
+    global tela, mostrador, ponteiro_hora, ponteiro_minuto, ponteiro_segundo
+
+    # Configuração da tela
+    tela = turtle.Screen()
+    tela.title("Relógio Analógico")
+    tela.setup(width=600, height=600)
+    tela.tracer(0)  # Desativa a atualização automática da tela para mais eficiência
+
+    # Tartaruga para desenhar o mostrador
+    mostrador = turtle.Turtle()
+    mostrador.hideturtle()
+    mostrador.speed(0)
+
+    # Tartarugas para os ponteiros de hora, minuto e segundo
+    ponteiro_hora = turtle.Turtle()
+    ponteiro_hora.shape("arrow")
+    ponteiro_hora.color("black")
+    ponteiro_hora.shapesize(stretch_wid=0.4, stretch_len=8)
+    ponteiro_hora.speed(0)
+
+    ponteiro_minuto = turtle.Turtle()
+    ponteiro_minuto.shape("arrow")
+    ponteiro_minuto.color("blue")
+    ponteiro_minuto.shapesize(stretch_wid=0.3, stretch_len=10)
+    ponteiro_minuto.speed(0)
+
+    ponteiro_segundo = turtle.Turtle()
+    ponteiro_segundo.shape("arrow")
+    ponteiro_segundo.color("red")
+    ponteiro_segundo.shapesize(stretch_wid=0.2, stretch_len=12)
+    ponteiro_segundo.speed(0)
 
 # Função para desenhar o mostrador do relógio
 def desenhar_mostrador():
@@ -51,17 +64,17 @@ def desenhar_mostrador():
         mostrador.penup()
         mostrador.goto(0, 0)
 
+# Registro opcional do atraso e da duração de cada tique (--medir-tiques)
+registro = None
+previsto = None
+
 # Função para atualizar a posição dos ponteiros
 def atualizar_relogio():
-    agora = datetime.now()
-    hora = agora.hour % 12
-    minuto = agora.minute
-    segundo = agora.second
-    
-    # Atualiza os ângulos dos ponteiros
-    angulo_hora = (hora + minuto / 60) * 30  # Cada hora são 30 graus
-    angulo_minuto = (minuto + segundo / 60) * 6  # Cada minuto são 6 graus
-    angulo_segundo = segundo * 6  # Cada segundo são 6 graus
+    global previsto
+    inicio = time.perf_counter()
+
+    # Ângulos dos ponteiros em graus, no sentido horário a partir das 12 horas
+    angulo_hora, angulo_minuto, angulo_segundo = angulos_ponteiros(segundos_do_dia(time.time()))
     
     # Define as posições dos ponteiros
     ponteiro_hora.setheading(90 - angulo_hora)
@@ -70,13 +83,50 @@ def atualizar_relogio():
     
     # Atualiza a tela e agenda a próxima atualização
     tela.update()
+    if registro is not None and previsto is not None:
+        registro.registrar(previsto, inicio, time.perf_counter() - inicio)
+    previsto = time.perf_counter() + 1
     tela.ontimer(atualizar_relogio, 1000)
 
+# Ângulos atuais dos ponteiros na varredura suave
+angulos = [None, None, None]
+
+# Função para desenhar um quadro da varredura suave; só gira os ponteiros que mudaram
+def desenhar_instante(instante):
+    novos = angulos_ponteiros(segundos_do_dia(instante), suave=True)
+    for i, ponteiro in enumerate((ponteiro_hora, ponteiro_minuto, ponteiro_segundo)):
+        if angulos[i] != novos[i]:
+            angulos[i] = novos[i]
+            ponteiro.setheading(90 - novos[i])
+
+    # O mostrador já está no canvas; a atualização só redesenha as tartarugas dos ponteiros
+    tela.update()
+
+def iniciar_varredura(fps=FPS_PADRAO):
+    return Varredura(lambda ms, funcao: tela.ontimer(funcao, ms), desenhar_instante, fps,
+                     visivel=tela.getcanvas().winfo_viewable, registro=registro).iniciar()
+
 # Função principal
 def main():
+    global registro
+    parser = argparse.ArgumentParser(description="Relógio analógico com turtle.")
+    parser.add_argument("--suave", type=int, nargs="?", const=FPS_PADRAO, default=None, metavar="FPS",
+                        help=f"ponteiro de segundos em varredura suave (padrão: {FPS_PADRAO} quadros por segundo)")
+    parser.add_argument("--medir-tiques", metavar="ARQUIVO",
+                        help="grava ao sair um JSON com o atraso e a duração dos tiques")
+    args = parser.parse_args()
+
+    if args.medir_tiques:
+        registro = RegistroTiques("relogio_simples.py").gravar_ao_sair(args.medir_tiques)
+
+    criar_tela()
     desenhar_mostrador()
-    atualizar_relogio()
+    if args.suave:
+        iniciar_varredura(args.suave)
+    else:
+        atualizar_relogio()
     tela.mainloop()
 
 # Executa o programa principal
-main()
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,24 @@
+import argparse
 import tkinter as tk
-from datetime import datetime
-import math
+import time
 
-# Configurações iniciais da janela
-janela = tk.Tk()
-janela.title("Relógio Analógico")
-janela.geometry("500x500")
-janela.configure(bg="white")
+from geometria_relogio import (
+    POSICOES_HORA, POSICOES_MINUTO, POSICOES_SEGUNDO, POSICOES_SEGUNDO_SUAVE, PROPORCAO_HORA,
+    PROPORCAO_MINUTO, PROPORCAO_SEGUNDO, indices_ponteiros, marcacoes, segundos_do_dia, tabela_ponteiro,
+)
+from registro_tiques import RegistroTiques
+from varredura import FPS_PADRAO, Varredura
 
-# Criar um Canvas para desenhar o relógio
-canvas = tk.Canvas(janela, width=500, height=500, bg="white")
-canvas.pack()
+# Centro e raio do mostrador no canvas de 500x500
+CENTRO = 250
+RAIO = 200
+
+# Janela, canvas, tabelas e ponteiros: criados em criar_janela(), para que importar
+# o módulo não abra uma janela
+janela = None
+canvas = None
+tabela_hora = tabela_minuto = tabela_segundo = None
+ponteiro_hora = ponteiro_minuto = ponteiro_segundo = None
 
 # Função para desenhar o mostrador do relógio
 def desenhar_mostrador():
@@ -18,56 +26,114 @@ def desenhar_mostrador():
     canvas.create_oval(50, 50, 450, 450, outline="black", width=4)
 
     # Desenhar as marcações das horas
-    for i in range(12):
-        angulo = math.radians(i * 30)
-        x1 = 250 + 180 * math.cos(angulo)
-        y1 = 250 - 180 * math.sin(angulo)
-        x2 = 250 + 200 * math.cos(angulo)
-        y2 = 250 - 200 * math.sin(angulo)
-        canvas.create_line(x1, y1, x2, y2, fill="black", width=3)
-
-# Funções para desenhar os ponteiros
-def desenhar_ponteiro_hora(horas, minutos):
-    angulo = math.radians((horas % 12 + minutos / 60) * 30 - 90)
-    x = 250 + 100 * math.cos(angulo)
-    y = 250 + 100 * math.sin(angulo)
-    return canvas.create_line(250, 250, x, y, fill="black", width=6, tags="ponteiro")
-
-def desenhar_ponteiro_minuto(minutos, segundos):
-    angulo = math.radians((minutos + segundos / 60) * 6 - 90)
-    x = 250 + 140 * math.cos(angulo)
-    y = 250 + 140 * math.sin(angulo)
-    return canvas.create_line(250, 250, x, y, fill="blue", width=4, tags="ponteiro")
-
-def desenhar_ponteiro_segundo(segundos):
-    angulo = math.radians(segundos * 6 - 90)
-    x = 250 + 180 * math.cos(angulo)
-    y = 250 + 180 * math.sin(angulo)
-    return canvas.create_line(250, 250, x, y, fill="red", width=2, tags="ponteiro")
+    for linha in marcacoes(RAIO, CENTRO):
+        canvas.create_line(*linha, fill="black", width=3)
+
+    # Manter os ponteiros, criados antes, acima do mostrador
+    canvas.tag_raise("ponteiro")
+
+# Função para criar a janela, o canvas e os ponteiros
+def criar_janela():
+    global janela, canvas, tabela_hora, tabela_minuto, tabela_segundo
+    global ponteiro_hora, ponteiro_minuto, ponteiro_segundo
+
+    # Configurações iniciais da janela
+    janela = tk.Tk()
+    janela.title("Relógio Analógico")
+    janela.geometry("500x500")
+    janela.configure(bg="white")
+
+    # Criar um Canvas para desenhar o relógio
+    canvas = tk.Canvas(janela, width=500, height=500, bg="white")
+    canvas.pack()
+
+    # Tabelas com as coordenadas de cada posição dos ponteiros, calculadas uma única vez:
+    # hora a cada minuto (720 posições), minuto a cada segundo (3600), segundo (60)
+    tabela_hora = tabela_ponteiro(POSICOES_HORA, RAIO * PROPORCAO_HORA, CENTRO)
+    tabela_minuto = tabela_ponteiro(POSICOES_MINUTO, RAIO * PROPORCAO_MINUTO, CENTRO)
+    tabela_segundo = tabela_ponteiro(POSICOES_SEGUNDO, RAIO * PROPORCAO_SEGUNDO, CENTRO)
+
+    # Os ponteiros são criados uma única vez e depois só reposicionados com coords
+    ponteiro_hora = canvas.create_line(*tabela_hora[0], fill="black", width=6, tags="ponteiro")
+    ponteiro_minuto = canvas.create_line(*tabela_minuto[0], fill="blue", width=4, tags="ponteiro")
+    ponteiro_segundo = canvas.create_line(*tabela_segundo[0], fill="red", width=2, tags="ponteiro")
+
+# Varredura suave: o segundo anda 60 vezes por segundo (tabela com 3600 posições,
+# calculada só se o modo suave for usado)
+tabela_segundo_suave = None
+posicoes_suaves = [None, None, None]
+
+# Funções para posicionar os ponteiros (índices nas tabelas, ver geometria_relogio)
+def desenhar_ponteiro_hora(indice):
+    canvas.coords(ponteiro_hora, *tabela_hora[indice])
+
+def desenhar_ponteiro_minuto(indice):
+    canvas.coords(ponteiro_minuto, *tabela_minuto[indice])
+
+def desenhar_ponteiro_segundo(indice):
+    canvas.coords(ponteiro_segundo, *tabela_segundo[indice])
+
+# Registro opcional do atraso e da duração de cada tique (--medir-tiques)
+registro = None
+previsto = None
 
 # Função para atualizar os ponteiros
 def atualizar_relogio():
-    canvas.delete("ponteiro")  # Limpar os ponteiros antigos
+    global previsto
+    inicio = time.perf_counter()
 
     # Obter o horário atual
-    agora = datetime.now()
-    horas = agora.hour
-    minutos = agora.minute
-    segundos = agora.second
+    hora, minuto, segundo = indices_ponteiros(segundos_do_dia(time.time()))
 
     # Desenhar os ponteiros atualizados
-    desenhar_ponteiro_hora(horas, minutos)
-    desenhar_ponteiro_minuto(minutos, segundos)
-    desenhar_ponteiro_segundo(segundos)
+    desenhar_ponteiro_hora(hora)
+    desenhar_ponteiro_minuto(minuto)
+    desenhar_ponteiro_segundo(segundo)
+
+    if registro is not None and previsto is not None:
+        registro.registrar(previsto, inicio, time.perf_counter() - inicio)
 
     # Agendar a próxima atualização em 1000 ms (1 segundo)
+    previsto = time.perf_counter() + 1
     canvas.after(1000, atualizar_relogio)
 
+# Função para desenhar um quadro da varredura suave; só move os ponteiros que mudaram
+def desenhar_instante(instante):
+    indices = indices_ponteiros(segundos_do_dia(instante), suave=True)
+    ponteiros = (ponteiro_hora, ponteiro_minuto, ponteiro_segundo)
+    tabelas = (tabela_hora, tabela_minuto, tabela_segundo_suave)
+    for i, indice in enumerate(indices):
+        if posicoes_suaves[i] != indice:
+            posicoes_suaves[i] = indice
+            canvas.coords(ponteiros[i], *tabelas[i][indice])
+
+def iniciar_varredura(fps=FPS_PADRAO):
+    global tabela_segundo_suave
+    tabela_segundo_suave = tabela_ponteiro(POSICOES_SEGUNDO_SUAVE, RAIO * PROPORCAO_SEGUNDO, CENTRO)
+    return Varredura(canvas.after, desenhar_instante, fps, visivel=canvas.winfo_viewable,
+                     cancelar=canvas.after_cancel, registro=registro).iniciar()
+
 # Função principal para iniciar o programa
 def main():
+    global registro
+    parser = argparse.ArgumentParser(description="Relógio analógico com Tkinter.")
+    parser.add_argument("--suave", type=int, nargs="?", const=FPS_PADRAO, default=None, metavar="FPS",
+                        help=f"ponteiro de segundos em varredura suave (padrão: {FPS_PADRAO} quadros por segundo)")
+    parser.add_argument("--medir-tiques", metavar="ARQUIVO",
+                        help="grava ao sair um JSON com o atraso e a duração dos tiques")
+    args = parser.parse_args()
+
+    if args.medir_tiques:
+        registro = RegistroTiques("relogio_tkinter.py").gravar_ao_sair(args.medir_tiques)
+
+    criar_janela()
     desenhar_mostrador()
-    atualizar_relogio()
+    if args.suave:
+        iniciar_varredura(args.suave)
+    else:
+        atualizar_relogio()
     janela.mainloop()
 
 # Executa o programa principal
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
\ No newline at end of file
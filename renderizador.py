@@ -0,0 +1,182 @@
+import argparse
+import os
+import struct
+import time
+import zlib
+from datetime import datetime
+
+from geometria_relogio import (
+    PROPORCAO_HORA, PROPORCAO_MINUTO, PROPORCAO_SEGUNDO, angulos_lote, exigir_numpy, marcacoes,
+    pontas_lote,
+)
+
+BRANCO = (255, 255, 255, 255)
+# (proporção do raio, cor RGBA, largura) de cada ponteiro, como nos relógios do Tk
+PONTEIROS = (
+    (PROPORCAO_HORA, (0, 0, 0, 255), 6),
+    (PROPORCAO_MINUTO, (0, 0, 255, 255), 4),
+    (PROPORCAO_SEGUNDO, (255, 0, 0, 255), 2),
+)
+# compressão do zlib nos PNGs: 1 é bem mais rápido e o arquivo fica pouco maior
+NIVEL_PNG = 6
+
+
+def _grade(imagem, x_min, y_min, x_max, y_max):
+    # centros dos pixels dentro da caixa (limitada à imagem) e a fatia correspondente
+    np = exigir_numpy()
+    altura, largura = imagem.shape[:2]
+    x0, y0 = max(int(x_min), 0), max(int(y_min), 0)
+    x1, y1 = min(int(x_max) + 1, largura), min(int(y_max) + 1, altura)
+    ys, xs = np.mgrid[y0:y1, x0:x1]
+    return (slice(y0, y1), slice(x0, x1)), xs + 0.5, ys + 0.5
+
+
+def _pintar(imagem, fatia, distancia, largura, cor):
+    # cobertura com borda suavizada de um pixel; mistura a cor por cima do que já existe
+    np = exigir_numpy()
+    cobertura = np.clip(largura / 2 + 0.5 - distancia, 0, 1)[..., None]
+    regiao = imagem[fatia]
+    regiao += (np.asarray(cor, dtype=np.float32) - regiao) * cobertura
+
+
+def desenhar_linha(imagem, x0, y0, x1, y1, largura, cor):
+    """Desenha um segmento com pontas arredondadas numa imagem RGBA de floats (altura x largura x 4)."""
+    np = exigir_numpy()
+    margem = largura / 2 + 1
+    fatia, xs, ys = _grade(imagem, min(x0, x1) - margem, min(y0, y1) - margem,
+                           max(x0, x1) + margem, max(y0, y1) + margem)
+    dx, dy = x1 - x0, y1 - y0
+    comprimento2 = dx * dx + dy * dy or 1.0
+    t = np.clip(((xs - x0) * dx + (ys - y0) * dy) / comprimento2, 0, 1)
+    _pintar(imagem, fatia, np.hypot(xs - (x0 + t * dx), ys - (y0 + t * dy)), largura, cor)
+
+
+def desenhar_circulo(imagem, cx, cy, raio, largura, cor):
+    """Desenha o contorno de um círculo numa imagem RGBA de floats."""
+    np = exigir_numpy()
+    margem = raio + largura / 2 + 1
+    fatia, xs, ys = _grade(imagem, cx - margem, cy - margem, cx + margem, cy + margem)
+    _pintar(imagem, fatia, np.abs(np.hypot(xs - cx, ys - cy) - raio), largura, cor)
+
+
+def png(rgba, nivel=NIVEL_PNG):
+    """
+    Codifica um array RGBA (altura x largura x 4, uint8) em PNG, só com zlib.
+
+    Returns:
+        bytes: O arquivo PNG.
+    """
+    np = exigir_numpy()
+    altura, largura = rgba.shape[:2]
+    linhas = np.zeros((altura, largura * 4 + 1), dtype=np.uint8)  # byte de filtro 0 em cada linha
+    linhas[:, 1:] = rgba.reshape(altura, largura * 4)
+
+    def bloco(tipo, dados):
+        return (struct.pack(">I", len(dados)) + tipo + dados
+                + struct.pack(">I", zlib.crc32(tipo + dados) & 0xFFFFFFFF))
+
+    cabecalho = struct.pack(">IIBBBBB", largura, altura, 8, 6, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + bloco(b"IHDR", cabecalho)
+            + bloco(b"IDAT", zlib.compress(linhas.tobytes(), nivel)) + bloco(b"IEND", b""))
+
+
+class Renderizador:
+    """
+    Desenha quadros do relógio analógico em memória, sem Tk, turtle nem display.
+
+    O mostrador é desenhado uma vez; cada quadro copia o mostrador e desenha só os
+    três ponteiros, com as posições de todos os quadros calculadas num único lote
+    (geometria_relogio). Útil para gerar time-lapses e medir a renderização.
+    """
+
+    def __init__(self, tamanho=400):
+        """
+        Args:
+            tamanho (int): Lado da imagem em pixels (mesmas proporções de RelogioAnalogico).
+        """
+        np = exigir_numpy()
+        self.tamanho = tamanho
+        self.raio = tamanho // 2 - 20
+        self.centro = tamanho / 2
+        self._mostrador = np.empty((tamanho, tamanho, 4), dtype=np.float32)
+        self._mostrador[:] = BRANCO
+        desenhar_circulo(self._mostrador, self.centro, self.centro, self.centro - 10, 4, (0, 0, 0, 255))
+        for linha in marcacoes(self.raio, self.centro):
+            desenhar_linha(self._mostrador, *linha, 2, (0, 0, 0, 255))
+
+    def quadros(self, instantes, deslocamento=0, suave=False):
+        """
+        Gera um quadro RGBA (tamanho x tamanho x 4, uint8) para cada instante.
+
+        Args:
+            instantes: Array de instantes UTC (time.time()).
+            deslocamento (float): Deslocamento do fuso em relação ao UTC, em segundos.
+            suave (bool): Segundo contínuo em vez de um passo por segundo.
+        """
+        np = exigir_numpy()
+        angulos = angulos_lote(instantes, deslocamento, suave)
+        pontas = [pontas_lote(angulo, self.raio * proporcao, self.centro)
+                  for angulo, (proporcao, _, _) in zip(angulos, PONTEIROS)]
+        for i in range(len(pontas[0][0])):
+            imagem = self._mostrador.copy()
+            for (xs, ys), (_, cor, largura) in zip(pontas, PONTEIROS):
+                desenhar_linha(imagem, self.centro, self.centro, xs[i], ys[i], largura, cor)
+            yield np.rint(imagem).astype(np.uint8)
+
+    def quadro(self, instante=None, deslocamento=0, suave=False):
+        """Um único quadro RGBA; sem `instante`, a hora atual."""
+        instante = time.time() if instante is None else instante
+        return next(self.quadros([instante], deslocamento, suave))
+
+
+def gravar_sequencia(renderizador, instantes, pasta, deslocamento=0, suave=False, formato="png", nivel=NIVEL_PNG):
+    """
+    Grava um quadro por instante em `pasta`: PNGs numerados ou um único arquivo RGBA bruto.
+
+    O arquivo bruto (quadros.rgba) guarda os quadros em sequência, sem cabeçalho:
+    tamanho x tamanho x 4 bytes por quadro (ex.: ffmpeg -f rawvideo -pix_fmt rgba).
+
+    Returns:
+        int: Quantidade de quadros gravados.
+    """
+    os.makedirs(pasta, exist_ok=True)
+    total = 0
+    if formato == "rgba":
+        with open(os.path.join(pasta, "quadros.rgba"), "wb") as arquivo:
+            for imagem in renderizador.quadros(instantes, deslocamento, suave):
+                arquivo.write(imagem.tobytes())
+                total += 1
+        return total
+    for imagem in renderizador.quadros(instantes, deslocamento, suave):
+        with open(os.path.join(pasta, f"quadro_{total:06d}.png"), "wb") as arquivo:
+            arquivo.write(png(imagem, nivel))
+        total += 1
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Renderiza um time-lapse do relógio analógico, sem display.")
+    parser.add_argument("pasta", help="pasta de saída")
+    parser.add_argument("--inicio", help="data e hora inicial, ISO 8601 (padrão: agora)")
+    parser.add_argument("--quadros", type=int, default=600)
+    parser.add_argument("--passo", type=float, default=60, help="segundos de relógio entre quadros")
+    parser.add_argument("--tamanho", type=int, default=400)
+    parser.add_argument("--suave", action="store_true", help="segundo contínuo")
+    parser.add_argument("--formato", choices=("png", "rgba"), default="png")
+    parser.add_argument("--nivel-png", type=int, default=NIVEL_PNG, help="compressão do zlib (0 a 9)")
+    args = parser.parse_args()
+    np = exigir_numpy()
+
+    inicio = datetime.fromisoformat(args.inicio).astimezone() if args.inicio else datetime.now().astimezone()
+    deslocamento = inicio.utcoffset().total_seconds()
+    instantes = inicio.timestamp() + np.arange(args.quadros) * args.passo
+
+    comeco = time.perf_counter()
+    total = gravar_sequencia(Renderizador(args.tamanho), instantes, args.pasta, deslocamento, args.suave,
+                             args.formato, args.nivel_png)
+    duracao = time.perf_counter() - comeco
+    print(f"{total} quadros em {duracao:.2f}s ({total / duracao:.1f} quadros/s) em {args.pasta}")
+
+
+if __name__ == "__main__":
+    main()
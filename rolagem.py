@@ -0,0 +1,112 @@
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from esperas import esperar
+
+# tempo (em segundos) sem nenhum item novo após a rolagem para considerar o fim da lista
+TEMPO_OCIOSO = 2
+# tempo (em segundos) de calmaria no DOM depois de uma mudança para considerar o trecho carregado
+TEMPO_ASSENTAMENTO = 0.15
+# tempo máximo (em segundos) de um passo de rolagem
+TEMPO_MAXIMO_PASSO = 10
+
+SELETOR_ITENS = "li a[data-control-id]"
+SELETOR_PROXIMA = (
+    "button.jobs-search-pagination__button--next, "
+    "li[data-test-pagination-page-btn].selected + li button, "
+    "li.artdeco-pagination__indicator--number.selected + li button"
+)
+
+# rola a lista por uma altura de tela e espera o DOM parar de crescer (MutationObserver),
+# em vez de dormir um tempo fixo; retorna a nova contagem e se o fim da lista foi atingido.
+# Se a rolagem não saiu do lugar (lista sem altura, overflow desligado...), também é o fim:
+# os passos seguintes não sairiam do lugar e o laço nunca terminaria.
+_SCRIPT_PASSO = """
+const [lista, seletor, ocioso, assentamento, maximo] = arguments;
+const pronto = arguments[arguments.length - 1];
+const contar = () => lista.querySelectorAll(seletor).length;
+const antes = contar();
+let espera, teto, observador;
+const terminar = () => {
+    observador.disconnect();
+    clearTimeout(espera);
+    clearTimeout(teto);
+    const total = contar();
+    const noFundo = lista.scrollTop + lista.clientHeight >= lista.scrollHeight - 2;
+    pronto({total: total, fim: parado || (noFundo && total === antes)});
+};
+observador = new MutationObserver(() => {
+    clearTimeout(espera);
+    espera = setTimeout(terminar, assentamento);
+});
+observador.observe(lista, {childList: true, subtree: true});
+teto = setTimeout(terminar, maximo);
+const topoAntes = lista.scrollTop;
+lista.scrollTop += lista.clientHeight;
+const parado = lista.scrollTop === topoAntes;
+// longe do fundo ainda há itens para ler; no fundo, espera a próxima carga até o tempo ocioso
+const chegouAoFundo = lista.scrollTop + lista.clientHeight >= lista.scrollHeight - 2;
+espera = setTimeout(terminar, chegouAoFundo ? ocioso : assentamento);
+"""
+
+_SCRIPT_PROXIMA = """
+const botao = document.querySelector(arguments[0]);
+if (!botao || botao.disabled) return false;
+botao.scrollIntoView({block: "center"});
+botao.click();
+return true;
+"""
+
+
+def rolar_pagina(browser, container, alvo=None, ao_carregar=None,
+                 tempo_ocioso=TEMPO_OCIOSO, seletor=SELETOR_ITENS):
+    """
+    Rola a lista de resultados até ter `alvo` itens ou chegar ao fim dela.
+
+    Args:
+        browser (WebDriver): Navegador controlado pelo Selenium.
+        container (WebElement): Elemento rolável da lista de resultados.
+        alvo (int | None): Quantidade de itens desejada; None rola até o fim.
+        ao_carregar (callable | None): Função (contagem_anterior, contagem_nova) chamada quando
+            novos itens aparecem; se retornar True a rolagem para.
+        tempo_ocioso (float): Segundos sem itens novos para considerar o fim da lista.
+
+    Returns:
+        int: Quantidade de itens carregados.
+    """
+    browser.set_script_timeout(TEMPO_MAXIMO_PASSO + 5)
+    total = len(container.find_elements(By.CSS_SELECTOR, seletor))
+    anterior = 0
+    while True:
+        if total > anterior:
+            if ao_carregar is not None and ao_carregar(anterior, total):
+                return total
+            anterior = total
+        if alvo and total >= alvo:
+            return total
+        passo = browser.execute_async_script(
+            _SCRIPT_PASSO, container, seletor,
+            int(tempo_ocioso * 1000), int(TEMPO_ASSENTAMENTO * 1000), TEMPO_MAXIMO_PASSO * 1000,
+        )
+        total = passo["total"]
+        if passo["fim"]:
+            return total
+
+
+def proxima_pagina(browser, container, seletor=SELETOR_PROXIMA):
+    """
+    Vai para a próxima página de resultados, se houver.
+
+    Returns:
+        bool: False quando não há próxima página.
+    """
+    try:
+        primeiro = container.find_element(By.CSS_SELECTOR, SELETOR_ITENS)
+    except NoSuchElementException:
+        return False
+    if not browser.execute_script(_SCRIPT_PROXIMA, seletor):
+        return False
+    # a página seguinte troca os itens da lista
+    esperar(browser, EC.staleness_of(primeiro), mensagem="a próxima página não carregou")
+    return True
@@ -0,0 +1,175 @@
+import csv
+import os
+
+# títulos das colunas gravadas e a chave correspondente em cada vaga
+COLUNAS = [
+    ("NOME DA VAGA", "titulo"),
+    ("LINK DA VAGA", "link"),
+    ("EMPRESA", "empresa"),
+    ("LOCAL", "local"),
+    ("ID DA VAGA", "id_vaga"),
+    ("BUSCA", "busca"),
+]
+# quantidade de linhas acumuladas antes de cada gravação
+TAMANHO_LOTE = 500
+
+
+class Saida:
+    """
+    Base das saídas de vagas: acumula linhas e as grava em lotes.
+
+    Use como gerenciador de contexto; o arquivo é fechado (e o que já foi coletado
+    é gravado) mesmo se a busca for interrompida por uma exceção.
+    """
+
+    extensao = ""
+
+    def __init__(self, caminho, colunas=COLUNAS, tamanho_lote=TAMANHO_LOTE):
+        """
+        Args:
+            caminho (str): Arquivo de destino.
+            colunas (list[tuple[str, str]]): Pares (título, chave) das colunas.
+            tamanho_lote (int): Linhas acumuladas antes de cada gravação.
+        """
+        self.caminho = caminho
+        self.colunas = colunas
+        self.tamanho_lote = tamanho_lote
+        self.linhas_gravadas = 0
+        self._pendentes = []
+
+    def escrever(self, vaga):
+        """Adiciona uma vaga; grava o lote quando ele estiver cheio."""
+        self._pendentes.append([vaga.get(chave, "") for _, chave in self.colunas])
+        if len(self._pendentes) >= self.tamanho_lote:
+            self.descarregar()
+
+    def escrever_lote(self, vagas):
+        """Adiciona várias vagas."""
+        for vaga in vagas:
+            self.escrever(vaga)
+
+    def descarregar(self):
+        """Grava as linhas pendentes."""
+        if self._pendentes:
+            self._gravar(self._pendentes)
+            self.linhas_gravadas += len(self._pendentes)
+            self._pendentes = []
+
+    def fechar(self):
+        """Grava o que falta e fecha o arquivo."""
+        try:
+            self.descarregar()
+        finally:
+            self._fechar()
+
+    def _gravar(self, linhas):
+        raise NotImplementedError
+
+    def _fechar(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class SaidaCsv(Saida):
+    """Saída CSV; cada lote vai para o disco na hora, então sobrevive até a um processo morto."""
+
+    extensao = ".csv"
+
+    def __init__(self, caminho, colunas=COLUNAS, tamanho_lote=TAMANHO_LOTE):
+        super().__init__(caminho, colunas, tamanho_lote)
+        self._arquivo = open(caminho, "w", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._arquivo)
+        self._csv.writerow([titulo for titulo, _ in colunas])
+        self._arquivo.flush()
+
+    def _gravar(self, linhas):
+        self._csv.writerows(linhas)
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+
+    def _fechar(self):
+        self._arquivo.close()
+
+
+class SaidaXlsx(Saida):
+    """
+    Saída xlsx no modo write-only do openpyxl.
+
+    As linhas vão sendo serializadas para um arquivo temporário em vez de ficarem
+    na memória; a planilha final é montada ao fechar.
+    """
+
+    extensao = ".xlsx"
+
+    def __init__(self, caminho, colunas=COLUNAS, tamanho_lote=TAMANHO_LOTE):
+        from openpyxl import Workbook
+
+        super().__init__(caminho, colunas, tamanho_lote)
+        self._planilha = Workbook(write_only=True)
+        self._aba = self._planilha.create_sheet()
+        self._aba.append([titulo for titulo, _ in colunas])
+
+    def _gravar(self, linhas):
+        for linha in linhas:
+            self._aba.append(linha)
+
+    def _fechar(self):
+        self._planilha.save(self.caminho)
+
+
+class SaidaParquet(Saida):
+    """Saída Parquet (pyarrow); cada lote vira um row group."""
+
+    extensao = ".parquet"
+
+    def __init__(self, caminho, colunas=COLUNAS, tamanho_lote=TAMANHO_LOTE):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as erro:
+            raise RuntimeError("a saída parquet precisa do pacote pyarrow (pip install pyarrow)") from erro
+
+        super().__init__(caminho, colunas, tamanho_lote)
+        self._pa = pa
+        self._esquema = pa.schema([(chave, pa.string()) for _, chave in colunas])
+        self._escritor = pq.ParquetWriter(caminho, self._esquema)
+
+    def _gravar(self, linhas):
+        tabela = self._pa.Table.from_arrays(
+            [self._pa.array([str(v) for v in valores]) for valores in zip(*linhas)], schema=self._esquema
+        )
+        self._escritor.write_table(tabela)
+
+    def _fechar(self):
+        self._escritor.close()
+
+
+FORMATOS = {
+    "xlsx": SaidaXlsx,
+    "csv": SaidaCsv,
+    "parquet": SaidaParquet,
+}
+
+
+def abrir_saida(nome_base, formato="xlsx", tamanho_lote=TAMANHO_LOTE, colunas=COLUNAS):
+    """
+    Cria a saída do formato pedido.
+
+    Args:
+        nome_base (str): Nome do arquivo sem extensão.
+        formato (str): Uma das chaves de FORMATOS.
+        tamanho_lote (int): Linhas acumuladas antes de cada gravação.
+
+    Returns:
+        Saida: Saída aberta, pronta para receber vagas.
+    """
+    try:
+        classe = FORMATOS[formato]
+    except KeyError:
+        raise ValueError(f"formato desconhecido: {formato} (use {', '.join(FORMATOS)})") from None
+    return classe(nome_base + classe.extensao, colunas, tamanho_lote)
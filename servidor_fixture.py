@@ -0,0 +1,251 @@
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from html import escape
+from urllib.parse import parse_qs, quote, urlsplit
+
+# valores padrão do servidor local que imita a busca de vagas
+TOTAL_VAGAS = 500
+POR_PAGINA = 25
+ITENS_INICIAIS = 7
+ITENS_POR_CARGA = 6
+LATENCIA = 0.05
+
+_PAGINA_INICIAL = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Vagas</title></head>
+<body>
+<header><input type="text" placeholder="Pesquisar vagas" autocomplete="off"></header>
+<main><p>Pesquise uma vaga.</p></main>
+<script>
+document.querySelector("header input").addEventListener("keydown", (e) => {
+    if (e.key === "Enter") {
+        location.href = "/jobs/search/?keywords=" + encodeURIComponent(e.target.value) + "&start=0";
+    }
+});
+</script>
+</body></html>
+"""
+
+_PAGINA_RESULTADOS = """<!doctype html>
+<html><head><meta charset="utf-8"><title>{busca} | Vagas</title>
+<style>
+.jobs-search-results-list {{ height: 600px; overflow-y: auto; }}
+.jobs-search-results-list li {{ height: 110px; border-bottom: 1px solid #ccc; }}
+</style></head>
+<body>
+<header><input type="text" value="{busca}" autocomplete="off"></header>
+<main>
+<div class="scaffold-layout__list">
+<div class="jobs-search-results-list">
+<ul>{itens}</ul>
+</div>
+</div>
+<ul class="artdeco-pagination__pages">{paginacao}</ul>
+</main>
+<script>
+const busca = {busca_json};
+const inicio = {inicio};
+const fim = {fim};
+const porCarga = {por_carga};
+let carregados = inicio + {iniciais};
+let carregando = false;
+const lista = document.querySelector(".jobs-search-results-list");
+const ul = lista.querySelector("ul");
+lista.addEventListener("scroll", () => {{
+    if (carregando || carregados >= fim) return;
+    if (lista.scrollTop + lista.clientHeight < lista.scrollHeight - 200) return;
+    carregando = true;
+    const quantidade = Math.min(porCarga, fim - carregados);
+    fetch("/api/vagas?keywords=" + encodeURIComponent(busca) + "&start=" + carregados + "&count=" + quantidade)
+        .then((r) => r.text())
+        .then((html) => {{
+            ul.insertAdjacentHTML("beforeend", html);
+            carregados += quantidade;
+            carregando = false;
+        }});
+}});
+document.querySelector("header input").addEventListener("keydown", (e) => {{
+    if (e.key === "Enter") {{
+        location.href = "/jobs/search/?keywords=" + encodeURIComponent(e.target.value) + "&start=0";
+    }}
+}});
+</script>
+</body></html>
+"""
+
+_PAGINA_VAGA = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Vaga {id_vaga}</title></head>
+<body>
+<h1>{titulo}</h1>
+<div class="description__text"><div class="show-more-less-html__markup">
+<p>Descrição da vaga {id_vaga}.<br/>Trabalho remoto.</p><p><img src="/logo.png"/>Benefícios: VR e plano de saúde.</p>
+<ul><li>Python</li><li>Selenium</li></ul>
+</div></div>
+<ul class="description__job-criteria-list">
+<li><h3 class="description__job-criteria-subheader">Seniority level</h3>
+<span class="description__job-criteria-text">Pleno</span></li>
+<li><h3 class="description__job-criteria-subheader">Employment type</h3>
+<span class="description__job-criteria-text">Full-time</span></li>
+<li><h3 class="description__job-criteria-subheader">Job function</h3>
+<span class="description__job-criteria-text">Engineering</span></li>
+<li><h3 class="description__job-criteria-subheader">Industries</h3>
+<span class="description__job-criteria-text">Software Development</span></li>
+</ul>
+</body></html>
+"""
+
+
+def _item(busca, numero):
+    id_vaga = 4000000000 + numero
+    return (
+        f'<li data-occludable-job-id="{id_vaga}"><div>'
+        f'<a data-control-id="c{numero}" href="/jobs/view/{id_vaga}/?refId=x">'
+        f'{escape(busca)} {numero + 1}</a>'
+        f'<div class="artdeco-entity-lockup__subtitle">Empresa {numero % 97}</div>'
+        f'<div class="artdeco-entity-lockup__caption">Cidade {numero % 13}</div>'
+        f'</div></li>'
+    )
+
+
+class _Manipulador(BaseHTTPRequestHandler):
+    servidor = None  # ServidorFixture, definido pela subclasse criada em ServidorFixture.iniciar
+
+    def log_message(self, formato, *args):
+        pass
+
+    def _responder(self, corpo, tipo="text/html; charset=utf-8", status=200):
+        dados = corpo.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def do_GET(self):
+        config = self.servidor
+        if config.latencia:
+            time.sleep(config.latencia)
+        partes = urlsplit(self.path)
+        consulta = {chave: valores[0] for chave, valores in parse_qs(partes.query).items()}
+        busca = consulta.get("keywords", "")
+        with config.lock:
+            config.requisicoes += 1
+
+        if partes.path in ("/", "/jobs/"):
+            self._responder(_PAGINA_INICIAL)
+        elif partes.path == "/robots.txt":
+            self._responder("User-agent: *\n", "text/plain")
+        elif partes.path == "/jobs/search/":
+            self._responder(config.pagina_resultados(busca, int(consulta.get("start", 0))))
+        elif partes.path == "/api/vagas":
+            inicio = int(consulta.get("start", 0))
+            quantidade = int(consulta.get("count", ITENS_POR_CARGA))
+            fim = min(inicio + quantidade, config.total)
+            self._responder("".join(_item(busca, n) for n in range(inicio, fim)))
+        elif partes.path.startswith("/jobs/view/"):
+            id_vaga = partes.path.strip("/").split("/")[-1]
+            self._responder(_PAGINA_VAGA.format(id_vaga=escape(id_vaga), titulo=f"Vaga {escape(id_vaga)}"))
+        else:
+            self._responder("não encontrado", "text/plain", 404)
+
+
+class ServidorFixture:
+    """
+    Servidor HTTP local que imita a busca de vagas do LinkedIn.
+
+    Tem o campo de busca no cabeçalho, a lista `jobs-search-results-list` com itens
+    `li a[data-control-id]` carregados aos poucos durante a rolagem, paginação e
+    páginas de detalhe das vagas. Todas as respostas esperam `latencia` segundos.
+    """
+
+    def __init__(self, total=TOTAL_VAGAS, por_pagina=POR_PAGINA, latencia=LATENCIA,
+                 iniciais=ITENS_INICIAIS, por_carga=ITENS_POR_CARGA, porta=0):
+        """
+        Args:
+            total (int): Quantidade de vagas de cada busca.
+            por_pagina (int): Vagas por página de resultados.
+            latencia (float): Atraso de cada resposta em segundos.
+            iniciais (int): Itens já presentes quando a página de resultados abre.
+            por_carga (int): Itens acrescentados a cada carga durante a rolagem.
+            porta (int): Porta local; 0 escolhe uma livre.
+        """
+        self.total = total
+        self.por_pagina = por_pagina
+        self.latencia = latencia
+        self.iniciais = iniciais
+        self.por_carga = por_carga
+        self.porta = porta
+        self.requisicoes = 0
+        self.lock = threading.Lock()
+        self._http = None
+
+    @property
+    def url_base(self):
+        return f"http://127.0.0.1:{self._http.server_address[1]}"
+
+    def pagina_resultados(self, busca, inicio):
+        fim = min(inicio + self.por_pagina, self.total)
+        iniciais = min(self.iniciais, fim - inicio)
+        itens = "".join(_item(busca, n) for n in range(inicio, inicio + iniciais))
+        paginas = []
+        for numero, inicio_pagina in enumerate(range(0, self.total, self.por_pagina), start=1):
+            selecionada = " selected active" if inicio_pagina == inicio else ""
+            link = f"/jobs/search/?keywords={quote(busca)}&start={inicio_pagina}"
+            paginas.append(
+                f'<li data-test-pagination-page-btn="{numero}" '
+                f'class="artdeco-pagination__indicator--number{selecionada}">'
+                f'<button aria-label="Página {numero}" onclick="location.href=\'{link}\'">{numero}</button></li>'
+            )
+        return _PAGINA_RESULTADOS.format(
+            busca=escape(busca),
+            busca_json=json.dumps(busca),
+            inicio=inicio,
+            fim=fim,
+            iniciais=iniciais,
+            por_carga=self.por_carga,
+            itens=itens,
+            paginacao="".join(paginas),
+        )
+
+    def iniciar(self):
+        """Inicia o servidor numa thread e retorna o próprio objeto."""
+        manipulador = type("Manipulador", (_Manipulador,), {"servidor": self})
+        self._http = ThreadingHTTPServer(("127.0.0.1", self.porta), manipulador)
+        self._http.daemon_threads = True
+        threading.Thread(target=self._http.serve_forever, daemon=True).start()
+        return self
+
+    def parar(self):
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+            self._http = None
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.parar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local que imita a busca de vagas.")
+    parser.add_argument("--porta", type=int, default=8800)
+    parser.add_argument("--total", type=int, default=TOTAL_VAGAS)
+    parser.add_argument("--por-pagina", type=int, default=POR_PAGINA)
+    parser.add_argument("--latencia", type=float, default=LATENCIA, help="atraso por resposta em segundos")
+    args = parser.parse_args()
+
+    with ServidorFixture(args.total, args.por_pagina, args.latencia, porta=args.porta) as servidor:
+        print(f"servindo em {servidor.url_base} (Ctrl+C para parar)")
+        print(f"ex.: python busca.py python --url-base {servidor.url_base} --sem-login")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import json
+import os
+
+from selenium import webdriver
+
+# endereço do site; pode apontar para um servidor local de testes
+URL_BASE = "https://www.linkedin.com"
+# arquivo padrão onde os cookies da sessão logada são guardados
+ARQUIVO_COOKIES = "cookies_linkedin.json"
+
+# preferências do modo enxuto: o scraper só lê texto e links, então imagens, mídia, fontes
+# e scripts de rastreamento não são carregados. As folhas de estilo continuam ligadas
+# porque a rolagem da lista de resultados depende do CSS da página.
+PREFERENCIAS_ENXUTAS = {
+    # imagens e mídia
+    "permissions.default.image": 2,
+    "media.autoplay.default": 5,
+    "media.autoplay.blocking_policy": 2,
+    "media.peerconnection.enabled": False,
+    # fontes baixadas pela página
+    "gfx.downloadable_fonts.enabled": False,
+    "browser.display.use_document_fonts": 0,
+    # scripts de terceiros conhecidos (rastreadores, redes sociais, mineradores)
+    "browser.contentblocking.category": "strict",
+    "privacy.trackingprotection.enabled": True,
+    "privacy.trackingprotection.socialtracking.enabled": True,
+    "privacy.trackingprotection.cryptomining.enabled": True,
+    "privacy.trackingprotection.fingerprinting.enabled": True,
+    # nada de pré-carregamentos especulativos
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "network.http.speculative-parallel-limit": 0,
+    # menos memória por sessão
+    "dom.ipc.processCount": 1,
+    "browser.sessionhistory.max_total_viewers": 0,
+    "browser.cache.memory.capacity": 16384,
+}
+
+
+def iniciar_navegador(headless=False, perfil=None, enxuto=False):
+    """
+    Inicia uma nova sessão do navegador.
+
+    Args:
+        headless (bool): Roda o Firefox sem janela.
+        perfil (str | None): Pasta de um perfil persistente do Firefox. O login feito nele
+            continua valendo nas próximas execuções.
+        enxuto (bool): Bloqueia imagens, mídia, fontes e rastreadores (PREFERENCIAS_ENXUTAS)
+            e devolve o controle assim que o DOM fica pronto (page load strategy "eager").
+    """
+    opcoes = webdriver.FirefoxOptions()
+    if headless:
+        opcoes.add_argument("-headless")
+    if enxuto:
+        opcoes.page_load_strategy = "eager"
+        for nome, valor in PREFERENCIAS_ENXUTAS.items():
+            opcoes.set_preference(nome, valor)
+    if perfil:
+        os.makedirs(perfil, exist_ok=True)
+        opcoes.add_argument("-profile")
+        opcoes.add_argument(os.path.abspath(perfil))
+    return webdriver.Firefox(options=opcoes)
+    #return webdriver.Chrome()
+
+
+def fazer_login(browser, url_base=URL_BASE):
+    """Abre o site e espera o usuário fazer login manualmente."""
+    browser.get(url_base + "/")
+    input("Faça login e volte aqui para pressionar ENTER")
+
+
+def salvar_cookies(browser, caminho=ARQUIVO_COOKIES):
+    """Grava os cookies da sessão atual num arquivo JSON."""
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(browser.get_cookies(), arquivo)
+
+
+def carregar_cookies(browser, caminho=ARQUIVO_COOKIES, url_base=URL_BASE):
+    """
+    Restaura os cookies gravados por salvar_cookies.
+
+    O navegador só aceita cookies do domínio da página aberta, então uma página leve
+    do site (robots.txt) é aberta antes.
+
+    Returns:
+        bool: False se o arquivo de cookies não existir.
+    """
+    if not os.path.exists(caminho):
+        return False
+    with open(caminho, encoding="utf-8") as arquivo:
+        cookies = json.load(arquivo)
+    browser.get(url_base + "/robots.txt")
+    for cookie in cookies:
+        # o campo sameSite inválido faz o geckodriver recusar o cookie
+        if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+            cookie.pop("sameSite", None)
+        browser.add_cookie(cookie)
+    return True
+
+
+def abrir_sessao(url_base=URL_BASE, headless=False, perfil=None, cookies=None, sem_login=False,
+                 enxuto=False):
+    """
+    Inicia o navegador já logado, pedindo login manual só quando necessário.
+
+    Args:
+        url_base (str): Endereço do site.
+        headless (bool): Roda o navegador sem janela.
+        perfil (str | None): Pasta de um perfil persistente; com ele o login manual só é
+            pedido na primeira execução.
+        cookies (str | None): Arquivo de cookies. Se existir, é carregado no lugar do login;
+            se não existir, é criado depois do login manual.
+        sem_login (bool): Não faz login (ex.: servidor local de testes).
+        enxuto (bool): Liga o modo enxuto (ver iniciar_navegador).
+
+    Returns:
+        WebDriver: Navegador pronto para buscar.
+    """
+    browser = iniciar_navegador(headless, perfil, enxuto)
+    try:
+        if sem_login:
+            return browser
+        if cookies and carregar_cookies(browser, cookies, url_base):
+            return browser
+        if perfil and os.path.exists(os.path.join(perfil, "cookies.sqlite")):
+            return browser
+        if headless:
+            raise RuntimeError("o login manual precisa da janela do navegador; "
+                               "rode uma vez sem headless para gravar os cookies ou o perfil")
+        fazer_login(browser, url_base)
+        if cookies:
+            salvar_cookies(browser, cookies)
+        return browser
+    except BaseException:
+        browser.quit()
+        raise
@@ -1,5 +1,9 @@
-from copy import deepcopy
-import webbrowser
+import argparse
+from collections import OrderedDict
+from functools import partial
+from itertools import zip_longest
+import os
+import threading
 
 import flet
 from flet import (
@@ -14,9 +18,13 @@ from flet import (
     Page,
     Text,
     Card,
+    Control,
     Divider,
+    ListView,
     PopupMenuButton,
     PopupMenuItem,
+    TextButton,
+    TextField,
 )
 from flet import colors, icons
 
@@ -27,15 +35,29 @@ class DesktopAppLayout(Row):
     This layout includes a navigation rail on the left and dynamic page content on the right.
     It adjusts based on screen orientation and can be resized.
 
+    Page contents may be given as controls or as factories (callables returning a
+    control). Pages are added to the control tree on first navigation, so startup
+    only builds and sends the first page. With ``max_cached_pages``, the least
+    recently visited pages are dropped from the tree; factory pages are rebuilt
+    when visited again.
+
     Attributes:
         page (Page): The main Flet page object where components are rendered.
-        pages (list): List of navigation items paired with corresponding page content.
+        pages (list): List of navigation items paired with corresponding page content or factory.
         navigation_items (list): Navigation items for the side menu.
         navigation_rail (NavigationRail): The navigation rail component on the left.
-        content_area (Column): Container for the main content pages.
+        content_area (Column): Container for the pages currently in the control tree.
+        max_cached_pages (int | None): Maximum number of pages kept in the control tree.
+            Evicted pages built by a factory are discarded; their ``close()`` method, if
+            any, is called.
         window_size (tuple): Tuple containing the width and height of the window.
+        resize_delay (float): Seconds without resize events before the layout is recomputed.
     """
 
+    # Minimum window width of each breakpoint, widest first. The navigation rail is
+    # extended (labels beside icons) only on "expanded" windows.
+    BREAKPOINTS = (("expanded", 1000), ("medium", 600), ("compact", 0))
+
     def __init__(
         self,
         title,
@@ -43,6 +65,8 @@ class DesktopAppLayout(Row):
         pages,
         *args,
         window_size=(800, 600),
+        max_cached_pages=None,
+        resize_delay=0.15,
         **kwargs,
     ):
         """Initializes the desktop layout with title, navigation, and page content.
@@ -50,14 +74,25 @@ class DesktopAppLayout(Row):
         Args:
             title (str): Title of the window.
             page (Page): Flet page where the layout is rendered.
-            pages (list): List of tuples with navigation items and page contents.
+            pages (list): List of tuples with navigation items and page contents. A page
+                content may also be a callable that builds the content on first navigation.
             window_size (tuple, optional): Initial size of the window. Defaults to (800, 600).
+            max_cached_pages (int, optional): Maximum number of built pages kept in the
+                control tree; least recently visited pages are evicted first. Defaults to
+                None (keep every visited page).
+            resize_delay (float, optional): Resize events are debounced: the layout is
+                recomputed once no event arrived for this many seconds. 0 applies every
+                event immediately. Defaults to 0.15.
         """
         super().__init__(*args, **kwargs)
 
         self.page = page
         self.pages = pages
+        self.max_cached_pages = max_cached_pages
+        self.resize_delay = resize_delay
         self.expand = True
+        self._resize_timer = None
+        self._resize_lock = threading.Lock()
 
         # Navigation rail setup
         self.navigation_items = [navigation_item for navigation_item, _ in pages]
@@ -75,13 +110,14 @@ class DesktopAppLayout(Row):
             tight=True,
         )
 
-        # Define main content area
-        page_contents = [page_content for _, page_content in pages]
-        self.content_area = Column(page_contents, expand=True)
+        # Define main content area; pages are added on first navigation
+        self._built_pages = OrderedDict()  # page index -> content control, least recent first
+        self._current_page = None  # index of the page currently shown
+        self.content_area = Column([], expand=True)
 
-        # Initialize screen orientation and panel visibility
-        self._was_portrait = self.is_portrait()
-        self._panel_visible = self.is_landscape()
+        # Initialize screen orientation, breakpoint and panel visibility
+        self._layout_state = None
+        self._apply_layout_state(self._current_layout_state())
 
         self.set_content()  # Set initial content visibility
 
@@ -106,9 +142,13 @@ class DesktopAppLayout(Row):
 
         Args:
             page_number (int): Index of the page to display.
+
+        Returns:
+            list: Controls that changed; pass them to ``page.update`` once the layout is on the page.
         """
         self.navigation_rail.selected_index = page_number
-        self._change_displayed_page()
+        changed = self._change_displayed_page()
+        return [self.navigation_rail, *changed] if changed else []
 
     def _navigation_change(self, e):
         """Handler for navigation change event.
@@ -116,14 +156,94 @@ class DesktopAppLayout(Row):
         Args:
             e (Event): The event triggered by changing navigation.
         """
-        self._change_displayed_page()
-        self.page.update()  # Update page layout
+        changed = self._change_displayed_page()
+        if changed:
+            self.page.update(*changed)  # Send only the controls that changed
 
     def _change_displayed_page(self):
-        """Updates the visibility of pages based on the selected navigation item."""
+        """Shows the selected page and hides the previously shown one.
+
+        Only the outgoing and incoming pages are touched, so switching costs the
+        same regardless of the number of pages.
+
+        Returns:
+            list: Controls that changed: the outgoing and incoming pages, or the
+            content area when a page was added to or evicted from the control tree.
+        """
         page_number = self.navigation_rail.selected_index
-        for i, content_page in enumerate(self.content_area.controls):
-            content_page.visible = page_number == i  # Show only the selected page
+        if page_number == self._current_page:
+            return []
+
+        changed = []
+        outgoing = self._built_pages.get(self._current_page)
+        if outgoing is not None:
+            outgoing.visible = False
+            changed.append(outgoing)
+
+        incoming, tree_changed = self._ensure_page(page_number)
+        incoming.visible = True
+        self._current_page = page_number
+
+        # New or evicted pages change the content area's children, so it is sent instead
+        return [self.content_area] if tree_changed else changed + [incoming]
+
+    def _build_page(self, page_number):
+        """Returns the content of a page, calling its factory if it has one.
+
+        Args:
+            page_number (int): Index of the page.
+
+        Returns:
+            Control: The page content.
+        """
+        _, content = self.pages[page_number]
+        if self._is_factory(content):
+            content = content()
+        return content
+
+    @staticmethod
+    def _is_factory(content):
+        """Tells whether a page content is a factory rather than a control."""
+        return callable(content) and not isinstance(content, Control)
+
+    def _ensure_page(self, page_number):
+        """Adds a page to the control tree if needed and marks it as most recently used.
+
+        Args:
+            page_number (int): Index of the page.
+
+        Returns:
+            tuple: The page content and whether the content area's children changed.
+        """
+        tree_changed = False
+        content_page = self._built_pages.get(page_number)
+        if content_page is None:
+            content_page = self._build_page(page_number)
+            self._built_pages[page_number] = content_page
+            self.content_area.controls.append(content_page)
+            tree_changed = True
+        self._built_pages.move_to_end(page_number)
+        return content_page, self._evict_pages() or tree_changed
+
+    def _evict_pages(self):
+        """Drops the least recently visited pages beyond ``max_cached_pages`` from the control tree.
+
+        Returns:
+            bool: Whether any page was evicted.
+        """
+        if self.max_cached_pages is None:
+            return False
+        evicted = False
+        # The most recent page (the one being shown) is never evicted
+        while len(self._built_pages) > max(self.max_cached_pages, 1):
+            page_number, content_page = self._built_pages.popitem(last=False)
+            self.content_area.controls.remove(content_page)
+            # Factory pages are rebuilt on the next visit, so the evicted instance is
+            # discarded and may release its resources; page controls are reused as is
+            if self._is_factory(self.pages[page_number][1]) and hasattr(content_page, "close"):
+                content_page.close()
+            evicted = True
+        return evicted
 
     def build_navigation_rail(self):
         """Constructs the navigation rail for the side menu.
@@ -145,10 +265,66 @@ class DesktopAppLayout(Row):
     def handle_resize(self, e):
         """Handles window resize events.
 
+        Dragging a window edge fires an event per step; they are debounced so the
+        layout is recomputed once the size settles for ``resize_delay`` seconds.
+
         Args:
             e (Event): The resize event triggered by changing window dimensions.
         """
-        pass  # Resize handling logic could be implemented here
+        if self.resize_delay <= 0:
+            self._apply_resize()
+            return
+        with self._resize_lock:
+            if self._resize_timer is not None:
+                self._resize_timer.cancel()
+            self._resize_timer = threading.Timer(self.resize_delay, self._apply_resize)
+            self._resize_timer.daemon = True
+            self._resize_timer.start()
+
+    def _apply_resize(self):
+        """Recomputes the layout for the current window size, updating only if it changed."""
+        with self._resize_lock:
+            self._resize_timer = None
+        if self._apply_layout_state(self._current_layout_state()):
+            self.page.update(self.menu_panel)
+
+    def breakpoint(self) -> str:
+        """Returns the name of the breakpoint for the current window width.
+
+        Returns:
+            str: One of the names in ``BREAKPOINTS``.
+        """
+        for name, min_width in self.BREAKPOINTS:
+            if self.page.width >= min_width:
+                return name
+        return self.BREAKPOINTS[-1][0]
+
+    def _current_layout_state(self):
+        """Returns the orientation and breakpoint that determine the layout."""
+        return self.is_portrait(), self.breakpoint()
+
+    def _apply_layout_state(self, state):
+        """Collapses or extends the menu panel for a layout state.
+
+        Args:
+            state (tuple): Orientation and breakpoint, as returned by ``_current_layout_state``.
+
+        Returns:
+            bool: Whether the panel changed (False when the state is unchanged).
+        """
+        if state == self._layout_state:
+            return False
+        portrait, breakpoint = state
+        self._layout_state = state
+        self._was_portrait = portrait
+        self._panel_visible = not portrait
+        self._menu_extended = breakpoint == "expanded"
+
+        panel_changed = (self.menu_panel.visible != self._panel_visible
+                         or self.navigation_rail.extended != self._menu_extended)
+        self.menu_panel.visible = self._panel_visible
+        self.navigation_rail.extended = self._menu_extended
+        return panel_changed
 
     def set_content(self):
         """Sets the content layout, managing visibility and navigation panel."""
@@ -206,6 +382,190 @@ class DesktopAppLayout(Row):
         return appbar
 
 
+class DataGridPage(Column):
+    """Page showing a tabular data source as a virtualized, filterable and sortable grid.
+
+    Only a window of ``page_size * window_pages`` rows exists as controls. Scrolling
+    to either end of the window shifts it by one page and refills the same controls
+    with the next or previous rows, so memory and render time depend on the window,
+    not on the number of rows in the source.
+
+    Filtering and sorting only recompute the view's index (an array of row ids,
+    see ``fontes_tabela.Fonte``); row values are read from the source when they
+    enter the window. The page owns its source and closes it in ``close()``.
+
+    Attributes:
+        source (Fonte): Data source, e.g. from ``fontes_tabela.abrir_fonte``.
+        page_size (int): Rows added or dropped when the window shifts.
+        window_pages (int): Pages of rows kept as controls.
+        row_height (int): Height of every row in pixels.
+        list_view (ListView): Scrollable list holding the row controls.
+    """
+
+    def __init__(
+        self,
+        title,
+        source,
+        *args,
+        page_size=50,
+        window_pages=3,
+        row_height=32,
+        column_width=160,
+        **kwargs,
+    ):
+        """Initializes the grid with the first window of rows.
+
+        Args:
+            title (str): Title shown above the grid.
+            source (Fonte): Data source with ``colunas``, ``ids``, ``linhas``,
+                ``filtrar`` and ``ordenar``.
+            page_size (int, optional): Rows per page. Defaults to 50.
+            window_pages (int, optional): Pages kept as controls; at least 2, so the
+                window can shift while rows stay visible. Defaults to 3.
+            row_height (int, optional): Row height in pixels. Defaults to 32.
+            column_width (int, optional): Width of every column in pixels. Defaults to 160.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.source = source
+        self.page_size = page_size
+        self.window_pages = max(window_pages, 2)
+        self.row_height = row_height
+        self.expand = True
+        self._ids = source.ids()  # row ids of the current view, filtered and sorted
+        self._start = 0  # position in the view of the first row in the window
+        self._sort_column = None
+        self._sort_descending = False
+        self._scroll_lock = threading.Lock()
+
+        self.filter_field = TextField(
+            hint_text="Filter (press Enter)",
+            prefix_icon=icons.SEARCH,
+            on_submit=self._filter_changed,
+            expand=True,
+        )
+        self.status = Text()
+        self.header_buttons = [
+            TextButton(column, width=column_width, on_click=partial(self._sort_clicked, column))
+            for column in source.colunas
+        ]
+        self._cells = []
+        rows = []
+        for _ in range(self.page_size * self.window_pages):
+            cells = [Text(width=column_width, no_wrap=True, overflow="ellipsis") for _ in source.colunas]
+            self._cells.append(cells)
+            rows.append(Row(cells, height=row_height, visible=False))
+        self.list_view = ListView(
+            rows,
+            item_extent=row_height,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+            expand=True,
+        )
+
+        self.controls = [
+            Card(content=Container(Text(title, weight="bold"), padding=8)),
+            Row([self.filter_field, self.status]),
+            Row(self.header_buttons),
+            Divider(height=1),
+            self.list_view,
+        ]
+        self._fill()
+
+    def _fill(self):
+        """Refills the row controls with the rows of the current window.
+
+        Once the page is shown, callers hold ``_scroll_lock``: CSV sources read
+        rows through one shared file handle.
+        """
+        window_ids = self._ids[self._start:self._start + len(self._cells)]
+        values = self.source.linhas(window_ids)
+        for row, cells, row_values in zip(self.list_view.controls, self._cells, values):
+            # Short rows (ragged CSV lines, blank lines) must not keep the previous window's text
+            for cell, value in zip_longest(cells, row_values[:len(cells)]):
+                cell.value = "" if value is None else str(value)
+            row.visible = True
+        for row in self.list_view.controls[len(values):]:
+            row.visible = False
+
+        if self._ids:
+            self.status.value = (f"Rows {self._start + 1}-{self._start + len(values)} "
+                                 f"of {len(self._ids)}")
+        else:
+            self.status.value = "No rows"
+
+    def _on_scroll(self, e):
+        """Shifts the window by one page when the list is scrolled to either end.
+
+        Args:
+            e (OnScrollEvent): The scroll event.
+        """
+        if not self._scroll_lock.acquire(blocking=False):
+            return  # a shift is in progress
+        try:
+            shift = self.page_size * self.row_height
+            end = self._start + len(self._cells)
+            if e.pixels >= e.max_scroll_extent - self.row_height and end < len(self._ids):
+                self._start += self.page_size
+                offset = e.pixels - shift
+            elif e.pixels <= e.min_scroll_extent and self._start > 0:
+                self._start = max(self._start - self.page_size, 0)
+                offset = e.pixels + shift
+            else:
+                return
+            self._fill()
+            self.update()
+            # Keep the same rows under the viewport after the window moved
+            self.list_view.scroll_to(offset=offset, duration=0)
+        finally:
+            self._scroll_lock.release()
+
+    def _show_view(self, ids):
+        """Replaces the view's index and shows it from the first row.
+
+        Args:
+            ids (array): Row ids of the new view.
+        """
+        # Waits for a window shift in progress instead of reading the source alongside it
+        with self._scroll_lock:
+            self._ids = ids
+            self._start = 0
+            self._fill()
+            self.update()
+            self.list_view.scroll_to(offset=0, duration=0)
+
+    def _filter_changed(self, e):
+        """Handler for the filter field: filters the source and reapplies the sort."""
+        ids = self.source.filtrar(self.filter_field.value or "")
+        if self._sort_column is not None:
+            ids = self.source.ordenar(ids, self._sort_column, self._sort_descending)
+        self._show_view(ids)
+
+    def _sort_clicked(self, column, e):
+        """Handler for a header button: sorts by the column, toggling the direction.
+
+        Args:
+            column (str): Column of the clicked header.
+            e (Event): The click event.
+        """
+        if column == self._sort_column:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_column, self._sort_descending = column, False
+        arrow = icons.ARROW_DOWNWARD if self._sort_descending else icons.ARROW_UPWARD
+        for button, name in zip(self.header_buttons, self.source.colunas):
+            button.icon = arrow if name == column else None
+        self._show_view(self.source.ordenar(self._ids, column, self._sort_descending))
+
+    def close(self):
+        """Closes the data source (open file, connection or temporary copy).
+
+        ``DesktopAppLayout`` calls it when it evicts a page built by a factory. Sources
+        left open are also closed when collected or when the program exits.
+        """
+        self.source.fechar()
+
+
 def create_page(title: str, body: str):
     """Creates a page with a title and body content.
 
@@ -231,12 +591,31 @@ def create_page(title: str, body: str):
     )
 
 
-def main(page: Page):
+def create_data_page(title: str, path: str, **kwargs):
+    """Creates a data grid page for a csv, xlsx or SQLite file.
+
+    Args:
+        title (str): Title of the page.
+        path (str): Path of the data file; the format is chosen by its extension.
+        **kwargs: Passed to ``DataGridPage``.
+
+    Returns:
+        DataGridPage: The grid page.
+    """
+    # imported here so the layout starts without loading the data-source backends
+    from fontes_tabela import abrir_fonte
+
+    return DataGridPage(title, abrir_fonte(path), **kwargs)
+
+
+def main(page: Page, data_path=None):
     """Main function to initialize and display the application layout.
 
     Args:
         page (Page): Flet Page instance where components are rendered.
+        data_path (str, optional): csv, xlsx or SQLite file shown in an extra data page.
     """
+    # Page factories: each page is built only when first shown
     pages = [
         (
             NavigationRailDestination(
@@ -244,7 +623,8 @@ def main(page: Page):
                 selected_icon=icons.LANDSCAPE,
                 label="Menu Item A",
             ),
-            create_page(
+            partial(
+                create_page,
                 "Example Page A",
                 "This is an example page. It is a simple desktop layout with a menu on the left.",
             ),
@@ -255,7 +635,8 @@ def main(page: Page):
                 selected_icon=icons.PORTRAIT,
                 label="Menu Item B",
             ),
-            create_page(
+            partial(
+                create_page,
                 "Example Page B",
                 "This is an example page. It is a simple desktop layout with a menu on the left.",
             ),
@@ -266,12 +647,24 @@ def main(page: Page):
                 selected_icon=icons.INSERT_EMOTICON,
                 label="Example Page C",
             ),
-            create_page(
+            partial(
+                create_page,
                 "Example Page C",
                 "This is an example page. It is a simple desktop layout with a menu on the left.",
             ),
         ),
     ]
+    if data_path:
+        pages.append(
+            (
+                NavigationRailDestination(
+                    icon=icons.TABLE_CHART_OUTLINED,
+                    selected_icon=icons.TABLE_CHART,
+                    label="Data",
+                ),
+                partial(create_data_page, os.path.basename(data_path), data_path),
+            )
+        )
 
     # Initialize and add desktop layout to the page
     menu_layout = DesktopAppLayout(
@@ -284,7 +677,16 @@ def main(page: Page):
     page.add(menu_layout)
 
 
-if __name__ == "__main__":
+def run():
+    """Parses the command line and starts the example application."""
+    parser = argparse.ArgumentParser(description="Basic desktop app layout.")
+    parser.add_argument("--data", metavar="FILE", help="csv, xlsx or SQLite file shown in a data page")
+    args = parser.parse_args()
+
     flet.app(
-        target=main,
+        target=partial(main, data_path=args.data),
     )
+
+
+if __name__ == "__main__":
+    run()
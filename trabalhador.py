@@ -0,0 +1,237 @@
+import argparse
+import os
+import secrets
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from selenium.common.exceptions import WebDriverException
+
+from busca import LIMITE_VAGAS, buscar_e_gravar
+from indice import IndiceVagas
+from saidas import FORMATOS, TAMANHO_LOTE
+from sessao import ARQUIVO_COOKIES, URL_BASE, abrir_sessao
+
+# endereço onde o trabalhador espera os pedidos de busca
+ENDERECO = ("127.0.0.1", 6070)
+# arquivo com a chave compartilhada entre o trabalhador e os clientes, criado na
+# primeira vez que o trabalhador sobe; a variável BUSCA_CHAVE, se definida, tem prioridade
+ARQUIVO_CHAVE = "trabalhador.chave"
+
+
+def carregar_chave(caminho=ARQUIVO_CHAVE, criar=False):
+    """
+    Chave de autenticação das conexões com o trabalhador.
+
+    A conexão troca objetos com pickle, então quem tem a chave pode executar código
+    no trabalhador: ela é aleatória e o arquivo só pode ser lido pelo dono.
+
+    Args:
+        caminho (str): Arquivo da chave.
+        criar (bool): Gera a chave (secrets.token_bytes) se o arquivo não existir.
+
+    Returns:
+        bytes: A chave.
+    """
+    if os.environ.get("BUSCA_CHAVE"):
+        return os.environ["BUSCA_CHAVE"].encode()
+    try:
+        with open(caminho, "rb") as arquivo:
+            if os.name == "posix" and os.fstat(arquivo.fileno()).st_mode & 0o077:
+                raise RuntimeError(f"{caminho} pode ser lido por outros usuários; use chmod 600 {caminho}")
+            return arquivo.read()
+    except FileNotFoundError:
+        if not criar:
+            raise RuntimeError(f"chave do trabalhador não encontrada em {caminho}; "
+                               "inicie o trabalhador nesta pasta ou defina BUSCA_CHAVE") from None
+    chave = secrets.token_bytes(32)
+    descritor = os.open(caminho, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(descritor, "wb") as arquivo:
+        arquivo.write(chave)
+    return chave
+
+
+class Trabalhador:
+    """
+    Mantém um navegador logado aberto e atende pedidos de busca, um de cada vez.
+
+    As buscas seguintes à primeira não pagam a partida do navegador nem o login.
+    """
+
+    def __init__(self, url_base=URL_BASE, headless=False, perfil=None, cookies=ARQUIVO_COOKIES,
+                 sem_login=False, indice=None, enxuto=False):
+        """
+        Args:
+            url_base (str): Endereço do site.
+            headless (bool): Roda o navegador sem janela.
+            perfil (str | None): Pasta de um perfil persistente do Firefox.
+            cookies (str | None): Arquivo de cookies do login.
+            sem_login (bool): Não faz login (ex.: servidor local de testes).
+            indice (IndiceVagas | None): Índice de vagas já vistas usado em todas as buscas.
+            enxuto (bool): Liga o modo enxuto do navegador (ver sessao.iniciar_navegador).
+        """
+        self.url_base = url_base
+        self._opcoes_sessao = (url_base, headless, perfil, cookies, sem_login, enxuto)
+        self.indice = indice
+        self.browser = None
+        self.detalhes = None
+
+    def _navegador(self):
+        if self.browser is None:
+            self.browser = abrir_sessao(*self._opcoes_sessao)
+        return self.browser
+
+    def _detalhes(self, ligado):
+        if not ligado:
+            return None
+        if self.detalhes is None:
+            from detalhes import ClienteDetalhes
+
+            self.detalhes = ClienteDetalhes.do_navegador(self._navegador())
+        return self.detalhes
+
+    def atender(self, pedido):
+        """
+        Executa um pedido de busca.
+
+        Args:
+            pedido (dict): "busca" e, opcionalmente, "limite", "formato", "lote_escrita",
+                "somente_novas" e "detalhes".
+
+        Returns:
+            dict: "arquivo" e "vagas" gravadas, ou "erro".
+        """
+        for tentativa in range(2):
+            try:
+                saida = buscar_e_gravar(
+                    self._navegador(),
+                    pedido["busca"],
+                    self.url_base,
+                    pedido.get("limite", LIMITE_VAGAS),
+                    pedido.get("formato", "xlsx"),
+                    pedido.get("lote_escrita", TAMANHO_LOTE),
+                    self.indice,
+                    pedido.get("somente_novas", False),
+                    self._detalhes(pedido.get("detalhes", False)),
+                )
+                return {"arquivo": os.path.abspath(saida.caminho), "vagas": saida.linhas_gravadas}
+            except WebDriverException as erro:
+                # o navegador pode ter sido fechado; abre outro e tenta de novo uma vez
+                self.fechar()
+                if tentativa:
+                    return {"erro": repr(erro)}
+            except Exception as erro:
+                return {"erro": repr(erro)}
+
+    def servir(self, endereco=ENDERECO, chave=None):
+        """
+        Atende pedidos até receber {"parar": True}.
+
+        Um cliente com a chave errada, que desconecta ou que manda um pedido
+        inválido só perde a própria conexão; o trabalhador e o navegador continuam.
+        """
+        chave = carregar_chave(criar=True) if chave is None else chave
+        self._navegador()
+        with Listener(endereco, authkey=chave) as ouvinte:
+            print(f"trabalhador pronto em {endereco[0]}:{endereco[1]}")
+            while True:
+                try:
+                    conexao = ouvinte.accept()
+                except (AuthenticationError, EOFError, OSError) as erro:
+                    print(f"conexão recusada: {erro!r}")
+                    continue
+                with conexao:
+                    if self._atender_conexao(conexao):
+                        break
+
+    def _atender_conexao(self, conexao):
+        # atende o pedido de uma conexão; True se o pedido foi para parar
+        try:
+            pedido = conexao.recv()
+        except Exception as erro:  # desconexão ou objeto que não pôde ser lido
+            print(f"pedido não recebido: {erro!r}")
+            return False
+        if not isinstance(pedido, dict):
+            resposta = {"erro": f"pedido inválido: {type(pedido).__name__}, esperado dict"}
+        elif pedido.get("parar"):
+            resposta = {"parado": True}
+        elif not isinstance(pedido.get("busca"), str):
+            resposta = {"erro": "pedido sem \"busca\""}
+        else:
+            print(f"buscando: {pedido['busca']}")
+            resposta = self.atender(pedido)
+        try:
+            conexao.send(resposta)
+        except (EOFError, OSError) as erro:
+            print(f"resposta não entregue: {erro!r}")
+        return resposta.get("parado", False)
+
+    def fechar(self):
+        if self.detalhes is not None:
+            self.detalhes.fechar()
+            self.detalhes = None
+        if self.browser is not None:
+            try:
+                self.browser.quit()
+            finally:
+                self.browser = None
+
+
+def enviar_pedido(pedido, endereco=ENDERECO, chave=None):
+    """Envia um pedido ao trabalhador e devolve a resposta (chave: a de carregar_chave)."""
+    chave = carregar_chave() if chave is None else chave
+    with Client(endereco, authkey=chave) as conexao:
+        conexao.send(pedido)
+        return conexao.recv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Navegador sempre aberto que atende pedidos de busca.")
+    parser.add_argument("--porta", type=int, default=ENDERECO[1])
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    servir = comandos.add_parser("servir", help="inicia o trabalhador")
+    servir.add_argument("--url-base", default=URL_BASE)
+    servir.add_argument("--headless", action="store_true")
+    servir.add_argument("--perfil")
+    servir.add_argument("--cookies", default=ARQUIVO_COOKIES)
+    servir.add_argument("--sem-login", action="store_true")
+    servir.add_argument("--enxuto", action="store_true")
+    servir.add_argument("--indice", help="arquivo do índice de vagas já vistas")
+
+    buscar = comandos.add_parser("buscar", help="envia uma ou mais buscas ao trabalhador")
+    buscar.add_argument("palavras", nargs="+")
+    buscar.add_argument("--limite", type=int, default=LIMITE_VAGAS)
+    buscar.add_argument("--formato", choices=FORMATOS, default="xlsx")
+    buscar.add_argument("--somente-novas", action="store_true")
+    buscar.add_argument("--detalhes", action="store_true")
+
+    comandos.add_parser("parar", help="encerra o trabalhador")
+    args = parser.parse_args()
+    endereco = (ENDERECO[0], args.porta)
+
+    if args.comando == "servir":
+        indice = IndiceVagas(args.indice) if args.indice else None
+        trabalhador = Trabalhador(args.url_base, args.headless, args.perfil, args.cookies,
+                                  args.sem_login, indice, args.enxuto)
+        try:
+            trabalhador.servir(endereco)
+        finally:
+            trabalhador.fechar()
+            if indice is not None:
+                indice.fechar()
+    elif args.comando == "buscar":
+        for search in args.palavras:
+            resposta = enviar_pedido({
+                "busca": search,
+                "limite": args.limite,
+                "formato": args.formato,
+                "somente_novas": args.somente_novas,
+                "detalhes": args.detalhes,
+            }, endereco)
+            print(f"[{search}] {resposta}")
+    else:
+        print(enviar_pedido({"parar": True}, endereco))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import time
+
+from agendador import ms_ate_proximo_segundo
+
+# quadros por segundo pedidos por padrão e o mínimo ao qual a taxa pode cair
+FPS_PADRAO = 30
+FPS_MINIMO = 2
+# fração do intervalo entre quadros que o desenho (mais o atraso do timer) pode ocupar
+ORCAMENTO = 0.5
+# peso de cada quadro na média móvel do custo
+PESO_MEDIA = 0.2
+
+
+class Varredura:
+    """
+    Ritmo de quadros de um ponteiro de segundos contínuo (varredura suave).
+
+    Independe da biblioteca gráfica: recebe a função que agenda (after do Tk,
+    ontimer do turtle) e a função que desenha os ponteiros num instante. Os quadros
+    caem numa grade fixa do relógio de parede, então não acumulam atraso.
+
+    A cada quadro mede o custo: o tempo do desenho mais o atraso com que o timer
+    disparou (sinal de que o event loop está ocupado). Se a média passa do
+    orçamento, a taxa cai pela metade, até FPS_MINIMO; com folga por um segundo,
+    volta a dobrar até o `fps` pedido. Com a janela oculta não desenha nada e
+    só confere, uma vez por segundo, se ela voltou.
+    """
+
+    def __init__(self, agendar, desenhar, fps=FPS_PADRAO, visivel=None, cancelar=None, fps_minimo=FPS_MINIMO,
+                 registro=None):
+        """
+        Args:
+            agendar (callable): agendar(ms, funcao); pode devolver um id para `cancelar`.
+            desenhar (callable): desenhar(instante) posiciona os ponteiros para time.time() == instante.
+            fps (int): Quadros por segundo desejados (ex.: 30 ou 60).
+            visivel (callable | None): Diz se a janela está visível. Padrão: sempre.
+            cancelar (callable | None): Cancela um agendamento pelo id (ex.: after_cancel).
+            fps_minimo (int): Menor taxa usada quando o orçamento é estourado.
+            registro (RegistroTiques | None): Registra o atraso e a duração de cada quadro.
+        """
+        self.agendar = agendar
+        self.desenhar = desenhar
+        self.fps = fps
+        self.fps_minimo = min(fps_minimo, fps)
+        self.fps_atual = fps
+        self.visivel = visivel or (lambda: True)
+        self.cancelar = cancelar
+        self.registro = registro
+        self.custo_medio = 0.0
+        self.quadros = 0
+        self.ativa = False
+        self._previsto = None
+        self._folga = 0
+        self._id = None
+
+    def iniciar(self):
+        self.ativa = True
+        self._quadro()
+        return self
+
+    def parar(self):
+        self.ativa = False
+        if self._id is not None and self.cancelar is not None:
+            self.cancelar(self._id)
+        self._id = None
+
+    def _agendar(self, atraso_ms):
+        self._previsto = time.perf_counter() + atraso_ms / 1000
+        self._id = self.agendar(max(1, atraso_ms), self._quadro)
+
+    def _quadro(self):
+        if not self.ativa:
+            return
+        inicio = time.perf_counter()
+        atraso = max(0.0, inicio - self._previsto) if self._previsto is not None else 0.0
+
+        # o primeiro quadro é sempre desenhado, mesmo antes de a janela aparecer
+        if self.quadros and not self.visivel():
+            self._agendar(ms_ate_proximo_segundo())
+            return
+
+        self.desenhar(time.time())
+        self.quadros += 1
+        duracao = time.perf_counter() - inicio
+        if self.registro is not None and self._previsto is not None:
+            self.registro.registrar(self._previsto, inicio, duracao)
+        custo = duracao + atraso
+        self.custo_medio += PESO_MEDIA * (custo - self.custo_medio)
+        self._ajustar_taxa()
+
+        periodo = 1 / self.fps_atual
+        self._agendar(int((periodo - time.time() % periodo) * 1000) + 1)
+
+    def _ajustar_taxa(self):
+        orcamento = ORCAMENTO / self.fps_atual
+        if self.custo_medio > orcamento and self.fps_atual > self.fps_minimo:
+            self.fps_atual = max(self.fps_minimo, self.fps_atual // 2)
+            self._folga = 0
+        elif self.custo_medio < orcamento / 4 and self.fps_atual < self.fps:
+            # só sobe depois de um segundo inteiro com folga, para não oscilar
+            self._folga += 1
+            if self._folga >= self.fps_atual:
+                self.fps_atual = min(self.fps, self.fps_atual * 2)
+                self._folga = 0
+        else:
+            self._folga = 0